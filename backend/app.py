@@ -1,31 +1,60 @@
 import asyncio
 import hashlib
 import ipaddress
-import json
 import logging
 import os
+import re
 import socket
 import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager, nullcontext, suppress
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from itertools import chain, zip_longest
 from typing import Any
 
 import aiohttp
-from bs4 import BeautifulSoup
 from fastapi import FastAPI, Header, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_fixed
 
+from .device_inventory import (
+    DeviceRecord,
+    ParsedReport,
+    intern_settings,
+    report_fingerprint,
+)
+from .device_rate_limit import DeviceRateLimiter
 from .fleet_journal import (
-    current_name_matches_fleet_id,
     find_fleet_id,
     journal_sha256,
+    load_fleet_journal,
     name_matches_fleet_id,
     required_name,
 )
+from .host_health import HostHealth
 from .naming import build_rename_settings, validate_new_name
-from .run_receipts import ProfileRunReceiptStore, ReceiptSafetyError, receipt_sha256
-from .settings_merge import get_bulk_update_settings
+from .report_parsing import parse_settings_report
+from .retry_budget import retry_budget_scope, retry_read, scan_retry_budget
+from .run_receipts import (
+    ProfileRunReceiptStore,
+    ReceiptSafetyError,
+    canonical_json,
+    receipt_sha256,
+)
+from .settings_merge import TARGET_LOCAL_KEYS, get_bulk_update_settings
+from .settings_tree import (
+    SettingsTree,
+    build_settings_tree,
+    bulk_update_settings_tree,
+    differing_sections,
+    settings_fingerprint,
+)
+from .single_flight import SingleFlight, SingleFlightConflict
 
 logging.basicConfig(
     level=os.getenv("LOG_LEVEL", "INFO").upper(),
@@ -37,8 +66,28 @@ DEFAULT_ALLOWED_SUBNET = "127.0.0.1/32"
 DEFAULT_ALLOWED_ORIGINS = "http://localhost:3000,http://127.0.0.1:3000"
 OPERATOR_INTENT_HEADER = "X-Magewell-Operator-Intent"
 OPERATOR_INTENT_VALUE = "confirmed"
-RENAME_READBACK_ATTEMPTS = 6
-RENAME_READBACK_INTERVAL_SECONDS = 2
+# Read-only settle polling after an accepted mutation: most devices reflect a
+# change within a few hundred milliseconds, so the first re-read comes quickly
+# and later ones back off. Total sleep stays within the ten-second window.
+SETTLE_POLL_ATTEMPTS = 6
+SETTLE_POLL_WINDOW_SECONDS = 10.0
+SETTLE_POLL_FIRST_INTERVAL_SECONDS = 0.25
+SETTLE_POLL_BACKOFF_FACTOR = 3.0
+SETTLE_POLL_MAX_INTERVAL_SECONDS = 4.0
+RENAME_PREVALIDATION_CONCURRENCY = 16
+# A target prepared during the previous target's settle window is re-confirmed
+# right before its set-name once its re-check is older than this.
+RENAME_PREPARED_MAX_AGE_SECONDS = 2.0
+MAX_SCAN_DEADLINE_SECONDS = 3600
+# Report parsing is pure CPU; more workers than cores only adds process overhead.
+MAX_REPORT_PARSE_WORKERS = 32
+# Finished push-and-verify jobs kept for polling; running jobs are never dropped.
+PUSH_VERIFY_JOB_HISTORY = 16
+# One character per profile section keeps a 500-device drift matrix compact.
+DRIFT_CELL_MATCH = "="
+DRIFT_CELL_DRIFT = "~"
+DRIFT_CELL_MISSING = "-"
+DRIFT_CELL_UNREADABLE = "?"
 
 
 class DeviceSelection(BaseModel):
@@ -93,15 +142,31 @@ def env_flag(name: str, default: bool = False) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
-def get_allowed_network() -> ipaddress.IPv4Network:
+def get_allowed_networks() -> tuple[ipaddress.IPv4Network, ...]:
+    """Return the comma-separated IPv4 CIDRs that bound every scan and device target."""
     raw_value = os.getenv("ALLOWED_SUBNET", DEFAULT_ALLOWED_SUBNET)
-    try:
-        network = ipaddress.ip_network(raw_value, strict=False)
-    except ValueError as exc:
-        raise RuntimeError(f"ALLOWED_SUBNET is invalid: {raw_value}") from exc
-    if network.version != 4:
-        raise RuntimeError("ALLOWED_SUBNET must be an IPv4 network")
-    return network
+    networks = []
+    for raw_network in raw_value.split(","):
+        if not raw_network.strip():
+            continue
+        try:
+            network = ipaddress.ip_network(raw_network.strip(), strict=False)
+        except ValueError as exc:
+            raise RuntimeError(f"ALLOWED_SUBNET is invalid: {raw_network.strip()}") from exc
+        if network.version != 4:
+            raise RuntimeError("ALLOWED_SUBNET must contain only IPv4 networks")
+        networks.append(network)
+    if not networks:
+        raise RuntimeError("ALLOWED_SUBNET must name at least one IPv4 network")
+    return tuple(networks)
+
+
+def allowed_scope_label() -> str:
+    return ", ".join(str(network) for network in get_allowed_networks())
+
+
+def allowed_network_for(address: ipaddress.IPv4Address) -> ipaddress.IPv4Network | None:
+    return next((network for network in get_allowed_networks() if address in network), None)
 
 
 def get_allowed_origins() -> list[str]:
@@ -124,9 +189,14 @@ def safe_device_error(exc: BaseException) -> str:
     return str(exc)
 
 
-def settings_fingerprint(settings: dict[str, Any]) -> str:
-    canonical = json.dumps(settings, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+def frozen_control_settings_tree(control_settings: dict[str, Any]) -> SettingsTree:
+    """Return subtree digests for the frozen source, rebuilt if the freeze changed."""
+    fingerprint = getattr(app.state, "control_settings_sha256", None)
+    cached = getattr(app.state, "control_settings_tree", None)
+    if cached is None or cached[0] != fingerprint:
+        cached = (fingerprint, build_settings_tree(control_settings))
+        app.state.control_settings_tree = cached
+    return cached[1]
 
 
 def get_max_scan_hosts() -> int:
@@ -139,6 +209,18 @@ def get_max_scan_hosts() -> int:
     return value
 
 
+def get_scan_deadline_seconds() -> float:
+    try:
+        value = float(os.getenv("SCAN_DEADLINE_SECONDS", "300"))
+    except ValueError as exc:
+        raise RuntimeError("SCAN_DEADLINE_SECONDS must be a number") from exc
+    if value <= 0 or value > MAX_SCAN_DEADLINE_SECONDS:
+        raise RuntimeError(
+            f"SCAN_DEADLINE_SECONDS must be greater than 0 and at most {MAX_SCAN_DEADLINE_SECONDS}"
+        )
+    return value
+
+
 def get_max_update_devices() -> int:
     try:
         value = int(os.getenv("MAX_UPDATE_DEVICES", "100"))
@@ -149,6 +231,26 @@ def get_max_update_devices() -> int:
     return value
 
 
+def get_report_parse_workers() -> int:
+    try:
+        value = int(os.getenv("REPORT_PARSE_WORKERS", "0"))
+    except ValueError as exc:
+        raise RuntimeError("REPORT_PARSE_WORKERS must be an integer") from exc
+    if value < 0 or value > MAX_REPORT_PARSE_WORKERS:
+        raise RuntimeError(f"REPORT_PARSE_WORKERS must be between 0 and {MAX_REPORT_PARSE_WORKERS}")
+    return value
+
+
+def get_push_concurrency() -> int:
+    try:
+        value = int(os.getenv("PUSH_CONCURRENCY", "8"))
+    except ValueError as exc:
+        raise RuntimeError("PUSH_CONCURRENCY must be an integer") from exc
+    if value < 1 or value > 64:
+        raise RuntimeError("PUSH_CONCURRENCY must be between 1 and 64")
+    return value
+
+
 def get_device_credentials() -> tuple[str, str]:
     username = os.getenv("MAGEWELL_USERNAME", "").strip()
     password = os.getenv("MAGEWELL_PASSWORD", "")
@@ -178,18 +280,23 @@ def get_credential_rotation_credentials() -> tuple[str, str, str]:
     return username, old_password, new_password
 
 
+def scan_host_count(network: ipaddress.IPv4Network) -> int:
+    return max(network.num_addresses - (0 if network.prefixlen >= 31 else 2), 0)
+
+
 def validate_scan_network(subnet: str) -> ipaddress.IPv4Network:
     try:
         network = ipaddress.ip_network(subnet, strict=False)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=f"Invalid subnet: {subnet}") from exc
-    allowed_network = get_allowed_network()
-    if network.version != 4 or not network.subnet_of(allowed_network):
+    if network.version != 4 or not any(
+        network.subnet_of(allowed_network) for allowed_network in get_allowed_networks()
+    ):
         raise HTTPException(
             status_code=400,
-            detail=f"Subnet must be within ALLOWED_SUBNET ({allowed_network}).",
+            detail=f"Subnet must be within ALLOWED_SUBNET ({allowed_scope_label()}).",
         )
-    host_count = max(network.num_addresses - (0 if network.prefixlen >= 31 else 2), 0)
+    host_count = scan_host_count(network)
     if host_count > get_max_scan_hosts():
         raise HTTPException(
             status_code=400,
@@ -198,16 +305,47 @@ def validate_scan_network(subnet: str) -> ipaddress.IPv4Network:
     return network
 
 
+def validate_scan_networks(subnets: str) -> list[ipaddress.IPv4Network]:
+    """Validate a comma-separated set of in-scope scan networks, one per site or VLAN."""
+    networks = [validate_scan_network(subnet) for subnet in re.split(r"[\s,]+", subnets) if subnet]
+    if not networks:
+        raise HTTPException(status_code=400, detail="At least one subnet is required.")
+    for index, network in enumerate(networks):
+        overlapping = next((other for other in networks[:index] if other.overlaps(network)), None)
+        if overlapping is not None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Requested subnets overlap: {overlapping} and {network}.",
+            )
+    host_count = sum(scan_host_count(network) for network in networks)
+    if host_count > get_max_scan_hosts():
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Subnets contain {host_count} hosts; MAX_SCAN_HOSTS is {get_max_scan_hosts()}."
+            ),
+        )
+    return networks
+
+
+def interleave_site_hosts(networks: list[ipaddress.IPv4Network]) -> list[str]:
+    """Round-robin host addresses across sites so no VLAN waits for another to finish."""
+    return [
+        str(address)
+        for address in chain.from_iterable(zip_longest(*(network.hosts() for network in networks)))
+        if address is not None
+    ]
+
+
 def validate_device_ip(raw_ip: str) -> str:
     try:
         address = ipaddress.ip_address(raw_ip)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=f"Invalid device IP: {raw_ip}") from exc
-    allowed_network = get_allowed_network()
-    if address.version != 4 or address not in allowed_network:
+    if address.version != 4 or allowed_network_for(address) is None:
         raise HTTPException(
             status_code=400,
-            detail=f"Device IP {raw_ip} is outside ALLOWED_SUBNET ({allowed_network}).",
+            detail=f"Device IP {raw_ip} is outside ALLOWED_SUBNET ({allowed_scope_label()}).",
         )
     return str(address)
 
@@ -219,12 +357,12 @@ def validate_known_discovery_ips(ips: list[str]) -> list[str]:
             status_code=400,
             detail=(f"At most {get_max_scan_hosts()} explicit addresses may be scanned at once."),
         )
-    allowed_network = get_allowed_network()
     normalized_ips = []
     seen: set[str] = set()
     for raw_ip in ips:
         normalized_ip = validate_device_ip(raw_ip)
         address = ipaddress.ip_address(normalized_ip)
+        allowed_network = allowed_network_for(address)
         if allowed_network.prefixlen <= 30 and address in {
             allowed_network.network_address,
             allowed_network.broadcast_address,
@@ -254,65 +392,44 @@ def ensure_unique_devices(devices: list[DeviceSelection]) -> None:
         )
 
 
-def profile_plan_identity(device: dict[str, Any]) -> dict[str, Any]:
+def profile_plan_identity(record: DeviceRecord) -> dict[str, Any]:
     """Return the redacted identity binding required for a cached profile plan."""
-    identity = device.get("identity")
-    if device.get("identity_error") or not isinstance(identity, dict):
+    if record.identity_error or record.identity_key is None:
         raise HTTPException(
             status_code=409,
-            detail=f"Latest-scan identity is unavailable for {device.get('ip', 'the device')}.",
+            detail=f"Latest-scan identity is unavailable for {record.ip or 'the device'}.",
         )
-    serial = identity.get("serial")
-    eth_mac = identity.get("eth_mac")
+    serial, eth_mac, fleet_id = record.identity_key
     if not serial or not eth_mac:
         raise HTTPException(
             status_code=409,
-            detail=f"Latest-scan identity is incomplete for {device.get('ip', 'the device')}.",
+            detail=f"Latest-scan identity is incomplete for {record.ip or 'the device'}.",
         )
     return {
-        "ip": device["ip"],
-        "magewell_id": device.get("name", ""),
+        "ip": record.ip,
+        "magewell_id": record.name,
         "serial": serial,
         "eth_mac": eth_mac,
-        "fleet_id": identity.get("fleet_id"),
+        "fleet_id": fleet_id,
     }
 
 
-def profile_run_receipt_identity(device: dict[str, Any]) -> dict[str, Any]:
+def profile_run_receipt_identity(record: DeviceRecord) -> dict[str, Any]:
     """Return the receipt's redacted identity fields without changing write eligibility."""
-    identity = device.get("identity") if isinstance(device.get("identity"), dict) else {}
+    serial, eth_mac, fleet_id = record.identity_key or (None, None, None)
     return {
-        "ip": device.get("ip", ""),
-        "magewell_id": device.get("name", ""),
-        "serial": identity.get("serial"),
-        "eth_mac": identity.get("eth_mac"),
-        "fleet_id": identity.get("fleet_id"),
+        "ip": record.ip,
+        "magewell_id": record.name,
+        "serial": serial,
+        "eth_mac": eth_mac,
+        "fleet_id": fleet_id,
     }
 
 
-def profile_plan_inventory_fingerprint(cached_devices: list[dict[str, Any]]) -> str:
+def profile_plan_inventory_fingerprint(cached_devices: list[DeviceRecord]) -> str:
     """Fingerprint accepted scan identities without exposing device settings."""
-    inventory = []
-    for device in sorted(cached_devices, key=lambda item: item.get("ip", "")):
-        identity = device.get("identity")
-        inventory.append(
-            {
-                "ip": device.get("ip", ""),
-                "magewell_id": device.get("name", ""),
-                "identity": (
-                    {
-                        "serial": identity.get("serial"),
-                        "eth_mac": identity.get("eth_mac"),
-                        "fleet_id": identity.get("fleet_id"),
-                    }
-                    if isinstance(identity, dict)
-                    else None
-                ),
-                "identity_error": bool(device.get("identity_error")),
-                "read_error": bool(device.get("read_error")),
-            }
-        )
-    return settings_fingerprint({"inventory": inventory})
+    records = sorted(cached_devices, key=lambda record: record.ip)
+    return settings_fingerprint({"inventory": [record.inventory_entry for record in records]})
 
 
 def profile_run_receipt_for_push(
@@ -322,7 +439,7 @@ def profile_run_receipt_for_push(
     source_identity: dict[str, Any],
     inventory_sha256: str,
     target_payloads: list[tuple[DeviceSelection, dict[str, Any], str]],
-    cached_devices: dict[str, dict[str, Any]],
+    cached_devices: dict[str, DeviceRecord],
 ) -> dict[str, Any]:
     """Build the only redacted shape allowed in durable profile-run storage."""
     targets = []
@@ -331,7 +448,7 @@ def profile_run_receipt_for_push(
         targets.append(
             {
                 **profile_run_receipt_identity(cached_device),
-                "current_settings_sha256": settings_fingerprint(cached_device["settings"]),
+                "current_settings_sha256": cached_device.settings_sha256,
                 "expected_settings_sha256": expected_settings_sha256,
                 "profile_compatible": True,
                 # A pre-effect journal cannot know whether the import was accepted.
@@ -431,7 +548,37 @@ def md5_hash(password: str) -> str:
     return hashlib.md5(password.encode("utf-8"), usedforsecurity=False).hexdigest()
 
 
-app = FastAPI(title="Magewell AIO Control", version="1.0.0")
+def recover_profile_run_receipts() -> dict[str, Any] | None:
+    """Rebuild receipt summaries from the append-only journal before serving requests."""
+    try:
+        store = get_profile_run_receipt_store()
+        if not store.journal_dir.exists():
+            return None
+        report = store.rebuild_current()
+    except (ReceiptSafetyError, OSError) as exc:
+        logger.error("Profile-run receipt recovery failed: %s", exc)
+        return None
+    if report["divergences"]:
+        logger.warning(
+            "Profile-run receipt recovery found %d divergences and rewrote %d summaries",
+            len(report["divergences"]),
+            len(report["rewritten_receipt_ids"]),
+        )
+    return report
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    recover_profile_run_receipts()
+    yield
+    pool = getattr(app.state, "report_parser_pool", None)
+    if pool is not None:
+        # Worker processes are reaped in the background; shutdown must not block the loop.
+        pool.shutdown(wait=False, cancel_futures=True)
+        app.state.report_parser_pool = None
+
+
+app = FastAPI(title="Magewell AIO Control", version="1.0.0", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=get_allowed_origins(),
@@ -449,53 +596,86 @@ def get_mutation_lock() -> asyncio.Lock:
     return lock
 
 
-def public_device_list(devices: list[dict[str, Any]]) -> list[dict[str, str]]:
-    public_devices = []
-    for device in devices:
-        public_device = {"ip": device["ip"], "name": device.get("name", "")}
-        if device.get("read_error"):
-            public_device["read_error"] = device["read_error"]
-        if device.get("identity"):
-            identity = device["identity"]
-            public_device["serial"] = identity["serial"]
-            public_device["eth_mac"] = identity["eth_mac"]
-            public_device["fleet_id"] = identity.get("fleet_id", "")
-            if identity.get("fleet_id"):
-                public_device["name_journal_mismatch"] = not current_name_matches_fleet_id(
-                    device.get("name", ""), identity["fleet_id"]
-                )
-        if device.get("identity_error"):
-            public_device["identity_error"] = device["identity_error"]
-        public_devices.append(public_device)
-    return public_devices
+def get_single_flight() -> SingleFlight:
+    flights = getattr(app.state, "single_flight", None)
+    if flights is None:
+        flights = SingleFlight()
+        app.state.single_flight = flights
+    return flights
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_fixed(1),
-    retry=retry_if_exception_type(aiohttp.ClientError),
-    reraise=True,
-)
-async def login_device(
+def get_report_parser_pool() -> ProcessPoolExecutor | None:
+    workers = get_report_parse_workers()
+    pool = getattr(app.state, "report_parser_pool", None)
+    if pool is None and workers:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        app.state.report_parser_pool = pool
+    return pool
+
+
+def discard_report_parser_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken parser pool so the next report starts a fresh one."""
+    if getattr(app.state, "report_parser_pool", None) is pool:
+        app.state.report_parser_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def get_device_rate_limiter() -> DeviceRateLimiter:
+    limiter = getattr(app.state, "device_rate_limiter", None)
+    if limiter is None:
+        limiter = DeviceRateLimiter()
+        app.state.device_rate_limiter = limiter
+    return limiter
+
+
+def public_device_list(devices: list[DeviceRecord]) -> list[dict[str, Any]]:
+    return [dict(device.public_view) for device in devices]
+
+
+async def submit_login(
     session: aiohttp.ClientSession,
     magewell_ip: str,
     username: str,
     hashed_password: str,
-    magewell_id: str,
-) -> str:
+    timeout: float | None = None,
+) -> str | None:
+    """Send one login call and return its session cookie, or ``None`` if it was rejected.
+
+    Transport failures and unexpected statuses raise; ``timeout`` overrides the
+    session's own timeout for this call only.
+    """
     login_url = f"http://{magewell_ip}/usapi?method=login&id={username}&pass={hashed_password}"
-    async with session.get(login_url) as response:
+    request_options = {} if timeout is None else {"timeout": timeout}
+    await get_device_rate_limiter().acquire(magewell_ip, "login")
+    async with session.get(login_url, **request_options) as response:
+        if response.status in (401, 403):
+            return None
         response.raise_for_status()
         data = await response.json()
         if data.get("result") not in (0, "0"):
-            raise RuntimeError(f"Device login was rejected with result {data.get('result')!r}")
+            logger.info("Device %s rejected login with result %r", magewell_ip, data.get("result"))
+            return None
         cookie_header = "; ".join(
             f"{name}={cookie.value}" for name, cookie in response.cookies.items()
         )
-        if not cookie_header:
-            raise RuntimeError("Device login returned no session cookie")
-        logger.info("Login succeeded for device %s", magewell_id)
-        return cookie_header
+    if not cookie_header:
+        raise RuntimeError("Device login returned no session cookie")
+    return cookie_header
+
+
+@retry_read
+async def login_device(
+    session: aiohttp.ClientSession,
+    magewell_ip: str,
+    username: str,
+    hashed_password: str,
+    magewell_id: str,
+) -> str:
+    cookie_header = await submit_login(session, magewell_ip, username, hashed_password)
+    if cookie_header is None:
+        raise RuntimeError("Device login was rejected")
+    logger.info("Login succeeded for device %s", magewell_id)
+    return cookie_header
 
 
 async def get_users_call(
@@ -504,6 +684,7 @@ async def get_users_call(
     cookie_header: str,
 ) -> list[dict[str, Any]]:
     url = f"http://{magewell_ip}/usapi"
+    await get_device_rate_limiter().acquire(magewell_ip, "read")
     async with session.get(
         url,
         params={"method": "get-users"},
@@ -528,6 +709,7 @@ async def set_password_call(
 ) -> None:
     """Submit exactly one credential mutation; this call is intentionally not retried."""
     url = f"http://{magewell_ip}/usapi"
+    await get_device_rate_limiter().acquire(magewell_ip, "mutation")
     async with session.get(
         url,
         params={
@@ -552,6 +734,7 @@ async def import_settings_call(
 ) -> dict[str, Any]:
     """Submit exactly one device mutation; this call is intentionally not retried."""
     import_url = f"http://{magewell_ip}/usapi?method=import-settings"
+    await get_device_rate_limiter().acquire(magewell_ip, "mutation")
     async with session.post(
         import_url,
         json=modified_settings,
@@ -575,6 +758,7 @@ async def set_name_call(
     """Submit exactly one display-name mutation; this call is intentionally not retried."""
     validated_name = validate_new_name(new_name)
     url = f"http://{magewell_ip}/usapi"
+    await get_device_rate_limiter().acquire(magewell_ip, "mutation")
     async with session.get(
         url,
         params={"method": "set-name", "name": validated_name},
@@ -588,6 +772,28 @@ async def set_name_call(
     return result
 
 
+def settle_poll_delays() -> list[float]:
+    """Return the sleeps between settle reads: capped backoff clipped to the window."""
+    delays: list[float] = []
+    remaining = SETTLE_POLL_WINDOW_SECONDS
+    interval = SETTLE_POLL_FIRST_INTERVAL_SECONDS
+    for _ in range(SETTLE_POLL_ATTEMPTS - 1):
+        delay = min(interval, SETTLE_POLL_MAX_INTERVAL_SECONDS, remaining)
+        delays.append(delay)
+        remaining -= delay
+        interval *= SETTLE_POLL_BACKOFF_FACTOR
+    return delays
+
+
+async def settle_poll_attempts() -> AsyncIterator[int]:
+    """Yield read attempt numbers, sleeping between them; callers break once settled."""
+    delays = settle_poll_delays()
+    for attempt in range(1, SETTLE_POLL_ATTEMPTS + 1):
+        yield attempt
+        if attempt < SETTLE_POLL_ATTEMPTS:
+            await asyncio.sleep(delays[attempt - 1])
+
+
 async def read_rename_stage_until_settled(
     session: aiohttp.ClientSession,
     magewell_ip: str,
@@ -603,19 +809,17 @@ async def read_rename_stage_until_settled(
     the new settings.  These are bounded, read-only checks: the preceding ``set-name``
     or ``import-settings`` request is never repeated.
     """
-    for attempt in range(1, RENAME_READBACK_ATTEMPTS + 1):
+    async for attempt in settle_poll_attempts():
         report = await get_device_report_with_login(
             session, magewell_ip, username, password, timeout=10.0
         )
         if (
             report.get("name") == expected_name
-            and settings_fingerprint(report) == expected_settings_sha256
+            and report_fingerprint(report) == expected_settings_sha256
         ):
             return report, attempt
-        if attempt < RENAME_READBACK_ATTEMPTS:
-            await asyncio.sleep(RENAME_READBACK_INTERVAL_SECONDS)
     raise RuntimeError(
-        f"{mismatch_message} after {RENAME_READBACK_ATTEMPTS} read-only checks over "
+        f"{mismatch_message} after {SETTLE_POLL_ATTEMPTS} read-only checks over "
         "a ten-second settle window."
     )
 
@@ -634,12 +838,27 @@ async def get_device_report_with_login(
         md5_hash(password),
         magewell_ip,
     )
+    return await get_device_report(session, magewell_ip, cookie_header, timeout)
+
+
+async def get_device_report(
+    session: aiohttp.ClientSession,
+    magewell_ip: str,
+    cookie_header: str,
+    timeout: float = 2.0,
+) -> dict[str, Any]:
+    """Read the report page with an existing login cookie and return its SETTINGS.
+
+    Parsing and fingerprinting run in the report-parsing worker pool when
+    ``REPORT_PARSE_WORKERS`` enables one, keeping large sweeps off the event loop.
+    """
     url = f"http://{magewell_ip}/usapi?method=get-report"
     headers = {
         "Accept": "text/html",
         "User-Agent": "magewell-aio-control/1.0",
         "Cookie": cookie_header,
     }
+    await get_device_rate_limiter().acquire(magewell_ip, "read")
     async with session.get(
         url,
         timeout=timeout,
@@ -647,34 +866,30 @@ async def get_device_report_with_login(
         allow_redirects=False,
     ) as response:
         response.raise_for_status()
-        soup = BeautifulSoup(await response.text(), "html.parser")
-    report_content = soup.find("div", class_="report-content")
-    if not report_content:
-        raise RuntimeError("Report contains no report-content section")
-    for div in report_content.find_all("div", class_="content-level1"):
-        heading = div.find("h2")
-        if heading and heading.get_text(strip=True).upper() == "SETTINGS":
-            pre = div.find("pre", class_="json")
-            if not pre:
-                break
-            settings_data = json.loads(pre.get_text(strip=True))
-            if not isinstance(settings_data, dict):
-                raise RuntimeError("SETTINGS report is not a JSON object")
-            return settings_data
-    raise RuntimeError("Report contains no SETTINGS section")
+        raw = await response.read()
+        encoding = response.get_encoding()
+    pool = get_report_parser_pool()
+    if pool is None:
+        parsed = parse_settings_report(raw, encoding)
+    else:
+        try:
+            parsed = await asyncio.get_running_loop().run_in_executor(
+                pool, parse_settings_report, raw, encoding
+            )
+        except BrokenProcessPool:
+            # A killed worker breaks the whole pool; replace it and parse this report inline.
+            discard_report_parser_pool(pool)
+            parsed = parse_settings_report(raw, encoding)
+    return ParsedReport(*parsed)
 
 
-async def get_device_identity_with_login(
+async def get_info_call(
     session: aiohttp.ClientSession,
     magewell_ip: str,
-    username: str,
-    password: str,
+    cookie_header: str,
     timeout: float = 2.0,
-) -> dict[str, str]:
-    """Read the immutable serial/MAC pair used to bind a device to the fleet journal."""
-    cookie_header = await login_device(
-        session, magewell_ip, username, md5_hash(password), magewell_ip
-    )
+) -> dict[str, Any]:
+    await get_device_rate_limiter().acquire(magewell_ip, "read")
     async with session.get(
         f"http://{magewell_ip}/usapi",
         params={"method": "get-info"},
@@ -685,6 +900,21 @@ async def get_device_identity_with_login(
         data = await response.json()
     if data.get("result") not in (0, "0"):
         raise RuntimeError(f"Device rejected get-info with result {data.get('result')!r}")
+    return data
+
+
+async def get_device_identity_with_login(
+    session: aiohttp.ClientSession,
+    magewell_ip: str,
+    username: str,
+    password: str,
+    timeout: float = 2.0,
+) -> dict[str, str]:
+    """Read the immutable serial/MAC pair used to bind a device to the fleet journal."""
+    cookie_header = await login_device(
+        session, magewell_ip, username, md5_hash(password), magewell_ip
+    )
+    data = await get_info_call(session, magewell_ip, cookie_header, timeout)
     product = data.get("product")
     mac_addresses = data.get("mac-addr")
     if not isinstance(product, dict) or not isinstance(mac_addresses, dict):
@@ -701,6 +931,37 @@ async def get_device_identity_with_login(
     }
 
 
+async def probe_login(
+    session: aiohttp.ClientSession,
+    magewell_ip: str,
+    username: str,
+    password: str,
+    timeout: float,
+) -> str | None:
+    """Try one credential with a single login call; ``None`` means it was rejected.
+
+    Unlike ``login_device`` this never retries: a rejection is a definitive answer
+    for credential classification, and transport failures surface to the caller.
+    """
+    return await submit_login(session, magewell_ip, username, md5_hash(password), timeout)
+
+
+async def get_device_name(
+    session: aiohttp.ClientSession,
+    magewell_ip: str,
+    cookie_header: str,
+    timeout: float,
+) -> str:
+    """Read the display name with the lightest authenticated call that carries it."""
+    info = await get_info_call(session, magewell_ip, cookie_header, timeout)
+    name = info.get("name")
+    if isinstance(name, str) and name:
+        return name
+    # Firmware without a name in get-info falls back to one report on the same login.
+    report = await get_device_report(session, magewell_ip, cookie_header, timeout)
+    return report.get("name", "")
+
+
 async def identify_rotation_device(
     session: aiohttp.ClientSession,
     magewell_ip: str,
@@ -708,19 +969,28 @@ async def identify_rotation_device(
     old_password: str,
     new_password: str,
     timeout: float,
+    last_credential_state: str | None = None,
 ) -> dict[str, str]:
-    for credential_state, password in (("new", new_password), ("old", old_password)):
+    credentials = [("new", new_password), ("old", old_password)]
+    if last_credential_state == "old":
+        # Not-yet-rotated devices usually still are; try their last known credential first.
+        credentials.reverse()
+    for credential_state, password in credentials:
         try:
-            report = await get_device_report_with_login(
-                session,
-                magewell_ip,
-                username,
-                password,
-                timeout,
-            )
+            cookie_header = await probe_login(session, magewell_ip, username, password, timeout)
         except Exception:
             continue
-        name = report.get("name", "")
+        if cookie_header is None:
+            continue
+        try:
+            name = await get_device_name(session, magewell_ip, cookie_header, timeout)
+        except Exception as exc:
+            return {
+                "ip": magewell_ip,
+                "name": "",
+                "credential_state": "error",
+                "read_error": safe_device_error(exc),
+            }
         if not name:
             return {
                 "ip": magewell_ip,
@@ -743,6 +1013,7 @@ async def ping_magewell(
     per_ip_timeout: float = 1.0,
 ) -> bool:
     url = f"http://{ip}/usapi?method=ping"
+    await get_device_rate_limiter().acquire(ip, "probe")
     try:
         async with session.get(
             url,
@@ -766,6 +1037,106 @@ async def sem_ping(
         return await ping_magewell(session, ip, timeout)
 
 
+async def scan_one_device(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    ip: str,
+    username: str,
+    password: str,
+    per_ip_timeout: float,
+    settings_timeout: float,
+    site_semaphore: asyncio.Semaphore | None = None,
+    health: HostHealth | None = None,
+) -> DeviceRecord | None:
+    """Probe one address and read its report and identity; None when nothing answered.
+
+    The site's and the sweep's slots are held for the whole probe, so the limits
+    bound every request a scan has in flight, not only the pings.
+    """
+    health = health or HostHealth()
+    # Wait for the site's own limit first so a saturated VLAN never holds global slots.
+    async with site_semaphore or nullcontext():
+        async with semaphore:
+            return await read_scanned_device(
+                session, ip, username, password, per_ip_timeout, settings_timeout, health
+            )
+
+
+async def read_scanned_device(
+    session: aiohttp.ClientSession,
+    ip: str,
+    username: str,
+    password: str,
+    per_ip_timeout: float,
+    settings_timeout: float,
+    health: HostHealth,
+) -> DeviceRecord | None:
+    if not await ping_magewell(session, ip, per_ip_timeout):
+        health.record_miss(ip)
+        return None
+    health.record_responder(ip)
+    try:
+        report = await get_device_report_with_login(
+            session, ip, username, password, settings_timeout
+        )
+    except Exception as exc:
+        health.record_read_failure(ip)
+        error = safe_device_error(exc)
+        logger.error("Could not read settings from %s: %s", ip, error)
+        return DeviceRecord(ip=ip, read_error=error)
+    try:
+        identity = await get_device_identity_with_login(
+            session, ip, username, password, settings_timeout
+        )
+    except Exception as exc:
+        health.record_read_failure(ip)
+        return DeviceRecord(
+            ip=ip,
+            name=report.get("name", ""),
+            settings=report,
+            identity_error=safe_device_error(exc),
+        )
+    health.record_read_success(ip)
+    return DeviceRecord(
+        ip=ip,
+        name=report.get("name", ""),
+        settings=report,
+        identity=identity,
+        identity_error=(
+            None
+            if identity["fleet_id"]
+            else "Device serial/MAC pair is not present in the fleet journal."
+        ),
+    )
+
+
+def get_host_health() -> HostHealth:
+    health = getattr(app.state, "host_health", None)
+    if health is None:
+        health = HostHealth()
+        app.state.host_health = health
+    return health
+
+
+def public_scan_summary(scan: dict[str, Any] | None) -> dict[str, Any] | None:
+    if scan is None:
+        return None
+    return {key: value for key, value in scan.items() if key != "cancel"}
+
+
+def require_complete_inventory() -> None:
+    """Reject writes and write plans while the cached inventory is a partial sweep."""
+    scan = getattr(app.state, "inventory_scan", None)
+    if scan and not scan["write_eligible"]:
+        raise HTTPException(
+            status_code=409,
+            detail=(
+                f"The latest scan is partial ({scan['partial_reason']}); "
+                "run a complete scan before any write."
+            ),
+        )
+
+
 async def discover_devices_from_ips(
     ips: list[str],
     username: str,
@@ -773,55 +1144,186 @@ async def discover_devices_from_ips(
     per_ip_timeout: float,
     max_concurrent: int,
     settings_timeout: float,
-) -> list[dict[str, Any]]:
-    """Replace the cached inventory using only already-validated read-only targets."""
+    deadline_seconds: float | None = None,
+    sites: Sequence[ipaddress.IPv4Network] = (),
+    per_site_concurrent: int | None = None,
+    full_sweep: bool = False,
+) -> list[DeviceRecord]:
+    """Replace the cached inventory using only already-validated read-only targets.
+
+    The sweep runs as the tracked scan job until every address is probed, the
+    deadline budget expires, or an operator cancels it. A stopped sweep keeps the
+    devices it already read but is recorded as partial and not write-eligible.
+    Every probe shares ``max_concurrent``; addresses inside one of ``sites`` are
+    additionally held to ``per_site_concurrent`` for that site. Unless
+    ``full_sweep`` is set, recently dead addresses are skipped and encoders with an
+    open read circuit are listed without being contacted.
+    """
     app.state.control_settings = None
     app.state.control_device_ip = None
     app.state.control_settings_sha256 = None
+    app.state.control_settings_tree = None
+    deadline_seconds = deadline_seconds or get_scan_deadline_seconds()
+    fleet_last_seen: dict[str, str] = getattr(app.state, "fleet_last_seen", {})
+    requested_ips = set(ips)
+    priority_ips = {ip for ip in fleet_last_seen.values() if ip in requested_ips}
+    health = get_host_health()
+    skipped_ips = set()
+    circuit_open_ips = set()
+    if not full_sweep:
+        for ip in requested_ips - priority_ips:
+            if health.is_known_dead(ip):
+                skipped_ips.add(ip)
+            elif health.circuit_open(ip):
+                circuit_open_ips.add(ip)
+    probe_ips = [ip for ip in ips if ip not in skipped_ips and ip not in circuit_open_ips]
+    retry_budget = scan_retry_budget(len(probe_ips))
+    journaled_count = len(load_fleet_journal())
+    journaled_found: set[str] = set()
+    started = asyncio.get_running_loop().time()
+    scan: dict[str, Any] = {
+        "scan_id": uuid.uuid4().hex,
+        "started_at": datetime.now(UTC).isoformat(),
+        "deadline_seconds": deadline_seconds,
+        "host_count": len(ips),
+        "site_count": len(sites),
+        "priority_host_count": len(priority_ips),
+        "skipped_count": len(skipped_ips),
+        "circuit_open_count": len(circuit_open_ips),
+        "full_sweep": full_sweep,
+        "retry_budget": retry_budget.limit,
+        "retries_used": 0,
+        "probed_count": 0,
+        "journaled_count": journaled_count,
+        "journaled_found_count": 0,
+        "journal_accounted_after_seconds": None,
+        "cancel": asyncio.Event(),
+    }
+    app.state.scan_job = scan
+
+    def count_probe(task: asyncio.Task[DeviceRecord | None]) -> None:
+        if task.cancelled():
+            return
+        scan["probed_count"] += 1
+        record = None if task.exception() else task.result()
+        fleet_id = record.identity_key[2] if record and record.identity_key else None
+        if not fleet_id or fleet_id in journaled_found:
+            return
+        journaled_found.add(fleet_id)
+        scan["journaled_found_count"] = len(journaled_found)
+        if len(journaled_found) == journaled_count:
+            elapsed = round(asyncio.get_running_loop().time() - started, 3)
+            scan["journal_accounted_after_seconds"] = elapsed
+            logger.info(
+                "Scan %s: all %s journaled devices accounted for after %.3f s",
+                scan["scan_id"],
+                journaled_count,
+                elapsed,
+            )
+
     connector = aiohttp.TCPConnector(ssl=False, family=socket.AF_INET)
     semaphore = asyncio.Semaphore(max_concurrent)
-    async with aiohttp.ClientSession(connector=connector) as session:
-        ping_results = await asyncio.gather(
-            *(sem_ping(semaphore, session, ip, per_ip_timeout) for ip in ips)
-        )
-        magewell_ips = [ip for ip, matched in zip(ips, ping_results) if matched]
-        report_results = await asyncio.gather(
-            *(
-                get_device_report_with_login(session, ip, username, password, settings_timeout)
-                for ip in magewell_ips
-            ),
-            return_exceptions=True,
-        )
-        identity_results = await asyncio.gather(
-            *(
-                get_device_identity_with_login(session, ip, username, password, settings_timeout)
-                for ip, report in zip(magewell_ips, report_results)
-                if not isinstance(report, Exception)
-            ),
-            return_exceptions=True,
-        )
+    site_semaphores = {
+        site: asyncio.Semaphore(per_site_concurrent or max_concurrent) for site in sites
+    }
 
-    devices = []
-    successful_identity_results = iter(identity_results)
-    for ip, report in zip(magewell_ips, report_results):
-        if isinstance(report, Exception):
-            error = safe_device_error(report)
-            logger.error("Could not read settings from %s: %s", ip, error)
-            devices.append({"ip": ip, "name": "", "settings": {}, "read_error": error})
-        else:
-            device = {"ip": ip, "name": report.get("name", ""), "settings": report}
-            identity = next(successful_identity_results)
-            if isinstance(identity, Exception):
-                device["identity_error"] = safe_device_error(identity)
-            else:
-                device["identity"] = identity
-                if not identity["fleet_id"]:
-                    device["identity_error"] = (
-                        "Device serial/MAC pair is not present in the fleet journal."
+    def site_semaphore(ip: str) -> asyncio.Semaphore | None:
+        address = ipaddress.IPv4Address(ip)
+        return next((limit for site, limit in site_semaphores.items() if address in site), None)
+
+    try:
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # Probe tasks copy the context they are created in, so the whole sweep
+            # draws on one retry budget. Journaled last-seen addresses are scheduled
+            # first; both semaphores wake waiters in arrival order, so they take the
+            # first shared and per-site slots without ever exceeding either limit.
+            with retry_budget_scope(retry_budget):
+                probe_by_ip = {
+                    ip: asyncio.create_task(
+                        scan_one_device(
+                            session,
+                            semaphore,
+                            ip,
+                            username,
+                            password,
+                            per_ip_timeout,
+                            settings_timeout,
+                            site_semaphore(ip),
+                            health,
+                        )
                     )
-            devices.append(device)
+                    for ip in [
+                        *(ip for ip in probe_ips if ip in priority_ips),
+                        *(ip for ip in probe_ips if ip not in priority_ips),
+                    ]
+                }
+            probes = [probe_by_ip[ip] for ip in probe_ips]
+            for probe in probes:
+                probe.add_done_callback(count_probe)
+            sweep = asyncio.gather(*probes)
+            cancel_requested = asyncio.create_task(scan["cancel"].wait())
+            try:
+                await asyncio.wait(
+                    {sweep, cancel_requested},
+                    timeout=deadline_seconds,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if sweep.done():
+                    sweep.result()
+            finally:
+                cancel_requested.cancel()
+                unfinished = [probe for probe in probes if not probe.done()]
+                for probe in unfinished:
+                    probe.cancel()
+                # Let cancelled probes unwind before their session closes.
+                await asyncio.gather(*probes, return_exceptions=True)
+    finally:
+        app.state.scan_job = None
+
+    devices = []
+    for ip in ips:
+        probe = probe_by_ip.get(ip)
+        if ip in circuit_open_ips:
+            devices.append(
+                DeviceRecord(
+                    ip=ip,
+                    read_error=(
+                        "Reads are paused after repeated failures; "
+                        "run a full sweep to retry this device now."
+                    ),
+                )
+            )
+        elif probe is not None and not probe.cancelled() and probe.result() is not None:
+            devices.append(probe.result())
+    partial_reason = None
+    if unfinished:
+        partial_reason = "cancelled" if scan["cancel"].is_set() else "deadline"
+        logger.warning(
+            "Scan %s stopped (%s) after probing %s of %s addresses",
+            scan["scan_id"],
+            partial_reason,
+            len(probes) - len(unfinished),
+            len(probes),
+        )
+    app.state.inventory_scan = {
+        **public_scan_summary(scan),
+        "probed_count": len(probes) - len(unfinished),
+        "retries_used": retry_budget.used,
+        "status": "partial" if partial_reason else "complete",
+        "partial_reason": partial_reason,
+        "write_eligible": partial_reason is None,
+    }
     app.state.devices = devices
-    app.state.rename_scan_required = False
+    app.state.fleet_last_seen = {
+        **fleet_last_seen,
+        **{
+            device.identity_key[2]: device.ip
+            for device in devices
+            if device.identity_key and device.identity_key[2]
+        },
+    }
+    if partial_reason is None:
+        app.state.rename_scan_required = False
     return devices
 
 
@@ -870,58 +1372,138 @@ async def push_update_for_device(
         }
 
 
-@app.get("/healthz")
-async def healthz() -> dict[str, Any]:
-    effect_modes = enabled_effect_modes()
-    return {
-        "status": "ok" if len(effect_modes) <= 1 else "invalid-effect-configuration",
-        "allowed_subnet": str(get_allowed_network()),
-        "device_reads_configured": bool(
-            os.getenv("MAGEWELL_USERNAME", "").strip() and os.getenv("MAGEWELL_PASSWORD", "")
-        ),
-        "device_writes_enabled": env_flag("ENABLE_DEVICE_WRITES"),
-        "firmware_updates_enabled": env_flag("ENABLE_FIRMWARE_UPDATES"),
-        "credential_rotation_configured": bool(os.getenv("MAGEWELL_OLD_PASSWORD", "")),
-        "credential_rotation_enabled": env_flag("ENABLE_CREDENTIAL_ROTATION"),
-        "effect_configuration_valid": len(effect_modes) <= 1,
-        "active_effect_mode": next(iter(effect_modes)) if len(effect_modes) == 1 else None,
-    }
-
-
-@app.get("/local-subnet")
+async def run_discovery_scan(
+    ips: list[str],
+    username: str,
+    password: str,
+    per_ip_timeout: float,
+    max_concurrent: int,
+    settings_timeout: float,
+    deadline_seconds: float | None,
+    sites: Sequence[ipaddress.IPv4Network] = (),
+    per_site_concurrent: int | None = None,
+    full_sweep: bool = False,
+) -> list[DeviceRecord]:
+    """Run one inventory sweep; identical concurrent requests share its result."""
+    scan_key = (
+        tuple(sorted(ips, key=ipaddress.IPv4Address)),
+        per_ip_timeout,
+        max_concurrent,
+        settings_timeout,
+        deadline_seconds,
+        tuple(sorted(sites)),
+        per_site_concurrent,
+        full_sweep,
+    )
+    try:
+        return await get_single_flight().run(
+            "device-scan",
+            scan_key,
+            lambda: discover_devices_from_ips(
+                ips,
+                username,
+                password,
+                per_ip_timeout,
+                max_concurrent,
+                settings_timeout,
+                deadline_seconds,
+                sites=sites,
+                per_site_concurrent=per_site_concurrent,
+                full_sweep=full_sweep,
+            ),
+        )
+    except SingleFlightConflict:
+        raise HTTPException(
+            status_code=409,
+            detail="A different device scan is already running; wait for it to finish.",
+        ) from None
+
+
+def discovery_response(devices: list[DeviceRecord], cached: bool) -> dict[str, Any]:
+    return {
+        "devices": public_device_list(devices),
+        "cached": cached,
+        "scan": getattr(app.state, "inventory_scan", None),
+    }
+
+
+@app.get("/healthz")
+async def healthz() -> dict[str, Any]:
+    effect_modes = enabled_effect_modes()
+    return {
+        "status": "ok" if len(effect_modes) <= 1 else "invalid-effect-configuration",
+        "allowed_subnet": allowed_scope_label(),
+        "device_reads_configured": bool(
+            os.getenv("MAGEWELL_USERNAME", "").strip() and os.getenv("MAGEWELL_PASSWORD", "")
+        ),
+        "device_writes_enabled": env_flag("ENABLE_DEVICE_WRITES"),
+        "firmware_updates_enabled": env_flag("ENABLE_FIRMWARE_UPDATES"),
+        "credential_rotation_configured": bool(os.getenv("MAGEWELL_OLD_PASSWORD", "")),
+        "credential_rotation_enabled": env_flag("ENABLE_CREDENTIAL_ROTATION"),
+        "effect_configuration_valid": len(effect_modes) <= 1,
+        "active_effect_mode": next(iter(effect_modes)) if len(effect_modes) == 1 else None,
+    }
+
+
+@app.get("/device-rate-limits")
+async def device_rate_limits() -> dict[str, Any]:
+    """Report per-device pacing limits and how often each call class had to queue."""
+    return get_device_rate_limiter().snapshot()
+
+
+@app.get("/local-subnet")
 async def local_subnet() -> dict[str, str]:
-    return {"local_subnet": str(get_allowed_network())}
+    return {"local_subnet": allowed_scope_label()}
 
 
 @app.get("/discover-magewell")
 async def discover_magewell(
-    subnet: str = Query(..., description="IPv4 subnet within ALLOWED_SUBNET"),
+    subnet: str = Query(
+        ..., description="Comma-separated IPv4 subnets within ALLOWED_SUBNET, one per site"
+    ),
     rescan: bool = Query(False, description="Force a new scan"),
+    full_sweep: bool = Query(
+        False, description="Probe every address, ignoring the dead-host cache and open circuits"
+    ),
     per_ip_timeout: float = Query(1.0, gt=0, le=5),
     max_concurrent: int = Query(50, ge=1, le=200),
+    per_site_concurrent: int | None = Query(None, ge=1, le=200),
     settings_timeout: float = Query(2.0, gt=0, le=10),
+    deadline_seconds: float | None = Query(None, gt=0, le=MAX_SCAN_DEADLINE_SECONDS),
     x_magewell_operator_intent: str | None = Header(None),
     origin: str | None = Header(None),
 ) -> dict[str, Any]:
     require_operator_intent(x_magewell_operator_intent, origin)
-    network = validate_scan_network(subnet)
+    networks = validate_scan_networks(subnet)
     username, password = get_device_credentials()
     if not rescan and getattr(app.state, "devices", None):
-        return {"devices": public_device_list(app.state.devices), "cached": True}
+        return discovery_response(app.state.devices, cached=True)
 
-    ips = [str(ip) for ip in network.hosts()]
-    devices = await discover_devices_from_ips(
-        ips, username, password, per_ip_timeout, max_concurrent, settings_timeout
+    devices = await run_discovery_scan(
+        interleave_site_hosts(networks),
+        username,
+        password,
+        per_ip_timeout,
+        max_concurrent,
+        settings_timeout,
+        deadline_seconds,
+        sites=networks,
+        per_site_concurrent=per_site_concurrent,
+        full_sweep=full_sweep,
     )
-    return {"devices": public_device_list(devices), "cached": False}
+    return discovery_response(devices, cached=False)
 
 
 @app.post("/discover-known-ips")
 async def discover_known_ips(
     request: KnownIpDiscoveryRequest,
+    full_sweep: bool = Query(
+        False, description="Probe every address, ignoring the dead-host cache and open circuits"
+    ),
     per_ip_timeout: float = Query(1.0, gt=0, le=5),
     max_concurrent: int = Query(50, ge=1, le=200),
     settings_timeout: float = Query(2.0, gt=0, le=10),
+    deadline_seconds: float | None = Query(None, gt=0, le=MAX_SCAN_DEADLINE_SECONDS),
     x_magewell_operator_intent: str | None = Header(None),
     origin: str | None = Header(None),
 ) -> dict[str, Any]:
@@ -929,10 +1511,41 @@ async def discover_known_ips(
     require_operator_intent(x_magewell_operator_intent, origin)
     ips = validate_known_discovery_ips(request.ips)
     username, password = get_device_credentials()
-    devices = await discover_devices_from_ips(
-        ips, username, password, per_ip_timeout, max_concurrent, settings_timeout
+    devices = await run_discovery_scan(
+        ips,
+        username,
+        password,
+        per_ip_timeout,
+        max_concurrent,
+        settings_timeout,
+        deadline_seconds,
+        full_sweep=full_sweep,
     )
-    return {"devices": public_device_list(devices), "cached": False}
+    return discovery_response(devices, cached=False)
+
+
+@app.get("/discover-status")
+async def discover_status() -> dict[str, Any]:
+    """Report the running scan job, if any, and whether the cached inventory is complete."""
+    return {
+        "running": public_scan_summary(getattr(app.state, "scan_job", None)),
+        "latest": getattr(app.state, "inventory_scan", None),
+    }
+
+
+@app.post("/discover-cancel")
+async def discover_cancel(
+    scan_id: str | None = Query(None, max_length=32),
+    x_magewell_operator_intent: str | None = Header(None),
+    origin: str | None = Header(None),
+) -> dict[str, Any]:
+    """Stop the running scan; devices already read are kept as a partial inventory."""
+    require_operator_intent(x_magewell_operator_intent, origin)
+    scan = getattr(app.state, "scan_job", None)
+    if scan is None or (scan_id and scan_id != scan["scan_id"]):
+        raise HTTPException(status_code=409, detail="That device scan is not running.")
+    scan["cancel"].set()
+    return {"scan_id": scan["scan_id"], "cancel_requested": True}
 
 
 def build_rename_plan(request: RenamePlanRequest) -> dict[str, Any]:
@@ -942,6 +1555,7 @@ def build_rename_plan(request: RenamePlanRequest) -> dict[str, Any]:
             status_code=409,
             detail="A rename run stopped. Run a fresh device scan before building another plan.",
         )
+    require_complete_inventory()
     cached_devices = {
         item["ip"]: item
         for item in getattr(app.state, "devices", [])
@@ -1053,6 +1667,8 @@ def build_rename_plan(request: RenamePlanRequest) -> dict[str, Any]:
     for ip, current_name, new_name, fleet_id in targets:
         settings = cached_devices[ip]["settings"]
         payload, recording_changes = build_rename_settings(settings, current_name, new_name)
+        # Only the name and recording paths differ from the scan; share everything else.
+        payload, _ = intern_settings(payload)
         entries.append(
             {
                 "ip": ip,
@@ -1061,7 +1677,7 @@ def build_rename_plan(request: RenamePlanRequest) -> dict[str, Any]:
                 "eth_mac": cached_devices[ip]["identity"]["eth_mac"],
                 "current_name": current_name,
                 "new_name": new_name,
-                "before_settings_sha256": settings_fingerprint(settings),
+                "before_settings_sha256": cached_devices[ip].settings_sha256,
                 "after_display_name_sha256": settings_fingerprint({**settings, "name": new_name}),
                 "after_settings_sha256": settings_fingerprint(payload),
                 "recording_changes": recording_changes,
@@ -1119,6 +1735,97 @@ async def rename_plan(
     return public_rename_plan(build_rename_plan(request))
 
 
+async def recheck_rename_target(
+    session: aiohttp.ClientSession,
+    entry: dict[str, Any],
+    username: str,
+    password: str,
+) -> None:
+    """Raise unless the live device still matches the plan's name, settings, and identity."""
+    ip = entry["ip"]
+    before = await get_device_report_with_login(session, ip, username, password, timeout=10.0)
+    identity = await get_device_identity_with_login(session, ip, username, password, timeout=10.0)
+    if (
+        before.get("name") != entry["current_name"]
+        or settings_fingerprint(before) != entry["before_settings_sha256"]
+        or identity["serial"] != entry["serial"]
+        or identity["eth_mac"] != entry["eth_mac"]
+        or identity["fleet_id"] != entry["fleet_id"]
+    ):
+        raise RuntimeError("Live device identity or settings changed since the rename plan.")
+
+
+async def prepare_rename_target(
+    session: aiohttp.ClientSession,
+    entry: dict[str, Any],
+    username: str,
+    password: str,
+) -> tuple[str, float]:
+    """Re-check one target and return its login cookie and when it was checked; read-only."""
+    await recheck_rename_target(session, entry, username, password)
+    cookie_header = await login_device(
+        session, entry["ip"], username, md5_hash(password), entry["current_name"]
+    )
+    return cookie_header, asyncio.get_running_loop().time()
+
+
+async def confirm_prepared_rename_target(
+    session: aiohttp.ClientSession,
+    entry: dict[str, Any],
+    cookie_header: str,
+    prepared_at: float,
+    username: str,
+    password: str,
+) -> str:
+    """Return a cookie that is usable right now for a target prepared ahead of time.
+
+    A target prepared during the previous target's settle window can be a whole
+    settle period old by the time its set-name is sent. Repeating the full report
+    and identity re-check would undo the pipelining, so only the display name and
+    the session are re-confirmed, with one re-login if the cookie has expired. A
+    settings change in that window that keeps the name is not detected before the
+    set-name; the display-name read-back still compares the full settings digest.
+    """
+    if asyncio.get_running_loop().time() - prepared_at <= RENAME_PREPARED_MAX_AGE_SECONDS:
+        return cookie_header
+    ip = entry["ip"]
+    try:
+        name = await get_device_name(session, ip, cookie_header, 10.0)
+    except Exception:
+        cookie_header = await login_device(
+            session, ip, username, md5_hash(password), entry["current_name"]
+        )
+        name = await get_device_name(session, ip, cookie_header, 10.0)
+    if name != entry["current_name"]:
+        raise RuntimeError("Live device name changed since the rename target was re-checked.")
+    return cookie_header
+
+
+async def prevalidate_rename_targets(
+    session: aiohttp.ClientSession,
+    entries: list[dict[str, Any]],
+    username: str,
+    password: str,
+) -> dict[str, str]:
+    """Re-check every planned target concurrently and return safe errors by IP.
+
+    This sweep is read-only. It surfaces a drifted or unreachable target before
+    the first ``set-name`` instead of after every earlier target was renamed.
+    """
+    semaphore = asyncio.Semaphore(RENAME_PREVALIDATION_CONCURRENCY)
+
+    async def check(entry: dict[str, Any]) -> None:
+        async with semaphore:
+            await recheck_rename_target(session, entry, username, password)
+
+    outcomes = await asyncio.gather(*(check(entry) for entry in entries), return_exceptions=True)
+    return {
+        entry["ip"]: safe_device_error(outcome)
+        for entry, outcome in zip(entries, outcomes)
+        if isinstance(outcome, Exception)
+    }
+
+
 @app.post("/rename-execute")
 async def rename_execute(
     request: RenameExecuteRequest,
@@ -1142,6 +1849,7 @@ async def rename_execute(
             status_code=409,
             detail="Fleet journal changed since this plan was built. Scan and build a fresh plan.",
         )
+    require_complete_inventory()
     username, password = get_device_credentials()
     lock = get_mutation_lock()
     if lock.locked():
@@ -1152,96 +1860,60 @@ async def rename_execute(
     plan["executed"] = True
     async with lock:
         connector = aiohttp.TCPConnector(ssl=False, family=socket.AF_INET)
+        # One pooled client session spans the concurrent read-only sweep and the
+        # sequential mutation phase, so keep-alive connections are reused.
         async with aiohttp.ClientSession(connector=connector) as session:
+            prevalidation_errors = await prevalidate_rename_targets(
+                session, plan["entries"], username, password
+            )
             for entry in plan["entries"]:
-                ip = entry["ip"]
-                try:
-                    before = await get_device_report_with_login(
-                        session, ip, username, password, timeout=10.0
-                    )
-                    identity = await get_device_identity_with_login(
-                        session, ip, username, password, timeout=10.0
-                    )
-                    if (
-                        before.get("name") != entry["current_name"]
-                        or settings_fingerprint(before) != entry["before_settings_sha256"]
-                        or identity["serial"] != entry["serial"]
-                        or identity["eth_mac"] != entry["eth_mac"]
-                        or identity["fleet_id"] != entry["fleet_id"]
-                    ):
-                        raise RuntimeError(
-                            "Live device identity or settings changed since the rename plan."
-                        )
-                    cookie_header = await login_device(
-                        session, ip, username, md5_hash(password), entry["current_name"]
-                    )
-                except Exception as exc:
+                if entry["ip"] in prevalidation_errors:
                     results.append(
                         {
-                            "ip": ip,
+                            "ip": entry["ip"],
                             "current_name": entry["current_name"],
                             "new_name": entry["new_name"],
                             "status": "stopped-before-submission",
                             "display_name_status": "not-submitted",
                             "recording_names_status": "not-submitted",
-                            "error": safe_device_error(exc),
-                        }
-                    )
-                    break
-
-                submitted_ips.add(ip)
-                try:
-                    await set_name_call(
-                        session, ip, entry["new_name"], cookie_header, entry["current_name"]
-                    )
-                except Exception as exc:
-                    plan["unknown_ips"].add(ip)
-                    results.append(
-                        {
-                            "ip": ip,
-                            "current_name": entry["current_name"],
-                            "new_name": entry["new_name"],
-                            "status": "stopped-after-display-name-submission",
-                            "display_name_status": "uncertain",
-                            "recording_names_status": "not-submitted",
-                            "error": safe_device_error(exc),
-                        }
-                    )
-                    break
-
-                try:
-                    _, display_readback_attempts = await read_rename_stage_until_settled(
-                        session,
-                        ip,
-                        username,
-                        password,
-                        entry["new_name"],
-                        entry["after_display_name_sha256"],
-                        "Display-name read-back did not match the approved pre-recording state",
-                    )
-                except Exception as exc:
-                    plan["unknown_ips"].add(ip)
-                    results.append(
-                        {
-                            "ip": ip,
-                            "current_name": entry["current_name"],
-                            "new_name": entry["new_name"],
-                            "status": "stopped-after-display-name-submission",
-                            "display_name_status": "uncertain",
-                            "recording_names_status": "not-submitted",
-                            "error": safe_device_error(exc),
+                            "error": prevalidation_errors[entry["ip"]],
                         }
                     )
-                    break
+            # Any sweep failure stops the batch before the first set-name.
+            entries = [] if prevalidation_errors else plan["entries"]
+            next_target: asyncio.Task[tuple[str, float]] | None = None
+            try:
+                for index, entry in enumerate(entries):
+                    ip = entry["ip"]
+                    try:
+                        if next_target is None:
+                            next_target = asyncio.create_task(
+                                prepare_rename_target(session, entry, username, password)
+                            )
+                        cookie_header, prepared_at = await next_target
+                        cookie_header = await confirm_prepared_rename_target(
+                            session, entry, cookie_header, prepared_at, username, password
+                        )
+                    except Exception as exc:
+                        next_target = None
+                        results.append(
+                            {
+                                "ip": ip,
+                                "current_name": entry["current_name"],
+                                "new_name": entry["new_name"],
+                                "status": "stopped-before-submission",
+                                "display_name_status": "not-submitted",
+                                "recording_names_status": "not-submitted",
+                                "error": safe_device_error(exc),
+                            }
+                        )
+                        break
 
-                if entry["recording_changes"]:
+                    next_target = None
+                    submitted_ips.add(ip)
                     try:
-                        await import_settings_call(
-                            session,
-                            ip,
-                            entry["payload"],
-                            cookie_header,
-                            entry["new_name"],
+                        await set_name_call(
+                            session, ip, entry["new_name"], cookie_header, entry["current_name"]
                         )
                     except Exception as exc:
                         plan["unknown_ips"].add(ip)
@@ -1250,24 +1922,29 @@ async def rename_execute(
                                 "ip": ip,
                                 "current_name": entry["current_name"],
                                 "new_name": entry["new_name"],
-                                "status": "stopped-after-recording-name-submission",
-                                "display_name_status": "verified",
-                                "display_name_readback_attempts": display_readback_attempts,
-                                "recording_names_status": "uncertain",
+                                "status": "stopped-after-display-name-submission",
+                                "display_name_status": "uncertain",
+                                "recording_names_status": "not-submitted",
                                 "error": safe_device_error(exc),
                             }
                         )
                         break
 
+                    # Prepare the next target (read-only re-check and login) while this one
+                    # settles. Its set-name still waits until this target is fully verified.
+                    if index + 1 < len(entries):
+                        next_target = asyncio.create_task(
+                            prepare_rename_target(session, entries[index + 1], username, password)
+                        )
                     try:
-                        _, recording_readback_attempts = await read_rename_stage_until_settled(
+                        _, display_readback_attempts = await read_rename_stage_until_settled(
                             session,
                             ip,
                             username,
                             password,
                             entry["new_name"],
-                            entry["after_settings_sha256"],
-                            "Recording-name read-back did not match the approved final settings",
+                            entry["after_display_name_sha256"],
+                            "Display-name read-back did not match the approved pre-recording state",
                         )
                     except Exception as exc:
                         plan["unknown_ips"].add(ip)
@@ -1276,33 +1953,89 @@ async def rename_execute(
                                 "ip": ip,
                                 "current_name": entry["current_name"],
                                 "new_name": entry["new_name"],
-                                "status": "stopped-after-recording-name-submission",
-                                "display_name_status": "verified",
-                                "display_name_readback_attempts": display_readback_attempts,
-                                "recording_names_status": "uncertain",
+                                "status": "stopped-after-display-name-submission",
+                                "display_name_status": "uncertain",
+                                "recording_names_status": "not-submitted",
                                 "error": safe_device_error(exc),
                             }
                         )
                         break
-                results.append(
-                    {
-                        "ip": ip,
-                        "current_name": entry["current_name"],
-                        "new_name": entry["new_name"],
-                        "status": "renamed-and-verified",
-                        "display_name_status": "verified",
-                        "display_name_readback_attempts": display_readback_attempts,
-                        "recording_names_status": (
-                            "verified" if entry["recording_changes"] else "not-needed"
-                        ),
-                        **(
-                            {"recording_names_readback_attempts": recording_readback_attempts}
-                            if entry["recording_changes"]
-                            else {}
-                        ),
-                        "recording_changes": entry["recording_changes"],
-                    }
-                )
+
+                    if entry["recording_changes"]:
+                        try:
+                            await import_settings_call(
+                                session,
+                                ip,
+                                entry["payload"],
+                                cookie_header,
+                                entry["new_name"],
+                            )
+                        except Exception as exc:
+                            plan["unknown_ips"].add(ip)
+                            results.append(
+                                {
+                                    "ip": ip,
+                                    "current_name": entry["current_name"],
+                                    "new_name": entry["new_name"],
+                                    "status": "stopped-after-recording-name-submission",
+                                    "display_name_status": "verified",
+                                    "display_name_readback_attempts": display_readback_attempts,
+                                    "recording_names_status": "uncertain",
+                                    "error": safe_device_error(exc),
+                                }
+                            )
+                            break
+
+                        try:
+                            _, recording_readback_attempts = await read_rename_stage_until_settled(
+                                session,
+                                ip,
+                                username,
+                                password,
+                                entry["new_name"],
+                                entry["after_settings_sha256"],
+                                "Recording-name read-back did not match the approved final settings",
+                            )
+                        except Exception as exc:
+                            plan["unknown_ips"].add(ip)
+                            results.append(
+                                {
+                                    "ip": ip,
+                                    "current_name": entry["current_name"],
+                                    "new_name": entry["new_name"],
+                                    "status": "stopped-after-recording-name-submission",
+                                    "display_name_status": "verified",
+                                    "display_name_readback_attempts": display_readback_attempts,
+                                    "recording_names_status": "uncertain",
+                                    "error": safe_device_error(exc),
+                                }
+                            )
+                            break
+                    results.append(
+                        {
+                            "ip": ip,
+                            "current_name": entry["current_name"],
+                            "new_name": entry["new_name"],
+                            "status": "renamed-and-verified",
+                            "display_name_status": "verified",
+                            "display_name_readback_attempts": display_readback_attempts,
+                            "recording_names_status": (
+                                "verified" if entry["recording_changes"] else "not-needed"
+                            ),
+                            **(
+                                {"recording_names_readback_attempts": recording_readback_attempts}
+                                if entry["recording_changes"]
+                                else {}
+                            ),
+                            "recording_changes": entry["recording_changes"],
+                        }
+                    )
+            finally:
+                # A stopped batch discards any prepared next target; it was never mutated.
+                if next_target is not None:
+                    next_target.cancel()
+                    with suppress(Exception, asyncio.CancelledError):
+                        await next_target
     completed_ips = {result["ip"] for result in results}
     for entry in plan["entries"]:
         if entry["ip"] not in completed_ips:
@@ -1330,6 +2063,10 @@ async def rename_execute(
             "fully_verified_count": fully_verified_count,
             "not_submitted_count": len(plan["entries"]) - len(submitted_ips),
         },
+        "prevalidation": {
+            "checked_count": len(plan["entries"]),
+            "failed_count": len(prevalidation_errors),
+        },
         "results": results,
     }
 
@@ -1358,6 +2095,10 @@ async def credential_rotation_inventory(
             *(sem_ping(semaphore, session, ip, per_ip_timeout) for ip in ips)
         )
         magewell_ips = [ip for ip, matched in zip(ips, ping_results) if matched]
+        last_credential_states = {
+            device["ip"]: device.get("credential_state")
+            for device in getattr(app.state, "rotation_devices", [])
+        }
         devices = await asyncio.gather(
             *(
                 identify_rotation_device(
@@ -1367,6 +2108,7 @@ async def credential_rotation_inventory(
                     old_password,
                     new_password,
                     settings_timeout,
+                    last_credential_states.get(ip),
                 )
                 for ip in magewell_ips
             )
@@ -1522,9 +2264,12 @@ async def set_control(device: DeviceSelection) -> dict[str, Any]:
         control_settings,
     )
     fingerprint = settings_fingerprint(frozen_settings)
-    app.state.control_settings = frozen_settings
+    # The frozen source shares its unchanged profile subtrees with the scanned inventory.
+    shared_settings, shared_tree = intern_settings(frozen_settings)
+    app.state.control_settings = shared_settings
     app.state.control_device_ip = ip
     app.state.control_settings_sha256 = fingerprint
+    app.state.control_settings_tree = (fingerprint, shared_tree)
     compatible_target_ips = []
     incompatible_targets = []
     for candidate in cached_devices:
@@ -1631,7 +2376,7 @@ async def profile_plan(
         identity = profile_plan_identity(cached_device)
         target_plan: dict[str, Any] = {
             **identity,
-            "current_settings_sha256": settings_fingerprint(cached_device["settings"]),
+            "current_settings_sha256": cached_device.settings_sha256,
         }
         try:
             expected_settings = get_bulk_update_settings(
@@ -1666,16 +2411,88 @@ async def profile_plan(
     }
 
 
-@app.post("/push-updates")
-async def push_updates(
-    request: PushUpdateRequest,
-    x_magewell_operator_intent: str | None = Header(None),
-    origin: str | None = Header(None),
-) -> dict[str, Any]:
-    require_operator_intent(x_magewell_operator_intent, origin)
+@app.get("/profile-drift")
+async def profile_drift() -> dict[str, Any]:
+    """Return a device x profile-section drift matrix from cached inventory only.
+
+    No device session is opened. Each cell compares one cached per-section digest
+    with the frozen source's digest, so the matrix never exposes setting values.
+    """
+    control_settings = getattr(app.state, "control_settings", None)
+    source_ip = getattr(app.state, "control_device_ip", None)
+    if not control_settings or not source_ip:
+        raise HTTPException(
+            status_code=400, detail="Select and freeze a control source before comparing drift."
+        )
+    source_children = frozen_control_settings_tree(control_settings).children
+    sections = sorted(key for key in source_children if key not in TARGET_LOCAL_KEYS)
+    source_digests = [source_children[section].sha256 for section in sections]
+    section_drift_counts = [0] * len(sections)
+    rows = []
+    for device in getattr(app.state, "devices", []):
+        if device["ip"] == source_ip:
+            continue
+        row = {
+            "ip": device["ip"],
+            "name": device.get("name", ""),
+            "fleet_id": device.get("identity", {}).get("fleet_id", ""),
+        }
+        if device.get("read_error") or not device.get("settings"):
+            row["cells"] = DRIFT_CELL_UNREADABLE * len(sections)
+            rows.append(row)
+            continue
+        children = device.settings_tree.children
+        cells = "".join(
+            DRIFT_CELL_MISSING
+            if section not in children
+            else DRIFT_CELL_MATCH
+            if children[section].sha256 == digest
+            else DRIFT_CELL_DRIFT
+            for section, digest in zip(sections, source_digests)
+        )
+        for index, cell in enumerate(cells):
+            if cell != DRIFT_CELL_MATCH:
+                section_drift_counts[index] += 1
+        row["cells"] = cells
+        rows.append(row)
+    return {
+        "source": {
+            "ip": source_ip,
+            "settings_sha256": getattr(app.state, "control_settings_sha256", None),
+        },
+        "sections": sections,
+        "legend": {
+            DRIFT_CELL_MATCH: "match",
+            DRIFT_CELL_DRIFT: "drift",
+            DRIFT_CELL_MISSING: "missing",
+            DRIFT_CELL_UNREADABLE: "unreadable",
+        },
+        "devices": rows,
+        "section_drift_counts": section_drift_counts,
+        "drifted_device_count": sum(1 for row in rows if set(row["cells"]) - {DRIFT_CELL_MATCH}),
+    }
+
+
+@dataclass(frozen=True)
+class PushBatch:
+    """A validated profile write: its targets, payloads, and pre-effect receipt."""
+
+    receipt: dict[str, Any]
+    target_payloads: list[tuple[DeviceSelection, dict[str, Any], str]]
+    source_ip: str | None
+    source_settings_sha256: str
+    control_settings: dict[str, Any]
+    cached_devices: dict[str, DeviceRecord]
+    username: str
+    password: str
+
+
+def prepare_push_batch(request: PushUpdateRequest) -> PushBatch:
+    """Validate a write request against the latest scan and build its receipt."""
     require_device_writes(request.confirm)
     username, password = get_device_credentials()
     ensure_unique_devices(request.devices)
+    require_complete_inventory()
     control_settings = getattr(app.state, "control_settings", None)
     if not control_settings:
         raise HTTPException(
@@ -1715,7 +2532,7 @@ async def push_updates(
         raise HTTPException(status_code=400, detail="The control source cannot be a write target.")
     source_device = cached_devices.get(source_ip) if source_ip else None
     source_identity = profile_run_receipt_identity(
-        source_device or {"ip": source_ip or "", "name": ""}
+        source_device or DeviceRecord(ip=source_ip or "")
     )
     if source_device and source_device.get("settings"):
         current_source_settings = get_bulk_update_settings(
@@ -1748,33 +2565,80 @@ async def push_updates(
         target_payloads=target_payloads,
         cached_devices=cached_devices,
     )
-    lock = get_mutation_lock()
-    if lock.locked():
-        raise HTTPException(status_code=409, detail="Another device update is already running.")
-    async with lock:
-        try:
-            get_profile_run_receipt_store().reserve_and_record_intent(receipt)
-        except ReceiptSafetyError as exc:
-            raise HTTPException(status_code=503, detail=str(exc)) from None
-        connector = aiohttp.TCPConnector(ssl=False, family=socket.AF_INET)
-        async with aiohttp.ClientSession(connector=connector) as session:
-            mutation_results = await asyncio.gather(
-                *(
-                    push_update_for_device(
-                        session,
-                        device.ip,
-                        device.magewell_id,
-                        payload,
-                        username,
-                        password,
-                    )
-                    for device, payload, _ in target_payloads
+    return PushBatch(
+        receipt=receipt,
+        target_payloads=target_payloads,
+        source_ip=source_ip,
+        source_settings_sha256=source_settings_sha256,
+        control_settings=control_settings,
+        cached_devices=cached_devices,
+        username=username,
+        password=password,
+    )
+
+
+def reserve_push_receipt(receipt: dict[str, Any]) -> None:
+    try:
+        get_profile_run_receipt_store().reserve_and_record_intent(receipt)
+    except ReceiptSafetyError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from None
+
+
+async def run_push_batch(
+    batch: PushBatch,
+    on_result: Callable[[int, dict[str, Any]], None] | None = None,
+    on_start: Callable[[int], None] | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+) -> list[dict[str, Any]]:
+    """Submit each target's import once, at most ``PUSH_CONCURRENCY`` at a time.
+
+    Results keep target order; ``on_start`` sees each target once it holds a push
+    slot and ``on_result`` sees each result as soon as it lands. A caller that also
+    talks to the targets passes its own ``semaphore`` so both share one window.
+    """
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(get_push_concurrency())
+    connector = aiohttp.TCPConnector(ssl=False, family=socket.AF_INET)
+    async with aiohttp.ClientSession(connector=connector) as session:
+
+        async def push_one(
+            index: int, device: DeviceSelection, payload: dict[str, Any]
+        ) -> dict[str, Any]:
+            async with semaphore:
+                if on_start is not None:
+                    on_start(index)
+                result = await push_update_for_device(
+                    session,
+                    device.ip,
+                    device.magewell_id,
+                    payload,
+                    batch.username,
+                    batch.password,
                 )
-            )
+            if on_result is not None:
+                on_result(index, result)
+            return result
+
+        pushes = [
+            asyncio.create_task(push_one(index, device, payload))
+            for index, (device, payload, _) in enumerate(batch.target_payloads)
+        ]
+        try:
+            return await asyncio.gather(*pushes)
+        finally:
+            # Never leave imports running behind a failed batch once the lock is released.
+            for push in pushes:
+                push.cancel()
+            await asyncio.gather(*pushes, return_exceptions=True)
+
+
+def finalize_push_batch(batch: PushBatch, mutation_results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Record every target's mutation outcome in the receipt and build the batch summary."""
+    receipt = batch.receipt
     results = []
     receipt_targets = list(receipt["targets"])
     for receipt_target, mutation_result, (_, _, expected_fingerprint) in zip(
-        receipt_targets, mutation_results, target_payloads
+        receipt_targets, mutation_results, batch.target_payloads
     ):
         status = mutation_result["status"]
         reason_code = mutation_result.get(
@@ -1811,13 +2675,287 @@ async def push_updates(
             ),
         ) from exc
     return {
-        "source_ip": source_ip,
-        "source_settings_sha256": source_settings_sha256,
+        "source_ip": batch.source_ip,
+        "source_settings_sha256": batch.source_settings_sha256,
         "receipt_id": receipt["receipt_id"],
         "results": results,
     }
 
 
+@app.post("/push-updates", response_model=None)
+async def push_updates(
+    request: PushUpdateRequest,
+    x_magewell_operator_intent: str | None = Header(None),
+    origin: str | None = Header(None),
+    stream: bool = False,
+) -> dict[str, Any] | StreamingResponse:
+    """Write the frozen profile to each target exactly once, a bounded window at a time.
+
+    With ``stream`` the response is NDJSON: a ``started`` line, one ``result`` line
+    per target as its import completes, then ``finished`` with the same summary the
+    plain response returns (or ``failed`` if the receipt could not be finalized).
+    """
+    require_operator_intent(x_magewell_operator_intent, origin)
+    batch = prepare_push_batch(request)
+    lock = get_mutation_lock()
+    if lock.locked():
+        raise HTTPException(status_code=409, detail="Another device update is already running.")
+    if not stream:
+        async with lock:
+            reserve_push_receipt(batch.receipt)
+            mutation_results = await run_push_batch(batch)
+        return finalize_push_batch(batch, mutation_results)
+    # The batch outlives this request: a closed browser tab must not abandon in-flight
+    # imports or leave the receipt without its mutation outcomes.
+    await lock.acquire()
+    try:
+        reserve_push_receipt(batch.receipt)
+    except HTTPException:
+        lock.release()
+        raise
+    events: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+    sent: set[int] = set()
+    landed: dict[int, dict[str, Any]] = {}
+
+    def stream_result(index: int, result: dict[str, Any]) -> None:
+        landed[index] = result
+        events.put_nowait(
+            {
+                "event": "result",
+                "index": index,
+                **result,
+                "expected_settings_sha256": batch.target_payloads[index][2],
+            }
+        )
+
+    async def run_streamed_batch() -> None:
+        mutation_results: list[dict[str, Any]] | None = None
+        failure: dict[str, Any] | None = None
+        try:
+            try:
+                mutation_results = await run_push_batch(
+                    batch, on_result=stream_result, on_start=sent.add
+                )
+            finally:
+                lock.release()
+        except Exception as exc:
+            logger.exception("Streamed push for receipt %s stopped", batch.receipt["receipt_id"])
+            failure = {"event": "failed", "detail": safe_device_error(exc)}
+        finally:
+            # The receipt is finalized however the batch ended. A target that was sent
+            # but never answered may still have applied its import; one still waiting
+            # for a push slot was never contacted.
+            if mutation_results is None:
+                mutation_results = [
+                    landed.get(index)
+                    or {
+                        "ip": device.ip,
+                        "magewell_id": device.magewell_id,
+                        "status": "failed",
+                        **(
+                            {
+                                "reason_code": "mutation-response-unknown",
+                                "error": "The push stopped before this target's result was known.",
+                            }
+                            if index in sent
+                            else {
+                                "reason_code": "device-request-failed",
+                                "error": "The push stopped before this target's import was sent.",
+                            }
+                        ),
+                    }
+                    for index, (device, _, _) in enumerate(batch.target_payloads)
+                ]
+            try:
+                summary = finalize_push_batch(batch, mutation_results)
+                events.put_nowait(failure or {"event": "finished", **summary})
+            except HTTPException as exc:
+                events.put_nowait({"event": "failed", "detail": exc.detail})
+            events.put_nowait(None)
+
+    app.state.push_batch = asyncio.create_task(run_streamed_batch())
+
+    async def stream_events() -> AsyncIterator[bytes]:
+        started = {
+            "event": "started",
+            "receipt_id": batch.receipt["receipt_id"],
+            "source_ip": batch.source_ip,
+            "source_settings_sha256": batch.source_settings_sha256,
+            "target_count": len(batch.target_payloads),
+            "concurrency": get_push_concurrency(),
+        }
+        yield canonical_json(started) + b"\n"
+        while (event := await events.get()) is not None:
+            yield canonical_json(event) + b"\n"
+
+    return StreamingResponse(stream_events(), media_type="application/x-ndjson")
+
+
+def get_push_verify_jobs() -> OrderedDict[str, dict[str, Any]]:
+    jobs = getattr(app.state, "push_verify_jobs", None)
+    if jobs is None:
+        jobs = OrderedDict()
+        app.state.push_verify_jobs = jobs
+    return jobs
+
+
+def public_push_verify_job(job: dict[str, Any], after: int = 0) -> dict[str, Any]:
+    return {
+        **{key: value for key, value in job.items() if key not in ("events", "task")},
+        "events": job["events"][after:],
+        "next_event": len(job["events"]),
+    }
+
+
+async def run_push_verify_job(job: dict[str, Any], batch: PushBatch, lock: asyncio.Lock) -> None:
+    """Push every target, verifying each one as soon as its own import is accepted.
+
+    Runs with the mutation lock already held and releases it only after the last
+    settle read, so no other write can start while targets are still settling.
+    Imports and settle reads share one ``PUSH_CONCURRENCY`` window; queued imports
+    take free slots ahead of settle reads that start later.
+    """
+    verifications: dict[int, asyncio.Task[dict[str, Any]]] = {}
+    semaphore = asyncio.Semaphore(get_push_concurrency())
+    mutations_recorded = asyncio.Event()
+
+    async def verify_target(
+        session: aiohttp.ClientSession, index: int, device: DeviceSelection, expected: str
+    ) -> dict[str, Any]:
+        async with semaphore:
+            verification_record, result = await read_back_target(
+                session,
+                device.ip,
+                device.magewell_id,
+                expected,
+                batch.control_settings,
+                batch.cached_devices[device.ip],
+                batch.username,
+                batch.password,
+            )
+        job["events"].append({"event": "verified", "index": index, **result})
+        # A verification can only be journaled on top of the recorded mutation outcomes.
+        await mutations_recorded.wait()
+        try:
+            get_profile_run_receipt_store().record_verification_outcome(
+                batch.receipt["receipt_id"],
+                ip=device.ip,
+                magewell_id=device.magewell_id,
+                verification=verification_record,
+            )
+        except ReceiptSafetyError as exc:
+            logger.error(
+                "Profile-run verification receipt could not be finalized for %s", device.ip
+            )
+            raise HTTPException(
+                status_code=503,
+                detail="Verification completed but durable receipt finalization failed; stop and inspect devices.",
+            ) from exc
+        return result
+
+    try:
+        connector = aiohttp.TCPConnector(ssl=False, family=socket.AF_INET)
+        async with aiohttp.ClientSession(connector=connector) as session:
+
+            def start_verification(index: int, result: dict[str, Any]) -> None:
+                device, _, expected = batch.target_payloads[index]
+                job["events"].append(
+                    {
+                        "event": "pushed",
+                        "index": index,
+                        **result,
+                        "expected_settings_sha256": expected,
+                    }
+                )
+                if result["status"] == "updated":
+                    verifications[index] = asyncio.create_task(
+                        verify_target(session, index, device, expected)
+                    )
+
+            try:
+                mutation_results = await run_push_batch(
+                    batch, on_result=start_verification, semaphore=semaphore
+                )
+                summary = finalize_push_batch(batch, mutation_results)
+                mutations_recorded.set()
+                verified = await asyncio.gather(*verifications.values())
+            finally:
+                # Settle reads are never left running once the lock is released.
+                for verification in verifications.values():
+                    verification.cancel()
+                await asyncio.gather(*verifications.values(), return_exceptions=True)
+                lock.release()
+        for index, result in zip(verifications, verified):
+            summary["results"][index]["verification"] = result
+        job["summary"] = summary
+        job["status"] = "finished"
+    except HTTPException as exc:
+        job["status"] = "failed"
+        job["error"] = exc.detail
+    except Exception:
+        logger.exception("Push-and-verify job %s stopped unexpectedly", job["job_id"])
+        job["status"] = "failed"
+        job["error"] = "The job stopped unexpectedly; inspect devices before any retry."
+    finally:
+        job["finished_at"] = datetime.now(UTC).isoformat()
+        job["events"].append({"event": job["status"]})
+
+
+@app.post("/push-verify-jobs")
+async def start_push_verify_job(
+    request: PushUpdateRequest,
+    x_magewell_operator_intent: str | None = Header(None),
+    origin: str | None = Header(None),
+) -> dict[str, Any]:
+    """Start a background push whose targets are each verified right after their import.
+
+    Poll ``GET /push-verify-jobs/{job_id}`` for progress; the job keeps running if
+    the browser goes away, and both outcomes land in the same receipt.
+    """
+    require_operator_intent(x_magewell_operator_intent, origin)
+    batch = prepare_push_batch(request)
+    lock = get_mutation_lock()
+    if lock.locked():
+        raise HTTPException(status_code=409, detail="Another device update is already running.")
+    await lock.acquire()
+    try:
+        reserve_push_receipt(batch.receipt)
+    except HTTPException:
+        lock.release()
+        raise
+    job: dict[str, Any] = {
+        "job_id": uuid.uuid4().hex,
+        "receipt_id": batch.receipt["receipt_id"],
+        "status": "running",
+        "started_at": datetime.now(UTC).isoformat(),
+        "finished_at": None,
+        "target_count": len(batch.target_payloads),
+        "concurrency": get_push_concurrency(),
+        "summary": None,
+        "error": None,
+        "events": [],
+    }
+    jobs = get_push_verify_jobs()
+    jobs[job["job_id"]] = job
+    while len(jobs) > PUSH_VERIFY_JOB_HISTORY:
+        oldest = next(iter(jobs.values()))
+        if oldest["status"] == "running":
+            break
+        jobs.popitem(last=False)
+    job["task"] = asyncio.create_task(run_push_verify_job(job, batch, lock))
+    return public_push_verify_job(job)
+
+
+@app.get("/push-verify-jobs/{job_id}")
+async def get_push_verify_job(
+    job_id: str, after: int = Query(0, ge=0, description="Return events after this cursor")
+) -> dict[str, Any]:
+    job = get_push_verify_jobs().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown push-and-verify job.")
+    return public_push_verify_job(job, after)
+
+
 @app.get("/profile-run-receipts")
 async def list_profile_run_receipts(limit: int = Query(20, ge=1, le=100)) -> dict[str, Any]:
     """Inspect redacted, local receipt summaries without any device network access."""
@@ -1839,6 +2977,49 @@ async def profile_run_receipt_export_manifest() -> dict[str, Any]:
         ) from None
 
 
+def receipt_query_timestamp(value: datetime | None) -> str | None:
+    """Render a query bound in the journal's own sortable UTC timestamp format."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).isoformat(timespec="microseconds").replace("+00:00", "Z")
+
+
+@app.get("/profile-run-receipts/query")
+async def query_profile_run_receipts(
+    receipt_id: str | None = Query(None, pattern=r"^[a-f0-9]{32}$"),
+    serial: str | None = Query(None, min_length=1, max_length=64),
+    eth_mac: str | None = Query(None, pattern=r"^[0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5}$"),
+    fleet_id: str | None = Query(None, pattern=r"^AIO-\d{2}$"),
+    since: datetime | None = Query(None, description="Inclusive UTC lower bound"),
+    until: datetime | None = Query(None, description="Inclusive UTC upper bound"),
+) -> StreamingResponse:
+    """Stream matching redacted journal events as NDJSON without any device network access."""
+    filters = {
+        field: value
+        for field, value in (
+            ("receipt_id", receipt_id),
+            ("serial", serial),
+            ("eth_mac", eth_mac),
+            ("fleet_id", fleet_id),
+        )
+        if value
+    }
+    try:
+        events = get_profile_run_receipt_store().query_events(
+            filters=filters,
+            since=receipt_query_timestamp(since),
+            until=receipt_query_timestamp(until),
+        )
+    except ReceiptSafetyError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from None
+    return StreamingResponse(
+        (canonical_json(event) + b"\n" for event in events),
+        media_type="application/x-ndjson",
+    )
+
+
 @app.get("/profile-run-receipts/{receipt_id}")
 async def get_profile_run_receipt(receipt_id: str) -> dict[str, Any]:
     try:
@@ -1847,51 +3028,27 @@ async def get_profile_run_receipt(receipt_id: str) -> dict[str, Any]:
         raise HTTPException(status_code=404, detail=str(exc)) from None
 
 
-@app.post("/verify-target")
-async def verify_target(
-    request: VerifyTargetRequest,
-    x_magewell_operator_intent: str | None = Header(None),
-    origin: str | None = Header(None),
+async def run_target_verification(
+    ip: str,
+    magewell_id: str,
+    receipt_id: str | None,
+    expected: str,
+    control_settings: dict[str, Any],
+    cached_device: DeviceRecord,
+    username: str,
+    password: str,
 ) -> dict[str, Any]:
-    require_operator_intent(x_magewell_operator_intent, origin)
-    username, password = get_device_credentials()
-    ip = validate_device_ip(request.device.ip)
-    cached_device = next(
-        (item for item in getattr(app.state, "devices", []) if item["ip"] == ip),
-        None,
-    )
-    if not cached_device or request.device.magewell_id != cached_device.get("name"):
-        raise HTTPException(status_code=400, detail="Verification target identity mismatch.")
-    if ip == getattr(app.state, "control_device_ip", None):
-        raise HTTPException(
-            status_code=400, detail="The control source is not a verification target."
-        )
-    control_settings = getattr(app.state, "control_settings", None)
-    if not control_settings:
-        raise HTTPException(status_code=400, detail="Select and freeze a control source first.")
-    try:
-        expected_settings = get_bulk_update_settings(
-            request.device.magewell_id,
-            control_settings,
-            cached_device["settings"],
-        )
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Verification target is not profile-compatible: {exc}",
-        ) from None
-    expected = settings_fingerprint(expected_settings)
+    """Poll one target until it reports the expected profile and record the outcome."""
     receipt_store: ProfileRunReceiptStore | None = None
-    if request.receipt_id:
+    if receipt_id:
         try:
             receipt_store = get_profile_run_receipt_store()
-            durable_receipt = receipt_store.get_receipt(request.receipt_id)
+            durable_receipt = receipt_store.get_receipt(receipt_id)
             receipt_target = next(
                 (
                     target
                     for target in durable_receipt.get("targets", [])
-                    if target.get("ip") == ip
-                    and target.get("magewell_id") == request.device.magewell_id
+                    if target.get("ip") == ip and target.get("magewell_id") == magewell_id
                 ),
                 None,
             )
@@ -1914,81 +3071,165 @@ async def verify_target(
         except ReceiptSafetyError as exc:
             raise HTTPException(status_code=409, detail=str(exc)) from None
     connector = aiohttp.TCPConnector(ssl=False, family=socket.AF_INET)
-    verification_attempts = 0
-    try:
-        async with aiohttp.ClientSession(connector=connector) as session:
-            actual = ""
-            verification_attempts = 0
-            # Magewell may acknowledge a settings import before its next report reflects
-            # every applied field. Polling remains read-only; a longer settle window avoids
-            # treating a still-applying target as a failed write.
-            for verification_attempts in range(1, 7):
-                report = await get_device_report_with_login(
-                    session, ip, username, password, timeout=10.0
-                )
-                actual = settings_fingerprint(report)
-                if actual == expected:
-                    break
-                if verification_attempts < 6:
-                    await asyncio.sleep(2)
-    except Exception as exc:
-        error = safe_device_error(exc)
-        logger.error(
-            "Verification read failed for %s (%s): %s", request.device.magewell_id, ip, error
+    async with aiohttp.ClientSession(connector=connector) as session:
+        verification_record, result = await read_back_target(
+            session, ip, magewell_id, expected, control_settings, cached_device, username, password
         )
-        if receipt_store and request.receipt_id:
-            try:
-                receipt_store.record_verification_outcome(
-                    request.receipt_id,
-                    ip=ip,
-                    magewell_id=request.device.magewell_id,
-                    verification={
-                        "status": "unavailable",
-                        "reason_code": "verification-read-failed",
-                        "attempts": verification_attempts,
-                    },
-                )
-            except ReceiptSafetyError as receipt_exc:
-                logger.error("Profile-run verification receipt could not be finalized for %s", ip)
-                raise HTTPException(
-                    status_code=503,
-                    detail=(
-                        "Verification read failed and durable receipt finalization also failed; "
-                        "stop and inspect devices."
-                    ),
-                ) from receipt_exc
-        raise HTTPException(status_code=502, detail=error) from None
-    if receipt_store and request.receipt_id:
+    if receipt_store and receipt_id:
         try:
             receipt_store.record_verification_outcome(
-                request.receipt_id,
+                receipt_id,
                 ip=ip,
-                magewell_id=request.device.magewell_id,
-                verification={
-                    "status": "verified" if actual == expected else "mismatch",
-                    "reason_code": "matches-expected-profile"
-                    if actual == expected
-                    else "readback-mismatch",
-                    "attempts": verification_attempts,
-                    "actual_settings_sha256": actual,
-                },
+                magewell_id=magewell_id,
+                verification=verification_record,
             )
         except ReceiptSafetyError as exc:
+            logger.error("Profile-run verification receipt could not be finalized for %s", ip)
             raise HTTPException(
                 status_code=503,
-                detail="Verification completed but durable receipt finalization failed; stop and inspect devices.",
+                detail=(
+                    "Verification read failed and durable receipt finalization also failed; "
+                    "stop and inspect devices."
+                    if "error" in result
+                    else "Verification completed but durable receipt finalization failed; "
+                    "stop and inspect devices."
+                ),
             ) from exc
+    if "error" in result:
+        raise HTTPException(status_code=502, detail=result["error"])
+    if receipt_id:
+        result["receipt_id"] = receipt_id
+    return result
+
+
+async def read_back_target(
+    session: aiohttp.ClientSession,
+    ip: str,
+    magewell_id: str,
+    expected: str,
+    control_settings: dict[str, Any],
+    cached_device: DeviceRecord,
+    username: str,
+    password: str,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Poll one target's report over the settle window without writing anything.
+
+    Returns the receipt verification record and the operator-facing result; a failed
+    read yields an ``unavailable`` record and a result carrying ``error``.
+    """
+    actual = ""
+    verification_attempts = 0
+    try:
+        # Magewell may acknowledge a settings import before its next report reflects
+        # every applied field. Polling remains read-only; a longer settle window avoids
+        # treating a still-applying target as a failed write.
+        async for verification_attempts in settle_poll_attempts():
+            report = await get_device_report_with_login(
+                session, ip, username, password, timeout=10.0
+            )
+            actual = report_fingerprint(report)
+            if actual == expected:
+                break
+    except Exception as exc:
+        error = safe_device_error(exc)
+        logger.error("Verification read failed for %s (%s): %s", magewell_id, ip, error)
+        unavailable = {
+            "status": "unavailable",
+            "reason_code": "verification-read-failed",
+            "attempts": verification_attempts,
+        }
+        return unavailable, {
+            "ip": ip,
+            "magewell_id": magewell_id,
+            "expected_settings_sha256": expected,
+            "matches_expected_profile": False,
+            "verification_attempts": verification_attempts,
+            "error": error,
+        }
+    mismatched_sections: list[str] | None = None
+    if actual != expected:
+        # Section names only: the expected digest tree is composed from the cached
+        # source and target subtrees, so just the final readback is rehashed.
+        expected_tree = bulk_update_settings_tree(
+            frozen_control_settings_tree(control_settings),
+            cached_device.settings_tree,
+        )
+        mismatched_sections = differing_sections(expected_tree, build_settings_tree(report))
+    verification_record: dict[str, Any] = {
+        "status": "verified" if actual == expected else "mismatch",
+        "reason_code": "matches-expected-profile" if actual == expected else "readback-mismatch",
+        "attempts": verification_attempts,
+        "actual_settings_sha256": actual,
+    }
+    if mismatched_sections is not None:
+        verification_record["differing_sections"] = mismatched_sections
     result = {
         "ip": ip,
-        "magewell_id": request.device.magewell_id,
+        "magewell_id": magewell_id,
         "expected_settings_sha256": expected,
         "actual_settings_sha256": actual,
         "matches_expected_profile": actual == expected,
         "verification_attempts": verification_attempts,
     }
-    if request.receipt_id:
-        result["receipt_id"] = request.receipt_id
-    return result
+    if mismatched_sections is not None:
+        result["differing_sections"] = mismatched_sections
+    return verification_record, result
+
+
+@app.post("/verify-target")
+async def verify_target(
+    request: VerifyTargetRequest,
+    x_magewell_operator_intent: str | None = Header(None),
+    origin: str | None = Header(None),
+) -> dict[str, Any]:
+    require_operator_intent(x_magewell_operator_intent, origin)
+    username, password = get_device_credentials()
+    ip = validate_device_ip(request.device.ip)
+    cached_device = next(
+        (item for item in getattr(app.state, "devices", []) if item["ip"] == ip),
+        None,
+    )
+    if not cached_device or request.device.magewell_id != cached_device.get("name"):
+        raise HTTPException(status_code=400, detail="Verification target identity mismatch.")
+    if ip == getattr(app.state, "control_device_ip", None):
+        raise HTTPException(
+            status_code=400, detail="The control source is not a verification target."
+        )
+    control_settings = getattr(app.state, "control_settings", None)
+    if not control_settings:
+        raise HTTPException(status_code=400, detail="Select and freeze a control source first.")
+    try:
+        expected_settings = get_bulk_update_settings(
+            request.device.magewell_id,
+            control_settings,
+            cached_device["settings"],
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Verification target is not profile-compatible: {exc}",
+        ) from None
+    expected = settings_fingerprint(expected_settings)
+    try:
+        return await get_single_flight().run(
+            ("verify-target", ip),
+            (request.device.magewell_id, expected, request.receipt_id),
+            lambda: run_target_verification(
+                ip,
+                request.device.magewell_id,
+                request.receipt_id,
+                expected,
+                control_settings,
+                cached_device,
+                username,
+                password,
+            ),
+        )
+    except SingleFlightConflict:
+        raise HTTPException(
+            status_code=409,
+            detail="A different verification read of this device is already running.",
+        ) from None
 
 
 @app.post("/bulk-update")
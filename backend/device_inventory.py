@@ -0,0 +1,240 @@
+from collections.abc import Iterator, Mapping
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Any, NoReturn
+from weakref import WeakValueDictionary
+
+from .fleet_journal import current_name_matches_fleet_id
+from .settings_tree import SettingsTree, build_settings_tree, settings_fingerprint
+
+
+def _read_only(*args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError("Cached scan settings are read-only; build a new inventory record instead.")
+
+
+class FrozenSettings(dict):
+    """A settings mapping that rejects in-place mutation after a scan caches it.
+
+    It stays a ``dict`` so JSON encoding, fingerprints, and ``isinstance`` checks
+    behave exactly as before; ``deepcopy`` returns a plain mutable copy, which is
+    what profile merges and rename payload builders start from.
+    """
+
+    __slots__ = ("__weakref__",)
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        return {key: deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self) -> tuple[type, tuple[dict[str, Any]]]:
+        return (type(self), (dict(self),))
+
+
+class FrozenSettingsList(list):
+    """List counterpart of :class:`FrozenSettings` for array-valued settings."""
+
+    __slots__ = ("__weakref__",)
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __copy__(self) -> list[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[Any]:
+        return [deepcopy(value, memo) for value in self]
+
+    def __reduce__(self) -> tuple[type, tuple[list[Any]]]:
+        return (type(self), (list(self),))
+
+
+class ParsedReport(FrozenSettings):
+    """Freshly read report settings that carry the digests computed while parsing.
+
+    Being read-only is what makes the carried digests trustworthy: nothing can
+    change the settings after the worker hashed them. Sections are frozen through
+    the interning table by those digests, so nothing here is hashed again.
+    """
+
+    __slots__ = ("settings_sha256", "settings_tree")
+
+    def __init__(
+        self, settings: Mapping[str, Any], settings_sha256: str, settings_tree: SettingsTree
+    ) -> None:
+        super().__init__(
+            {
+                key: _intern_value(value, settings_tree.children[str(key)])
+                for key, value in settings.items()
+            }
+        )
+        self.settings_sha256 = settings_sha256
+        self.settings_tree = settings_tree
+
+    def __reduce__(self) -> tuple[type, tuple[dict[str, Any], str, SettingsTree]]:
+        return (type(self), (dict(self), self.settings_sha256, self.settings_tree))
+
+
+def report_fingerprint(settings: Mapping[str, Any]) -> str:
+    """Return a report's settings fingerprint, reusing the one computed while parsing."""
+    if isinstance(settings, ParsedReport):
+        return settings.settings_sha256
+    return settings_fingerprint(settings)
+
+
+def freeze_settings(value: Any) -> Any:
+    """Return a read-only copy of a parsed settings value, reusing frozen subtrees."""
+    if isinstance(value, FrozenSettings | FrozenSettingsList):
+        return value
+    if isinstance(value, dict):
+        return FrozenSettings({key: freeze_settings(child) for key, child in value.items()})
+    if isinstance(value, list):
+        return FrozenSettingsList(freeze_settings(child) for child in value)
+    return value
+
+
+# Hash-consed settings containers and digest nodes, keyed by subtree SHA-256. Weak
+# values let an entry disappear once no cached record, frozen source, or rename plan
+# refers to it, so resident settings scale with distinct configurations, not devices.
+# Subtree digests ignore key order, so containers are also keyed by their own key order:
+# a shared mapping always serializes exactly as every device that holds it reported it.
+_interned_settings: WeakValueDictionary[tuple[str, tuple[str, ...]], Any] = WeakValueDictionary()
+_interned_trees: WeakValueDictionary[str, SettingsTree] = WeakValueDictionary()
+
+
+def _intern_tree(tree: SettingsTree) -> SettingsTree:
+    shared = _interned_trees.get(tree.sha256)
+    if shared is None:
+        shared = SettingsTree(
+            sha256=tree.sha256,
+            kind=tree.kind,
+            children={key: _intern_tree(child) for key, child in tree.children.items()},
+        )
+        _interned_trees[tree.sha256] = shared
+    return shared
+
+
+def _intern_key(value: Any, tree: SettingsTree) -> tuple[str, tuple[str, ...]]:
+    return tree.sha256, tuple(value) if tree.kind == "dict" else ()
+
+
+def _intern_value(value: Any, tree: SettingsTree) -> Any:
+    if tree.kind == "leaf":
+        return value
+    key = _intern_key(value, tree)
+    shared = _interned_settings.get(key)
+    if shared is None:
+        if tree.kind == "list":
+            shared = FrozenSettingsList(
+                _intern_value(child, tree.children[str(index)]) for index, child in enumerate(value)
+            )
+        else:
+            shared = FrozenSettings(
+                {key: _intern_value(child, tree.children[str(key)]) for key, child in value.items()}
+            )
+        _interned_settings[key] = shared
+    return shared
+
+
+def intern_settings(value: Any) -> tuple[Any, SettingsTree]:
+    """Return shared frozen settings and their digest tree.
+
+    Identical subtrees anywhere in the fleet resolve to the same objects, so a
+    profile cloned onto hundreds of encoders is held once. Mappings are shared only
+    with subtrees that list their keys in the same order, so interned settings are
+    safe to send back to a device.
+    """
+    tree = value.settings_tree if isinstance(value, ParsedReport) else build_settings_tree(value)
+    return _intern_value(value, tree), _intern_tree(tree)
+
+
+# Keys exposed through the mapping interface, matching the pre-record inventory dicts.
+_MAPPING_FIELDS = ("ip", "name", "settings", "identity", "read_error", "identity_error")
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class DeviceRecord(Mapping[str, Any]):
+    """One latest-scan inventory entry with its derived views computed once.
+
+    Records still read like the original inventory dicts (``device["ip"]``,
+    ``device.get("identity")``) so request handlers need no special casing,
+    but nothing about a cached scan can be changed after it is recorded.
+    """
+
+    ip: str
+    name: str = ""
+    settings: Mapping[str, Any] = field(default_factory=FrozenSettings)
+    identity: Mapping[str, Any] | None = None
+    read_error: str | None = None
+    identity_error: str | None = None
+    settings_sha256: str = field(init=False)
+    settings_tree: SettingsTree = field(init=False)
+    identity_key: tuple[Any, Any, Any] | None = field(init=False)
+    public_view: Mapping[str, Any] = field(init=False)
+    inventory_entry: Mapping[str, Any] = field(init=False)
+
+    def __post_init__(self) -> None:
+        settings, settings_tree = intern_settings(self.settings)
+        identity = freeze_settings(self.identity) if isinstance(self.identity, dict) else None
+        identity_key = (
+            (identity.get("serial"), identity.get("eth_mac"), identity.get("fleet_id"))
+            if identity is not None
+            else None
+        )
+        public_view: dict[str, Any] = {"ip": self.ip, "name": self.name}
+        if self.read_error:
+            public_view["read_error"] = self.read_error
+        if identity:
+            serial, eth_mac, fleet_id = identity_key
+            public_view["serial"] = serial
+            public_view["eth_mac"] = eth_mac
+            public_view["fleet_id"] = fleet_id or ""
+            if fleet_id:
+                public_view["name_journal_mismatch"] = not current_name_matches_fleet_id(
+                    self.name, fleet_id
+                )
+        if self.identity_error:
+            public_view["identity_error"] = self.identity_error
+        inventory_entry = {
+            "ip": self.ip,
+            "magewell_id": self.name,
+            "identity": (
+                dict(zip(("serial", "eth_mac", "fleet_id"), identity_key))
+                if identity_key is not None
+                else None
+            ),
+            "identity_error": bool(self.identity_error),
+            "read_error": bool(self.read_error),
+        }
+        derived = {
+            "settings": settings,
+            "identity": identity,
+            "settings_sha256": report_fingerprint(self.settings),
+            "settings_tree": settings_tree,
+            "identity_key": identity_key,
+            "public_view": FrozenSettings(public_view),
+            "inventory_entry": freeze_settings(inventory_entry),
+        }
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _MAPPING_FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in _MAPPING_FIELDS if getattr(self, key) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __copy__(self) -> "DeviceRecord":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "DeviceRecord":
+        return self
@@ -0,0 +1,127 @@
+"""Per-device request pacing that protects the encoders' embedded web server.
+
+Every HTTP request or TCP probe sent to an encoder first takes a token from two
+buckets: one for the device as a whole and one for the call class. Scans, verify
+polls, rename readbacks, and firmware polls that overlap on the same unit queue
+behind each other instead of stacking up on its web server. A token that is not
+yet available is reserved rather than raced for, so callers are served in
+arrival order and a bucket's deficit is exactly its queue.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+# (tokens per second, burst). A scan costs one probe, two logins, and two reads per
+# device; verify and firmware polls are reads; mutations are already serialized.
+CALL_CLASS_LIMITS: dict[str, tuple[float, int]] = {
+    "probe": (2.0, 2),
+    "login": (2.0, 3),
+    "read": (3.0, 4),
+    "mutation": (1.0, 2),
+}
+DEVICE_LIMIT: tuple[float, int] = (5.0, 6)
+MAX_TRACKED_DEVICES = 4096
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: int, now: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """Take one token, returning how long the caller must wait before using it."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def refund(self) -> None:
+        """Return a reserved token whose request was abandoned before it was sent."""
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+
+@dataclass
+class CallClassMetrics:
+    requests: int = 0
+    delayed: int = 0
+    waiting: int = 0
+    max_waiting: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "requests": self.requests,
+            "delayed": self.delayed,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+        }
+
+
+@dataclass
+class _DeviceBuckets:
+    device: TokenBucket
+    classes: dict[str, TokenBucket] = field(default_factory=dict)
+
+
+class DeviceRateLimiter:
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self._devices: OrderedDict[str, _DeviceBuckets] = OrderedDict()
+        self._metrics = {call_class: CallClassMetrics() for call_class in CALL_CLASS_LIMITS}
+
+    async def acquire(self, ip: str, call_class: str) -> float:
+        """Wait for this device's turn for one ``call_class`` request; return the wait."""
+        now = self._clock()
+        buckets = self._devices.pop(ip, None) or _DeviceBuckets(TokenBucket(*DEVICE_LIMIT, now))
+        self._devices[ip] = buckets
+        while len(self._devices) > MAX_TRACKED_DEVICES:
+            self._devices.popitem(last=False)
+        bucket = buckets.classes.get(call_class)
+        if bucket is None:
+            bucket = buckets.classes[call_class] = TokenBucket(*CALL_CLASS_LIMITS[call_class], now)
+        wait = max(buckets.device.reserve(now), bucket.reserve(now))
+        metrics = self._metrics[call_class]
+        metrics.requests += 1
+        if wait <= 0:
+            return 0.0
+        metrics.delayed += 1
+        metrics.total_wait_seconds += wait
+        metrics.max_wait_seconds = max(metrics.max_wait_seconds, wait)
+        metrics.waiting += 1
+        metrics.max_waiting = max(metrics.max_waiting, metrics.waiting)
+        try:
+            await self._sleep(wait)
+        except asyncio.CancelledError:
+            # A cancelled caller never sends its request, so later callers inherit its slot.
+            buckets.device.refund()
+            bucket.refund()
+            raise
+        finally:
+            metrics.waiting -= 1
+        return wait
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            "device_limit": {"per_second": DEVICE_LIMIT[0], "burst": DEVICE_LIMIT[1]},
+            "class_limits": {
+                call_class: {"per_second": rate, "burst": burst}
+                for call_class, (rate, burst) in CALL_CLASS_LIMITS.items()
+            },
+            "tracked_devices": len(self._devices),
+            "classes": {
+                call_class: metrics.as_dict() for call_class, metrics in self._metrics.items()
+            },
+        }
@@ -1,5 +1,6 @@
 import asyncio
 import copy
+import csv
 import hashlib
 import ipaddress
 import json
@@ -7,8 +8,8 @@ import logging
 import os
 import re
 import stat
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, BinaryIO
@@ -16,13 +17,17 @@ from typing import Any, BinaryIO
 import aiohttp
 
 from .app import (
+    allowed_network_for,
+    allowed_scope_label,
     enabled_effect_modes,
-    get_allowed_network,
     get_device_credentials,
+    get_device_rate_limiter,
     get_device_report_with_login,
     import_settings_call,
     login_device,
     md5_hash,
+    ping_magewell,
+    safe_device_error,
     settings_fingerprint,
 )
 
@@ -32,6 +37,14 @@ EXPECTED_MODULE = "Ultra Encode AIO"
 EXPECTED_HARDWARE = "B"
 EXPECTED_PRODUCT_ID = 787
 DEFAULT_RECOVERY_ROOT = Path("/var/lib/magewell-firmware-recovery")
+DEFAULT_CAMPAIGN_LOOKAHEAD = 3
+ARTIFACT_HASH_CHUNK_BYTES = 1024 * 1024
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+# Post-install polling intervals per readiness stage: an offline unit costs only a TCP
+# connect attempt, and a unit whose web server is listening is pinged more often so the
+# authenticated verification starts soon after it answers.
+READINESS_POLL_SECONDS = {"offline": 2.0, "port-open": 1.0}
+CAMPAIGN_TARGET_FIELDS = ("ip", "expected_name", "expected_serial", "expected_eth_mac")
 REPOSITORY_ROOT = Path(__file__).resolve().parents[1]
 
 STATUS_FIRST_BOOT = 0x01
@@ -116,6 +129,14 @@ class ValidatedArtifact:
         }
 
 
+@dataclass(frozen=True)
+class CampaignTarget:
+    ip: str
+    expected_name: str
+    expected_serial: str
+    expected_eth_mac: str
+
+
 APPROVED_FIRMWARE = {
     (EXPECTED_MODULE, EXPECTED_HARDWARE, EXPECTED_PRODUCT_ID, "2.4.288"): FirmwareManifestEntry(
         module=EXPECTED_MODULE,
@@ -145,10 +166,9 @@ def validate_target_ip(raw_ip: str) -> str:
         address = ipaddress.ip_address(raw_ip)
     except ValueError as exc:
         raise FirmwareSafetyError(f"Invalid device IP: {raw_ip}") from exc
-    allowed_network = get_allowed_network()
-    if address.version != 4 or address not in allowed_network:
+    if address.version != 4 or allowed_network_for(address) is None:
         raise FirmwareSafetyError(
-            f"Device IP {raw_ip} is outside ALLOWED_SUBNET ({allowed_network})."
+            f"Device IP {raw_ip} is outside ALLOWED_SUBNET ({allowed_scope_label()})."
         )
     return str(address)
 
@@ -180,8 +200,107 @@ def approved_manifest(target_version: str) -> FirmwareManifestEntry:
         ) from exc
 
 
+class ValidatedArtifactPayload(aiohttp.payload.Payload):
+    """Upload body that streams the validated descriptor with positional reads.
+
+    ``os.pread`` never moves the shared file offset and avoids the buffered reader's
+    extra copy; the fixed manifest size keeps an exact multipart ``Content-Length``.
+    """
+
+    def __init__(
+        self,
+        artifact: ValidatedArtifact,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> None:
+        super().__init__(artifact.file, content_type="application/octet-stream")
+        self._artifact = artifact
+        self._size = artifact.manifest.size
+        self._progress = progress
+
+    def decode(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        raise TypeError("Firmware artifacts are binary and are never decoded.")
+
+    async def write(self, writer: Any) -> None:
+        await self.write_with_length(writer, None)
+
+    async def write_with_length(self, writer: Any, content_length: int | None) -> None:
+        loop = asyncio.get_running_loop()
+        descriptor = self._artifact.file.fileno()
+        total = self._size if content_length is None else min(self._size, content_length)
+        offset = 0
+        while offset < total:
+            chunk = await loop.run_in_executor(
+                None, os.pread, descriptor, min(UPLOAD_CHUNK_BYTES, total - offset), offset
+            )
+            if not chunk:
+                raise FirmwareSafetyError("Firmware artifact ended before its approved size.")
+            await writer.write(chunk)
+            offset += len(chunk)
+            if self._progress is not None:
+                self._progress(offset, self._size)
+
+
+# Validated digests keyed by (device, inode); re-hashing happens only when size, mtime or
+# ctime change.  A durable copy keyed by the manifest digest lives below the recovery root.
+_verified_artifact_digests: dict[tuple[int, int], dict[str, Any]] = {}
+
+
+def _artifact_file_identity(file_stat: os.stat_result) -> dict[str, Any]:
+    return {
+        "device": file_stat.st_dev,
+        "inode": file_stat.st_ino,
+        "size": file_stat.st_size,
+        "mtime_ns": file_stat.st_mtime_ns,
+        "ctime_ns": file_stat.st_ctime_ns,
+    }
+
+
+def _hash_artifact(firmware_file: BinaryIO) -> str:
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: firmware_file.read(ARTIFACT_HASH_CHUNK_BYTES), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cached_artifact_digest(
+    file_stat: os.stat_result, manifest: FirmwareManifestEntry, digest_cache_dir: Path | None
+) -> bool:
+    record = {**_artifact_file_identity(file_stat), "sha256": manifest.sha256}
+    if _verified_artifact_digests.get((file_stat.st_dev, file_stat.st_ino)) == record:
+        return True
+    if digest_cache_dir is None:
+        return False
+    try:
+        durable = json.loads((digest_cache_dir / f"{manifest.sha256}.json").read_text("utf-8"))
+    except (OSError, ValueError):
+        return False
+    if durable != record:
+        return False
+    _verified_artifact_digests[(file_stat.st_dev, file_stat.st_ino)] = record
+    return True
+
+
+def _record_artifact_digest(
+    file_stat: os.stat_result, manifest: FirmwareManifestEntry, digest_cache_dir: Path | None
+) -> None:
+    record = {**_artifact_file_identity(file_stat), "sha256": manifest.sha256}
+    _verified_artifact_digests[(file_stat.st_dev, file_stat.st_ino)] = record
+    # Never create the recovery root just for the cache; it must exist only once a device
+    # effect has actually been reserved.
+    if digest_cache_dir is None or not digest_cache_dir.parent.is_dir():
+        return
+    try:
+        _private_directory(digest_cache_dir)
+        _write_json_atomic(digest_cache_dir / f"{manifest.sha256}.json", record)
+    except OSError:
+        # The cache only saves a re-hash; an unwritable one falls back to hashing.
+        pass
+
+
 @contextmanager
-def open_validated_artifact(path: Path, target_version: str) -> Iterator[ValidatedArtifact]:
+def open_validated_artifact(
+    path: Path, target_version: str, *, digest_cache_dir: Path | None = None
+) -> Iterator[ValidatedArtifact]:
     manifest = approved_manifest(target_version)
     if path.name != manifest.filename or path.suffix.lower() != ".mwf":
         raise FirmwareSafetyError(
@@ -195,18 +314,17 @@ def open_validated_artifact(path: Path, target_version: str) -> Iterator[Validat
         file_stat = os.fstat(firmware_file.fileno())
         if not stat.S_ISREG(file_stat.st_mode):
             raise FirmwareSafetyError("Firmware artifact must be a regular file.")
-        digest = hashlib.sha256()
-        for chunk in iter(lambda: firmware_file.read(1024 * 1024), b""):
-            digest.update(chunk)
-        actual_sha256 = digest.hexdigest()
         if file_stat.st_size != manifest.size:
             raise FirmwareSafetyError(
                 f"Firmware size mismatch: expected {manifest.size}, got {file_stat.st_size}."
             )
-        if actual_sha256 != manifest.sha256:
-            raise FirmwareSafetyError(
-                f"Firmware SHA-256 mismatch: expected {manifest.sha256}, got {actual_sha256}."
-            )
+        if not _cached_artifact_digest(file_stat, manifest, digest_cache_dir):
+            actual_sha256 = _hash_artifact(firmware_file)
+            if actual_sha256 != manifest.sha256:
+                raise FirmwareSafetyError(
+                    f"Firmware SHA-256 mismatch: expected {manifest.sha256}, got {actual_sha256}."
+                )
+            _record_artifact_digest(file_stat, manifest, digest_cache_dir)
         firmware_file.seek(0)
         yield ValidatedArtifact(firmware_file, manifest, path)
     finally:
@@ -397,6 +515,7 @@ async def get_authenticated_json(
     *,
     timeout: float = 10.0,
 ) -> dict[str, Any]:
+    await get_device_rate_limiter().acquire(ip, "read")
     async with session.get(
         f"http://{ip}/usapi",
         params={"method": method},
@@ -478,11 +597,7 @@ def _write_json_atomic(path: Path, payload: dict[str, Any]) -> None:
             temporary.unlink()
 
 
-def acquire_effect_state(
-    recovery_root: Path,
-    preflight: dict[str, Any],
-    artifact: dict[str, Any],
-) -> Path:
+def validated_recovery_root(recovery_root: Path) -> Path:
     resolved = recovery_root.resolve()
     if (
         not resolved.is_absolute()
@@ -492,6 +607,15 @@ def acquire_effect_state(
         raise FirmwareSafetyError(
             "Firmware recovery state must use an absolute non-repository path."
         )
+    return resolved
+
+
+def acquire_effect_state(
+    recovery_root: Path,
+    preflight: dict[str, Any],
+    artifact: dict[str, Any],
+) -> Path:
+    resolved = validated_recovery_root(recovery_root)
     _private_directory(resolved)
     device_dir = resolved / _safe_identity_component(str(preflight["serial"]))
     run_dir = device_dir / str(artifact["sha256"])
@@ -550,20 +674,32 @@ def write_recovery_backup(
     return backup_path
 
 
+def log_upload_progress(ip: str) -> Callable[[int, int], None]:
+    """Return a reporter that logs each completed tenth of a firmware upload."""
+    reported = 0
+
+    def report(sent: int, total: int) -> None:
+        nonlocal reported
+        decile = sent * 10 // total if total else 10
+        if decile > reported:
+            reported = decile
+            logger.info("Firmware upload to %s is %d%% sent", ip, decile * 10)
+
+    return report
+
+
 async def upload_firmware_once(
     session: aiohttp.ClientSession,
     ip: str,
     cookie_header: str,
     artifact: ValidatedArtifact,
+    progress: Callable[[int, int], None] | None = None,
 ) -> dict[str, Any]:
-    artifact.file.seek(0)
-    form = aiohttp.FormData()
-    form.add_field(
-        "file",
-        artifact.file,
-        filename=artifact.manifest.filename,
-        content_type="application/octet-stream",
-    )
+    payload = ValidatedArtifactPayload(artifact, progress or log_upload_progress(ip))
+    payload.set_content_disposition("form-data", name="file", filename=artifact.manifest.filename)
+    form = aiohttp.MultipartWriter("form-data")
+    form.append_payload(payload)
+    await get_device_rate_limiter().acquire(ip, "mutation")
     try:
         async with session.post(
             f"http://{ip}/usapi",
@@ -594,6 +730,7 @@ async def start_firmware_update_once(
     ip: str,
     cookie_header: str,
 ) -> dict[str, Any]:
+    await get_device_rate_limiter().acquire(ip, "mutation")
     try:
         async with session.get(
             f"http://{ip}/usapi",
@@ -614,6 +751,27 @@ async def start_firmware_update_once(
     return result
 
 
+async def tcp_port_open(ip: str, port: int = 80, timeout: float = 2.0) -> bool:
+    await get_device_rate_limiter().acquire(ip, "probe")
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout)
+    except (OSError, TimeoutError):
+        return False
+    writer.close()
+    with suppress(OSError):
+        await writer.wait_closed()
+    return True
+
+
+async def readiness_stage(session: aiohttp.ClientSession, ip: str) -> str:
+    """Classify a rebooting device without credentials: offline, port-open, or ready."""
+    if not await tcp_port_open(ip):
+        return "offline"
+    if not await ping_magewell(session, ip, per_ip_timeout=2.0):
+        return "port-open"
+    return "ready"
+
+
 async def wait_for_verified_firmware(
     ip: str,
     expected_name: str,
@@ -628,48 +786,63 @@ async def wait_for_verified_firmware(
 ) -> tuple[dict[str, Any], dict[str, Any]]:
     deadline = asyncio.get_running_loop().time() + timeout_seconds
     last_error = "Device has not returned yet."
-    while asyncio.get_running_loop().time() < deadline:
-        await asyncio.sleep(poll_seconds)
-        try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=20.0)) as session:
-                cookie_header = await login_device(
-                    session,
-                    ip,
-                    username,
-                    md5_hash(password),
-                    expected_name,
-                )
-                info = await get_device_info(session, ip, cookie_header)
-                observed = validate_device_info(info, target_version)
-                if observed["serial"] != expected_serial or observed["eth_mac"] != expected_eth_mac:
-                    raise FirmwareSafetyError("Post-update immutable device identity mismatch.")
-                if not observed["already_current"]:
-                    last_error = f"Device returned on firmware {observed['firmware']!r}."
-                    continue
-                report = await get_device_report_with_login(
-                    session, ip, username, password, timeout=20.0
-                )
-                if report.get("name") != expected_name:
-                    raise FirmwareSafetyError("Post-update device display-name mismatch.")
-                status = await get_device_status(session, ip, cookie_header)
-                try:
-                    background_status_bits = assert_idle_status(status, post_update=True)
-                except FirmwareSafetyError as exc:
-                    last_error = str(exc)
-                    continue
-                return (
-                    {
-                        **observed,
-                        "name": report.get("name"),
-                        "settings_sha256": settings_fingerprint(report),
-                        "background_status_bits": background_status_bits,
-                    },
-                    report,
-                )
-        except FirmwareSafetyError:
-            raise
-        except Exception as exc:
-            last_error = type(exc).__name__
+    delay = poll_seconds
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5.0)) as probe_session:
+        while asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(delay)
+            # Authenticated verification is attempted only once the unit answers the cheap
+            # unauthenticated probes; until then the interval follows the stage reached.
+            stage = await readiness_stage(probe_session, ip)
+            if stage != "ready":
+                last_error = f"Device readiness stage is {stage}."
+                delay = READINESS_POLL_SECONDS[stage]
+                continue
+            delay = poll_seconds
+            try:
+                async with aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=20.0)
+                ) as session:
+                    cookie_header = await login_device(
+                        session,
+                        ip,
+                        username,
+                        md5_hash(password),
+                        expected_name,
+                    )
+                    info = await get_device_info(session, ip, cookie_header)
+                    observed = validate_device_info(info, target_version)
+                    if (
+                        observed["serial"] != expected_serial
+                        or observed["eth_mac"] != expected_eth_mac
+                    ):
+                        raise FirmwareSafetyError("Post-update immutable device identity mismatch.")
+                    if not observed["already_current"]:
+                        last_error = f"Device returned on firmware {observed['firmware']!r}."
+                        continue
+                    report = await get_device_report_with_login(
+                        session, ip, username, password, timeout=20.0
+                    )
+                    if report.get("name") != expected_name:
+                        raise FirmwareSafetyError("Post-update device display-name mismatch.")
+                    status = await get_device_status(session, ip, cookie_header)
+                    try:
+                        background_status_bits = assert_idle_status(status, post_update=True)
+                    except FirmwareSafetyError as exc:
+                        last_error = str(exc)
+                        continue
+                    return (
+                        {
+                            **observed,
+                            "name": report.get("name"),
+                            "settings_sha256": settings_fingerprint(report),
+                            "background_status_bits": background_status_bits,
+                        },
+                        report,
+                    )
+            except FirmwareSafetyError:
+                raise
+            except Exception as exc:
+                last_error = type(exc).__name__
     raise FirmwareSafetyError(
         "Firmware install may have started but exact post-reboot verification did not complete; "
         f"do not retry. Last observation: {last_error}"
@@ -687,165 +860,177 @@ def settings_change_summary(before: dict[str, Any], after: dict[str, Any]) -> di
     }
 
 
-def _remove_expected_addition(
-    before: dict[str, Any],
-    after: dict[str, Any],
-    key: str,
-    expected_value: Any,
-    path: str,
-    accepted: list[str],
-) -> None:
-    if key not in before and after.get(key) == expected_value:
-        after.pop(key)
-        accepted.append(path)
+# Firmware-specific settings-preservation rules, keyed by the installed version.
+# Paths are dotted; "*" matches any list index or dict key. ``transient_paths``
+# are ignored on both sides; ``expected_additions`` are accepted only when the
+# key is absent before the update and holds exactly this default afterwards.
+SETTINGS_PRESERVATION_RULES: dict[str, dict[str, Any]] = {
+    "2.4.288": {
+        "transient_paths": ("wifi.*.level",),
+        "expected_additions": {
+            "enable-ndi-bridge": 0,
+            "ndi-bridge": {
+                "bridge-name": "",
+                "encryp-key": "",
+                "groups": "Public",
+                "ip-addr": "",
+                "port": 5990,
+            },
+            "enable-zen-master": 0,
+            "zen-master": {
+                "host": "",
+                "is-key-valid": 0,
+                "tunnel-port": 0,
+                "user-name": "",
+            },
+            "living.live-keep-last": 1,
+            "stream-server.*.audio-pids": [0] * 8,
+            "stream-server.*.is-custom-pid": 0,
+            "stream-server.*.pcr-pid": 0,
+            "stream-server.*.pmt-pid": 0,
+            "stream-server.*.video-pid": 0,
+            "schedulers.*.import-type": 0,
+            "schedulers.*.channels.*.panopto-folder-id": "",
+            "schedulers.*.channels.*.source": 0,
+            "schedulers.*.channels.*.uid": "",
+            "schedulers.*.channels.*.utc-dateline": 0,
+            "schedulers.*.channels.*.utc-time-begin": 0,
+            "schedulers.*.channels.*.utc-time-end": 0,
+        },
+    },
+}
+_NO_EXPECTED_ADDITION = object()
+
+
+class _PreservationRuleNode:
+    __slots__ = ("children", "wildcard", "expected_addition", "transient")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PreservationRuleNode] = {}
+        self.wildcard: _PreservationRuleNode | None = None
+        self.expected_addition: Any = _NO_EXPECTED_ADDITION
+        self.transient = False
+
+    def descend(self, segment: str) -> "_PreservationRuleNode":
+        if segment == "*":
+            if self.wildcard is None:
+                self.wildcard = _PreservationRuleNode()
+            return self.wildcard
+        return self.children.setdefault(segment, _PreservationRuleNode())
+
+
+_compiled_preservation_rules: dict[str, _PreservationRuleNode] = {}
 
 
-def _difference_paths(before: Any, after: Any, path: tuple[str, ...] = ()) -> list[str]:
+def compile_preservation_rules(rules: dict[str, Any]) -> _PreservationRuleNode:
+    root = _PreservationRuleNode()
+    for pattern in rules.get("transient_paths", ()):
+        node = root
+        for segment in pattern.split("."):
+            node = node.descend(segment)
+        node.transient = True
+    for pattern, expected_value in rules.get("expected_additions", {}).items():
+        node = root
+        for segment in pattern.split("."):
+            node = node.descend(segment)
+        node.expected_addition = expected_value
+    return root
+
+
+def preservation_rules(target_version: str) -> _PreservationRuleNode:
+    """Return the compiled matcher for one firmware version, compiling it once."""
+    compiled = _compiled_preservation_rules.get(target_version)
+    if compiled is None:
+        try:
+            rules = SETTINGS_PRESERVATION_RULES[target_version]
+        except KeyError as exc:
+            raise FirmwareSafetyError(
+                f"No settings-preservation rules are defined for firmware {target_version}."
+            ) from exc
+        compiled = compile_preservation_rules(rules)
+        _compiled_preservation_rules[target_version] = compiled
+    return compiled
+
+
+def _match_rules(
+    nodes: tuple[_PreservationRuleNode, ...], segment: str
+) -> tuple[_PreservationRuleNode, ...]:
+    return tuple(
+        child
+        for node in nodes
+        for child in (node.children.get(segment), node.wildcard)
+        if child is not None
+    )
+
+
+def _compare_preserved(
+    before: Any,
+    after: Any,
+    nodes: tuple[_PreservationRuleNode, ...],
+    path: tuple[str, ...],
+    report: dict[str, list[str]],
+) -> None:
     if type(before) is not type(after):
-        return [".".join(path) or "<root>"]
+        report["unexpected_change_paths"].append(".".join(path) or "<root>")
+        return
     if isinstance(before, dict):
-        differences: list[str] = []
         for key in sorted(set(before) | set(after)):
             child_path = (*path, str(key))
-            if key not in before or key not in after:
-                differences.append(".".join(child_path))
+            child_nodes = _match_rules(nodes, str(key))
+            dotted = ".".join(child_path)
+            if any(node.transient for node in child_nodes):
+                for label, side in (("before", before), ("after", after)):
+                    if key in side:
+                        report["ignored_transient_paths"].append(f"{label}.{dotted}")
+                continue
+            if key not in before:
+                expected_value = next(
+                    (
+                        node.expected_addition
+                        for node in child_nodes
+                        if node.expected_addition is not _NO_EXPECTED_ADDITION
+                    ),
+                    _NO_EXPECTED_ADDITION,
+                )
+                if expected_value is not _NO_EXPECTED_ADDITION and after[key] == expected_value:
+                    report["accepted_firmware_additions"].append(dotted)
+                else:
+                    report["unexpected_change_paths"].append(dotted)
+            elif key not in after:
+                report["unexpected_change_paths"].append(dotted)
             else:
-                differences.extend(_difference_paths(before[key], after[key], child_path))
-        return differences
+                _compare_preserved(before[key], after[key], child_nodes, child_path, report)
+        return
     if isinstance(before, list):
-        differences = []
         if len(before) != len(after):
-            differences.append(".".join((*path, "length")))
+            report["unexpected_change_paths"].append(".".join((*path, "length")))
         for index, (before_item, after_item) in enumerate(zip(before, after)):
-            differences.extend(_difference_paths(before_item, after_item, (*path, str(index))))
-        return differences
-    return [] if before == after else [".".join(path) or "<root>"]
-
-
-def settings_preservation_report(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any]:
-    normalized_before = copy.deepcopy(before)
-    normalized_after = copy.deepcopy(after)
-    ignored_transient_paths: list[str] = []
-    for label, settings in (("before", normalized_before), ("after", normalized_after)):
-        wifi_entries = settings.get("wifi")
-        if isinstance(wifi_entries, list):
-            for index, entry in enumerate(wifi_entries):
-                if isinstance(entry, dict) and "level" in entry:
-                    entry.pop("level")
-                    ignored_transient_paths.append(f"{label}.wifi.{index}.level")
-
-    accepted_additions: list[str] = []
-    expected_top_level_additions = {
-        "enable-ndi-bridge": 0,
-        "ndi-bridge": {
-            "bridge-name": "",
-            "encryp-key": "",
-            "groups": "Public",
-            "ip-addr": "",
-            "port": 5990,
-        },
-        "enable-zen-master": 0,
-        "zen-master": {
-            "host": "",
-            "is-key-valid": 0,
-            "tunnel-port": 0,
-            "user-name": "",
-        },
-    }
-    for key, expected_value in expected_top_level_additions.items():
-        _remove_expected_addition(
-            normalized_before,
-            normalized_after,
-            key,
-            expected_value,
-            key,
-            accepted_additions,
-        )
+            segment = str(index)
+            _compare_preserved(
+                before_item, after_item, _match_rules(nodes, segment), (*path, segment), report
+            )
+        return
+    if before != after:
+        report["unexpected_change_paths"].append(".".join(path) or "<root>")
 
-    before_living = normalized_before.get("living")
-    after_living = normalized_after.get("living")
-    if isinstance(before_living, dict) and isinstance(after_living, dict):
-        _remove_expected_addition(
-            before_living,
-            after_living,
-            "live-keep-last",
-            1,
-            "living.live-keep-last",
-            accepted_additions,
-        )
 
-    before_servers = normalized_before.get("stream-server")
-    after_servers = normalized_after.get("stream-server")
-    server_defaults = {
-        "audio-pids": [0] * 8,
-        "is-custom-pid": 0,
-        "pcr-pid": 0,
-        "pmt-pid": 0,
-        "video-pid": 0,
-    }
-    if isinstance(before_servers, list) and isinstance(after_servers, list):
-        for index, (before_server, after_server) in enumerate(zip(before_servers, after_servers)):
-            if not isinstance(before_server, dict) or not isinstance(after_server, dict):
-                continue
-            for key, expected_value in server_defaults.items():
-                _remove_expected_addition(
-                    before_server,
-                    after_server,
-                    key,
-                    expected_value,
-                    f"stream-server.{index}.{key}",
-                    accepted_additions,
-                )
-
-    before_schedulers = normalized_before.get("schedulers")
-    after_schedulers = normalized_after.get("schedulers")
-    scheduler_defaults = {
-        "panopto-folder-id": "",
-        "source": 0,
-        "uid": "",
-        "utc-dateline": 0,
-        "utc-time-begin": 0,
-        "utc-time-end": 0,
+def settings_preservation_report(
+    before: dict[str, Any],
+    after: dict[str, Any],
+    target_version: str,
+) -> dict[str, Any]:
+    """Compare settings across an update using the rules for the installed version."""
+    report: dict[str, list[str]] = {
+        "accepted_firmware_additions": [],
+        "ignored_transient_paths": [],
+        "unexpected_change_paths": [],
     }
-    if isinstance(before_schedulers, list) and isinstance(after_schedulers, list):
-        for scheduler_index, (before_scheduler, after_scheduler) in enumerate(
-            zip(before_schedulers, after_schedulers)
-        ):
-            if not isinstance(before_scheduler, dict) or not isinstance(after_scheduler, dict):
-                continue
-            _remove_expected_addition(
-                before_scheduler,
-                after_scheduler,
-                "import-type",
-                0,
-                f"schedulers.{scheduler_index}.import-type",
-                accepted_additions,
-            )
-            before_channels = before_scheduler.get("channels")
-            after_channels = after_scheduler.get("channels")
-            if not isinstance(before_channels, list) or not isinstance(after_channels, list):
-                continue
-            for channel_index, (before_channel, after_channel) in enumerate(
-                zip(before_channels, after_channels)
-            ):
-                if not isinstance(before_channel, dict) or not isinstance(after_channel, dict):
-                    continue
-                for key, expected_value in scheduler_defaults.items():
-                    _remove_expected_addition(
-                        before_channel,
-                        after_channel,
-                        key,
-                        expected_value,
-                        f"schedulers.{scheduler_index}.channels.{channel_index}.{key}",
-                        accepted_additions,
-                    )
-
-    unexpected_change_paths = _difference_paths(normalized_before, normalized_after)
+    _compare_preserved(before, after, (preservation_rules(target_version),), (), report)
     return {
-        "preserved": not unexpected_change_paths,
-        "accepted_firmware_additions": sorted(accepted_additions),
-        "ignored_transient_paths": sorted(ignored_transient_paths),
-        "unexpected_change_paths": unexpected_change_paths,
+        "preserved": not report["unexpected_change_paths"],
+        "accepted_firmware_additions": sorted(report["accepted_firmware_additions"]),
+        "ignored_transient_paths": sorted(report["ignored_transient_paths"]),
+        "unexpected_change_paths": report["unexpected_change_paths"],
     }
 
 
@@ -855,6 +1040,7 @@ async def preflight_one(
     target_version: str,
 ) -> dict[str, Any]:
     approved_manifest(target_version)
+    preservation_rules(target_version)
     normalized_ip = validate_target_ip(ip)
     username, password = get_device_credentials()
     async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30.0)) as session:
@@ -896,6 +1082,7 @@ async def verify_one(
         raise FirmwareSafetyError("Lock all effect modes before recovery verification.")
     normalized_ip = validate_target_ip(ip)
     manifest = approved_manifest(target_version)
+    preservation_rules(target_version)
     run_dir = (
         (recovery_root or get_recovery_root())
         / _safe_identity_component(expected_serial.strip())
@@ -947,7 +1134,7 @@ async def verify_one(
         status = await get_device_status(session, normalized_ip, cookie_header)
         background_status_bits = assert_idle_status(status, post_update=True)
 
-    preservation = settings_preservation_report(before_settings, report)
+    preservation = settings_preservation_report(before_settings, report, manifest.version)
     settings_changes = settings_change_summary(before_settings, report)
     result_status = (
         "recovery-verified" if preservation["preserved"] else "recovery-verified-settings-changed"
@@ -1052,7 +1239,9 @@ async def restore_recording_channel_one(
             raise FirmwareSafetyError("Recording recovery found a display-name mismatch.")
         status = await get_device_status(session, normalized_ip, cookie_header)
         background_status_bits = assert_idle_status(status, post_update=True)
-        preservation = settings_preservation_report(before_settings, current_settings)
+        preservation = settings_preservation_report(
+            before_settings, current_settings, manifest.version
+        )
         if preservation["unexpected_change_paths"] != ["rec-channels.0.is-use"]:
             raise FirmwareSafetyError(
                 "Recording recovery found drift beyond the single approved enable flag."
@@ -1114,11 +1303,15 @@ async def restore_recording_channel_one(
             ) from exc
 
         verified_settings: dict[str, Any] = {}
+        verified_preservation: dict[str, Any] = {"preserved": False}
         for verification_attempt in range(1, 4):
             verified_settings = await get_device_report_with_login(
                 session, normalized_ip, username, password, timeout=20.0
             )
-            if settings_preservation_report(before_settings, verified_settings)["preserved"]:
+            verified_preservation = settings_preservation_report(
+                before_settings, verified_settings, manifest.version
+            )
+            if verified_preservation["preserved"]:
                 break
             if verification_attempt < 3:
                 await asyncio.sleep(1)
@@ -1144,7 +1337,6 @@ async def restore_recording_channel_one(
                     raise
                 await asyncio.sleep(1)
 
-    verified_preservation = settings_preservation_report(before_settings, verified_settings)
     if not verified_preservation["preserved"]:
         record_effect_state(
             run_dir,
@@ -1182,11 +1374,30 @@ async def update_one(
     *,
     confirm: bool,
     recovery_root: Path | None = None,
+    preflight: dict[str, Any] | None = None,
+    reboot_started: asyncio.Event | None = None,
 ) -> dict[str, Any]:
+    """Update one device; a campaign may supply its queued preflight and observe the reboot.
+
+    A supplied ``preflight`` only replaces the initial read.  The same-session identity
+    and idle re-checks immediately before upload always run.
+    """
     require_firmware_effects(confirm)
-    with open_validated_artifact(artifact_path, target_version) as artifact:
+    # An unknown version must be refused before upload, not after the reboot it cannot verify.
+    preservation_rules(target_version)
+    digest_cache_dir = validated_recovery_root(recovery_root or get_recovery_root()) / (
+        "artifact-digests"
+    )
+    with open_validated_artifact(
+        artifact_path, target_version, digest_cache_dir=digest_cache_dir
+    ) as artifact:
         artifact_metadata = artifact.public_metadata()
-        preflight = await preflight_one(ip, expected_name, target_version)
+        if preflight is None:
+            preflight = await preflight_one(ip, expected_name, target_version)
+        elif (
+            preflight.get("ip") != validate_target_ip(ip) or preflight.get("name") != expected_name
+        ):
+            raise FirmwareSafetyError("Queued preflight does not belong to this firmware target.")
         assert_operator_approved_identity(preflight, expected_serial, expected_eth_mac)
         if preflight["already_current"]:
             return {
@@ -1274,6 +1485,8 @@ async def update_one(
             else:
                 record_effect_state(run_dir, "install-accepted", device_response=install)
 
+        if reboot_started is not None:
+            reboot_started.set()
         try:
             verified, post_settings = await wait_for_verified_firmware(
                 normalized_ip,
@@ -1291,7 +1504,9 @@ async def update_one(
         pre_settings_sha256 = settings_fingerprint(settings)
         post_settings_sha256 = settings_fingerprint(post_settings)
         settings_changes = settings_change_summary(settings, post_settings)
-        preservation = settings_preservation_report(settings, post_settings)
+        preservation = settings_preservation_report(
+            settings, post_settings, artifact.manifest.version
+        )
         if not preservation["preserved"]:
             result_status = "firmware-verified-settings-changed"
             record_effect_state(
@@ -1323,3 +1538,148 @@ async def update_one(
             "settings_changes": settings_changes,
             "preservation": preservation,
         }
+
+
+def load_campaign_targets(path: Path) -> list[CampaignTarget]:
+    """Read an operator-reviewed campaign CSV of exact preflight identities."""
+    try:
+        with path.open(newline="", encoding="utf-8") as campaign_file:
+            reader = csv.DictReader(campaign_file)
+            if tuple(reader.fieldnames or ()) != CAMPAIGN_TARGET_FIELDS:
+                raise FirmwareSafetyError(
+                    "Campaign CSV must have exactly the headers " + ",".join(CAMPAIGN_TARGET_FIELDS)
+                )
+            rows = list(reader)
+    except OSError as exc:
+        raise FirmwareSafetyError("Campaign target file could not be read.") from exc
+    targets = []
+    seen_ips: set[str] = set()
+    seen_serials: set[str] = set()
+    for line_number, row in enumerate(rows, start=2):
+        values = {field: (row.get(field) or "").strip() for field in CAMPAIGN_TARGET_FIELDS}
+        if not all(values.values()):
+            raise FirmwareSafetyError(f"Campaign row {line_number} is incomplete.")
+        target = CampaignTarget(**{**values, "ip": validate_target_ip(values["ip"])})
+        if target.ip in seen_ips or target.expected_serial in seen_serials:
+            raise FirmwareSafetyError(f"Campaign row {line_number} repeats a device.")
+        seen_ips.add(target.ip)
+        seen_serials.add(target.expected_serial)
+        targets.append(target)
+    if not targets:
+        raise FirmwareSafetyError("Campaign target file has no devices.")
+    return targets
+
+
+async def update_campaign(
+    targets: list[CampaignTarget],
+    target_version: str,
+    artifact_path: Path,
+    *,
+    confirm: bool,
+    recovery_root: Path | None = None,
+    lookahead: int = DEFAULT_CAMPAIGN_LOOKAHEAD,
+) -> dict[str, Any]:
+    """Install strictly one device at a time, preflighting the next ones during each reboot.
+
+    Each device still goes through ``update_one`` with its own durable effect receipt.
+    Queued preflights are read-only.  The campaign stops before the next install on the
+    first failed preflight, rejected or unverified update, or settings change.
+    """
+    require_firmware_effects(confirm)
+    approved_manifest(target_version)
+    preservation_rules(target_version)
+    if lookahead < 1:
+        raise FirmwareSafetyError("Campaign preflight lookahead must be at least 1.")
+    queued: dict[int, asyncio.Task[dict[str, Any]]] = {}
+    results: list[dict[str, Any]] = []
+    stop_reason: str | None = None
+
+    def queue_preflights(start: int, count: int) -> None:
+        for index in range(start, min(start + count, len(targets))):
+            if index not in queued:
+                target = targets[index]
+                queued[index] = asyncio.create_task(
+                    preflight_one(target.ip, target.expected_name, target_version)
+                )
+
+    def failed_preflight() -> tuple[int, BaseException] | None:
+        for index, task in sorted(queued.items()):
+            if task.done() and not task.cancelled() and task.exception() is not None:
+                return index, task.exception()
+        return None
+
+    try:
+        for index, target in enumerate(targets):
+            queue_preflights(index, 1)
+            early_failure = failed_preflight()
+            if early_failure is not None and early_failure[0] != index:
+                failed_index, exc = early_failure
+                stop_reason = (
+                    f"Preflight for {targets[failed_index].ip} failed: {safe_device_error(exc)}"
+                )
+                break
+            try:
+                preflight = await queued.pop(index)
+            except Exception as exc:
+                results.append(
+                    {
+                        "ip": target.ip,
+                        "expected_name": target.expected_name,
+                        "status": "stopped-preflight-failed",
+                        "message": safe_device_error(exc),
+                    }
+                )
+                stop_reason = f"Preflight for {target.ip} failed."
+                break
+
+            reboot_started = asyncio.Event()
+            update_task = asyncio.create_task(
+                update_one(
+                    target.ip,
+                    target.expected_name,
+                    target.expected_serial,
+                    target.expected_eth_mac,
+                    target_version,
+                    artifact_path,
+                    confirm=confirm,
+                    recovery_root=recovery_root,
+                    preflight=preflight,
+                    reboot_started=reboot_started,
+                )
+            )
+            reboot_wait = asyncio.create_task(reboot_started.wait())
+            await asyncio.wait({update_task, reboot_wait}, return_when=asyncio.FIRST_COMPLETED)
+            reboot_wait.cancel()
+            if reboot_started.is_set():
+                # The device is rebooting; only read-only preflights overlap this window.
+                queue_preflights(index + 1, lookahead)
+            try:
+                result = await update_task
+            except Exception as exc:
+                results.append(
+                    {
+                        "ip": target.ip,
+                        "expected_name": target.expected_name,
+                        "status": "stopped-update-failed",
+                        "message": safe_device_error(exc),
+                    }
+                )
+                stop_reason = f"Firmware update for {target.ip} did not complete."
+                break
+            results.append({"ip": target.ip, "expected_name": target.expected_name, **result})
+            if result["status"] not in {"updated-and-verified", "already-current"}:
+                stop_reason = f"Firmware update for {target.ip} returned {result['status']}."
+                break
+    finally:
+        for task in queued.values():
+            task.cancel()
+        await asyncio.gather(*queued.values(), return_exceptions=True)
+
+    finished_ips = {result["ip"] for result in results}
+    return {
+        "status": "stopped" if stop_reason else "completed",
+        "stop_reason": stop_reason,
+        "target_version": target_version,
+        "results": results,
+        "not_started": [target.ip for target in targets if target.ip not in finished_ips],
+    }
@@ -5,9 +5,12 @@ from pathlib import Path
 
 from .app import safe_device_error
 from .firmware import (
+    DEFAULT_CAMPAIGN_LOOKAHEAD,
     FirmwareSafetyError,
+    load_campaign_targets,
     preflight_one,
     restore_recording_channel_one,
+    update_campaign,
     update_one,
     verify_one,
 )
@@ -33,6 +36,13 @@ def build_parser() -> argparse.ArgumentParser:
     update_parser.add_argument("--firmware", type=Path, required=True)
     update_parser.add_argument("--confirm", action="store_true")
 
+    campaign_parser = subparsers.add_parser("update-campaign")
+    campaign_parser.add_argument("--targets", type=Path, required=True)
+    campaign_parser.add_argument("--target-version", required=True)
+    campaign_parser.add_argument("--firmware", type=Path, required=True)
+    campaign_parser.add_argument("--lookahead", type=int, default=DEFAULT_CAMPAIGN_LOOKAHEAD)
+    campaign_parser.add_argument("--confirm", action="store_true")
+
     verify_parser = subparsers.add_parser("verify-one")
     verify_parser.add_argument("--ip", required=True)
     verify_parser.add_argument("--expected-name", required=True)
@@ -54,6 +64,14 @@ async def run() -> dict:
     args = build_parser().parse_args()
     if args.command == "preflight-one":
         return await preflight_one(args.ip, args.expected_name, args.target_version)
+    if args.command == "update-campaign":
+        return await update_campaign(
+            load_campaign_targets(args.targets),
+            args.target_version,
+            args.firmware,
+            confirm=args.confirm,
+            lookahead=args.lookahead,
+        )
     if args.command == "verify-one":
         return await verify_one(
             args.ip,
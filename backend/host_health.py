@@ -0,0 +1,76 @@
+"""Bounded per-address memory of dead hosts and failing reads between scans.
+
+Addresses that did not answer as a Magewell encoder are remembered in a
+negative cache whose entries expire, doubling their lifetime on each repeat
+miss. Encoders whose login or report read keeps failing trip a circuit breaker
+that stays open for a cool-down and then allows a single trial read. Both only
+ever shorten later sweeps; a forced full sweep ignores them.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+NEGATIVE_CACHE_MAX_ENTRIES = 4096
+NEGATIVE_CACHE_BASE_TTL_SECONDS = 300.0
+NEGATIVE_CACHE_MAX_TTL_SECONDS = 3600.0
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_OPEN_SECONDS = 300.0
+
+
+@dataclass
+class _Miss:
+    count: int
+    expires_at: float
+
+
+@dataclass
+class _Circuit:
+    failures: int = 0
+    open_until: float = 0.0
+
+
+class HostHealth:
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._misses: OrderedDict[str, _Miss] = OrderedDict()
+        self._circuits: OrderedDict[str, _Circuit] = OrderedDict()
+
+    def is_known_dead(self, ip: str) -> bool:
+        miss = self._misses.get(ip)
+        return miss is not None and miss.expires_at > self._clock()
+
+    def record_miss(self, ip: str) -> None:
+        """Remember a non-responder or non-Magewell responder, backing off on repeats."""
+        previous = self._misses.pop(ip, None)
+        count = previous.count + 1 if previous else 1
+        ttl = min(
+            NEGATIVE_CACHE_BASE_TTL_SECONDS * 2 ** (count - 1), NEGATIVE_CACHE_MAX_TTL_SECONDS
+        )
+        self._misses[ip] = _Miss(count=count, expires_at=self._clock() + ttl)
+        self._evict(self._misses)
+
+    def record_responder(self, ip: str) -> None:
+        self._misses.pop(ip, None)
+
+    def circuit_open(self, ip: str) -> bool:
+        circuit = self._circuits.get(ip)
+        return circuit is not None and circuit.open_until > self._clock()
+
+    def record_read_failure(self, ip: str) -> None:
+        circuit = self._circuits.pop(ip, None) or _Circuit()
+        circuit.failures += 1
+        # A failed half-open trial reopens immediately; fresh hosts get the full threshold.
+        if circuit.failures >= CIRCUIT_FAILURE_THRESHOLD:
+            circuit.open_until = self._clock() + CIRCUIT_OPEN_SECONDS
+        self._circuits[ip] = circuit
+        self._evict(self._circuits)
+
+    def record_read_success(self, ip: str) -> None:
+        self._circuits.pop(ip, None)
+
+    @staticmethod
+    def _evict(entries: OrderedDict) -> None:
+        while len(entries) > NEGATIVE_CACHE_MAX_ENTRIES:
+            entries.popitem(last=False)
@@ -0,0 +1,32 @@
+import argparse
+import json
+
+from .run_receipts import ProfileRunReceiptStore, ReceiptSafetyError
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Local maintenance for durable profile-run receipts; no device access."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser(
+        "rebuild-current",
+        help="Replay the journal from its last checkpoint and repair current/ summaries.",
+    )
+    return parser
+
+
+def run() -> dict:
+    build_parser().parse_args()
+    return ProfileRunReceiptStore().rebuild_current()
+
+
+def main() -> None:
+    try:
+        print(json.dumps(run(), indent=2, sort_keys=True))
+    except (ReceiptSafetyError, OSError) as exc:
+        raise SystemExit(f"STOP: {exc}") from None
+
+
+if __name__ == "__main__":
+    main()
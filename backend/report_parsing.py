@@ -0,0 +1,41 @@
+"""Parse a device report page into its SETTINGS object, fingerprint, and digest tree.
+
+This module deliberately imports nothing from the web app so the optional
+report-parsing worker processes load only BeautifulSoup and the digest helpers.
+"""
+
+import json
+from typing import Any
+
+from bs4 import BeautifulSoup
+
+from .settings_tree import SettingsTree, build_settings_tree, settings_fingerprint
+
+
+def parse_settings_report(
+    raw: bytes, encoding: str = "utf-8"
+) -> tuple[dict[str, Any], str, SettingsTree]:
+    """Return the report's SETTINGS object, its fingerprint, and its per-subtree digests.
+
+    Every hash a cached inventory record needs is computed here, so a worker
+    process leaves the event loop only the work of freezing the result.
+    """
+    soup = BeautifulSoup(raw.decode(encoding, errors="replace"), "html.parser")
+    report_content = soup.find("div", class_="report-content")
+    if not report_content:
+        raise RuntimeError("Report contains no report-content section")
+    for div in report_content.find_all("div", class_="content-level1"):
+        heading = div.find("h2")
+        if heading and heading.get_text(strip=True).upper() == "SETTINGS":
+            pre = div.find("pre", class_="json")
+            if not pre:
+                break
+            settings_data = json.loads(pre.get_text(strip=True))
+            if not isinstance(settings_data, dict):
+                raise RuntimeError("SETTINGS report is not a JSON object")
+            return (
+                settings_data,
+                settings_fingerprint(settings_data),
+                build_settings_tree(settings_data),
+            )
+    raise RuntimeError("Report contains no SETTINGS section")
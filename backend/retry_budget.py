@@ -0,0 +1,109 @@
+"""Retry allowance and jittered backoff for idempotent device reads.
+
+Only reads that are safe to repeat (login, report, and listing calls) may use
+:func:`retry_read`; settings, name, password, and firmware mutations are never
+retried. A fleet scan installs one shared :class:`RetryBudget` so a flaky switch
+port cannot turn into hundreds of synchronized retry stalls: once the sweep has
+spent its allowance, later failures are reported on the first attempt.
+"""
+
+import asyncio
+import functools
+import logging
+import math
+import random
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY_SECONDS = 0.25
+RETRY_MAX_DELAY_SECONDS = 2.0
+SCAN_RETRY_BUDGET_RATIO = 0.1
+SCAN_RETRY_BUDGET_MIN = 8
+# Response statuses that mean "busy or briefly unreachable behind a proxy", not "refused".
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class RetryBudget:
+    """A count of retries shared by every read in one sweep."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.used = 0
+
+    def try_spend(self) -> bool:
+        if self.used >= self.limit:
+            return False
+        self.used += 1
+        return True
+
+
+_current_budget: ContextVar[RetryBudget | None] = ContextVar("retry_budget", default=None)
+
+
+def scan_retry_budget(host_count: int) -> RetryBudget:
+    return RetryBudget(max(SCAN_RETRY_BUDGET_MIN, math.ceil(host_count * SCAN_RETRY_BUDGET_RATIO)))
+
+
+@contextmanager
+def retry_budget_scope(budget: RetryBudget) -> Iterator[RetryBudget]:
+    """Share ``budget`` with every read started, or task created, inside the block."""
+    token = _current_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_budget.reset(token)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Retry connect-level failures and transient statuses, never slow or refused replies."""
+    if isinstance(exc, aiohttp.ClientConnectorError | aiohttp.ConnectionTimeoutError):
+        # Nothing reached the device, so repeating the request cannot double it.
+        return True
+    if isinstance(exc, aiohttp.ServerDisconnectedError):
+        return True
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status in RETRYABLE_STATUSES
+    # Read timeouts and malformed replies come from a device that is up but slow or
+    # misbehaving; another attempt would only stretch the sweep's tail.
+    return False
+
+
+def backoff_delay(attempt: int, rng: Callable[[], float] = random.random) -> float:
+    """Return a full-jitter delay before retry number ``attempt + 1``."""
+    return rng() * min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2**attempt)
+
+
+def retry_read(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Retry an idempotent device read within the current retry budget."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        budget = _current_budget.get()
+        attempt = 0
+        while True:
+            try:
+                return await func(*args, **kwargs)
+            except aiohttp.ClientError as exc:
+                attempt += 1
+                if attempt >= RETRY_ATTEMPTS or not is_retryable(exc):
+                    raise
+                if budget is not None and not budget.try_spend():
+                    raise
+                delay = backoff_delay(attempt - 1)
+                logger.debug(
+                    "Retrying %s after %s (attempt %s, %.2f s)",
+                    func.__name__,
+                    type(exc).__name__,
+                    attempt + 1,
+                    delay,
+                )
+            await asyncio.sleep(delay)
+
+    return wrapper
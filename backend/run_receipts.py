@@ -7,11 +7,13 @@ device effect, and to append bounded state transitions afterwards.
 
 from __future__ import annotations
 
+import base64
 import hashlib
 import json
 import os
 import re
 import threading
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -20,8 +22,14 @@ DEFAULT_PROFILE_RUN_RECEIPT_ROOT = Path("/var/lib/magewell-profile-run-receipts"
 MAX_RECEIPT_BYTES = 64 * 1024
 MAX_RECEIPT_STORAGE_BYTES = 10 * 1024 * 1024
 MAX_RECEIPT_RECORDS = 10_000
+CHECKPOINT_INTERVAL_BYTES = 256 * 1024
+INDEX_BLOOM_BITS = 8192
+INDEX_BLOOM_HASHES = 4
+QUERY_IDENTITY_FIELDS = ("serial", "eth_mac", "fleet_id")
 REPOSITORY_ROOT = Path(__file__).resolve().parents[1]
 RECEIPT_ID_RE = re.compile(r"^[a-f0-9]{32}$")
+SEGMENT_NAME_RE = re.compile(r"^receipts-\d{4}-\d{2}\.jsonl$")
+JOURNAL_EVENT_KEYS = ("event", "recorded_at", "receipt_sha256")
 FORBIDDEN_RECEIPT_KEYS = {
     "settings",
     "password",
@@ -56,6 +64,60 @@ def receipt_sha256(payload: dict[str, Any]) -> str:
     return hashlib.sha256(canonical_json(payload)).hexdigest()
 
 
+def verified_event(line: bytes) -> dict[str, Any]:
+    """Decode one journal line and prove it still matches its recorded SHA-256."""
+    payload = json.loads(line)
+    if not isinstance(payload, dict):
+        raise ValueError("journal event is not an object")
+    recorded = payload.get("receipt_sha256")
+    body = {key: value for key, value in payload.items() if key != "receipt_sha256"}
+    if not isinstance(recorded, str) or receipt_sha256(body) != recorded:
+        raise ValueError("journal event digest mismatch")
+    _safe_receipt_id(str(payload.get("receipt_id", "")))
+    return payload
+
+
+def summary_from_event(event: dict[str, Any]) -> dict[str, Any]:
+    """Return the ``current/`` summary that was written alongside a journal event."""
+    return {key: value for key, value in event.items() if key not in JOURNAL_EVENT_KEYS}
+
+
+def normalized_query_value(field: str, value: str) -> str:
+    value = value.strip()
+    return value.lower() if field == "eth_mac" else value
+
+
+def event_index_terms(event: dict[str, Any]) -> set[str]:
+    """Return every identity term under which a journal event can be queried."""
+    terms = {f"receipt_id:{event.get('receipt_id', '')}"}
+    identities = [event.get("source"), *(event.get("targets") or [])]
+    for identity in identities:
+        if not isinstance(identity, dict):
+            continue
+        for field in QUERY_IDENTITY_FIELDS:
+            value = identity.get(field)
+            if isinstance(value, str) and value.strip():
+                terms.add(f"{field}:{normalized_query_value(field, value)}")
+    return terms
+
+
+def _bloom_positions(term: str) -> list[int]:
+    digest = hashlib.sha256(term.encode("utf-8")).digest()
+    return [
+        int.from_bytes(digest[index * 4 : index * 4 + 4], "big") % INDEX_BLOOM_BITS
+        for index in range(INDEX_BLOOM_HASHES)
+    ]
+
+
+def bloom_add(bloom: bytearray, term: str) -> None:
+    for position in _bloom_positions(term):
+        bloom[position // 8] |= 1 << (position % 8)
+
+
+def bloom_may_contain(bloom: bytes, term: str) -> bool:
+    return all(bloom[position // 8] & (1 << (position % 8)) for position in _bloom_positions(term))
+
+
 def _assert_redacted(value: Any) -> None:
     """Reject raw device data even if a future caller bypasses the app builder."""
     if isinstance(value, dict):
@@ -112,7 +174,15 @@ def _utc_month() -> str:
 
 
 def _utc_timestamp() -> str:
-    return datetime.now(UTC).isoformat().replace("+00:00", "Z")
+    # Fixed precision keeps timestamps lexically ordered: "Z" sorts after ".".
+    return datetime.now(UTC).isoformat(timespec="microseconds").replace("+00:00", "Z")
+
+
+def sortable_timestamp(value: str) -> str:
+    """Pad a whole-second ``...SSZ`` timestamp from older journals to microseconds."""
+    if value.endswith("Z") and "." not in value:
+        return f"{value[:-1]}.000000Z"
+    return value
 
 
 class ProfileRunReceiptStore:
@@ -137,12 +207,28 @@ class ProfileRunReceiptStore:
     def reservation_dir(self) -> Path:
         return self.root / "reservations"
 
+    @property
+    def checkpoint_path(self) -> Path:
+        return self.root / "checkpoint.json"
+
+    @property
+    def index_dir(self) -> Path:
+        return self.root / "index"
+
     def _prepare(self) -> None:
         _private_directory(self.root)
         _private_directory(self.journal_dir)
         _private_directory(self.current_dir)
         _private_directory(self.reservation_dir)
 
+    def _journal_segments(self) -> list[Path]:
+        # Month-stamped names sort chronologically, so this is also replay order.
+        return sorted(
+            path
+            for path in self.journal_dir.glob("receipts-*.jsonl")
+            if SEGMENT_NAME_RE.fullmatch(path.name)
+        )
+
     def _journal_path(self, month: str) -> Path:
         if not re.fullmatch(r"\d{4}-\d{2}", month):
             raise ReceiptSafetyError("Profile-run receipt month is invalid.")
@@ -223,6 +309,7 @@ class ProfileRunReceiptStore:
             os.fsync(journal.fileno())
         os.chmod(journal_path, 0o600)
         _fsync_directory(self.journal_dir)
+        self._maybe_checkpoint()
         return event_payload
 
     def _write_current(self, payload: dict[str, Any]) -> None:
@@ -343,6 +430,318 @@ class ProfileRunReceiptStore:
             self._write_current(updated)
             return updated
 
+    def _load_checkpoint(self) -> dict[str, Any] | None:
+        """Return a self-consistent checkpoint, or ``None`` when a full replay is required."""
+        try:
+            payload = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+            body = {key: value for key, value in payload.items() if key != "checkpoint_sha256"}
+            if payload.get("checkpoint_sha256") != receipt_sha256(body):
+                return None
+            segments = payload["segments"]
+            receipts = payload["receipts"]
+            if not isinstance(segments, dict) or not isinstance(receipts, dict):
+                return None
+            for name, position in segments.items():
+                if not SEGMENT_NAME_RE.fullmatch(name):
+                    return None
+                path = self.journal_dir / name
+                # The checkpointed prefix must still end with the exact event it recorded;
+                # a truncated or rewritten segment invalidates every later position.
+                if path.stat().st_size < int(position["offset"]):
+                    return None
+                if position["offset"] and (
+                    self._read_event(name, int(position["last_event_offset"]))["receipt_sha256"]
+                    != position["last_event_sha256"]
+                ):
+                    return None
+            return payload
+        except (KeyError, TypeError, ValueError, OSError, ReceiptSafetyError):
+            return None
+
+    def _read_event(self, segment: str, offset: int) -> dict[str, Any]:
+        with (self.journal_dir / segment).open("rb") as journal:
+            journal.seek(offset)
+            return verified_event(journal.readline())
+
+    def _replay_journal(
+        self, checkpoint: dict[str, Any] | None
+    ) -> tuple[dict[str, Any], dict[str, dict[str, Any]], list[dict[str, Any]], int]:
+        """Replay only the journal tail after ``checkpoint`` and return the new positions."""
+        segments: dict[str, Any] = dict(checkpoint["segments"]) if checkpoint else {}
+        latest: dict[str, dict[str, Any]] = dict(checkpoint["receipts"]) if checkpoint else {}
+        divergences: list[dict[str, Any]] = []
+        events_replayed = 0
+        for path in self._journal_segments():
+            position = segments.get(path.name, {"offset": 0})
+            offset = int(position["offset"])
+            with path.open("rb") as journal:
+                journal.seek(offset)
+                for line in journal:
+                    line_offset = offset
+                    offset += len(line)
+                    if not line.strip():
+                        continue
+                    events_replayed += 1
+                    try:
+                        event = verified_event(line)
+                    except (ValueError, ReceiptSafetyError):
+                        divergences.append(
+                            {
+                                "segment": path.name,
+                                "offset": line_offset,
+                                "reason_code": "journal-event-digest-mismatch",
+                            }
+                        )
+                        continue
+                    latest[event["receipt_id"]] = {
+                        "segment": path.name,
+                        "offset": line_offset,
+                        "receipt_sha256": event["receipt_sha256"],
+                    }
+                    position = {
+                        "offset": offset,
+                        "last_event_offset": line_offset,
+                        "last_event_sha256": event["receipt_sha256"],
+                    }
+            # A position is only trustworthy when it ends on a verified event; a segment
+            # that holds nothing but divergent lines is replayed (and reported) again.
+            if "last_event_offset" in position:
+                segments[path.name] = {**position, "offset": offset}
+        checkpoint_payload: dict[str, Any] = {
+            "schema_version": 1,
+            "segments": segments,
+            "receipts": latest,
+        }
+        checkpoint_payload["checkpoint_sha256"] = receipt_sha256(checkpoint_payload)
+        return checkpoint_payload, latest, divergences, events_replayed
+
+    @staticmethod
+    def _write_derived(path: Path, payload: dict[str, Any]) -> None:
+        """Atomically replace derived (rebuildable) state such as checkpoints and indexes."""
+        temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            with os.fdopen(fd, "wb") as output:
+                output.write(canonical_json(payload) + b"\n")
+                output.flush()
+                os.fsync(output.fileno())
+            os.replace(temporary, path)
+            os.chmod(path, 0o600)
+            _fsync_directory(path.parent)
+        finally:
+            if temporary.exists():
+                temporary.unlink()
+
+    def _write_checkpoint(self, payload: dict[str, Any]) -> None:
+        self._write_derived(self.checkpoint_path, payload)
+
+    def _maybe_checkpoint(self) -> None:
+        """Advance the replay checkpoint once enough journal bytes follow the last one."""
+        try:
+            checkpoint = self._load_checkpoint()
+            positions = checkpoint["segments"] if checkpoint else {}
+            unreplayed = sum(
+                path.stat().st_size - int(positions.get(path.name, {"offset": 0})["offset"])
+                for path in self._journal_segments()
+            )
+            if unreplayed >= CHECKPOINT_INTERVAL_BYTES:
+                self._write_checkpoint(self._replay_journal(checkpoint)[0])
+        except OSError:
+            # The checkpoint is derived data; the journal stays authoritative without it.
+            pass
+
+    def rebuild_current(self) -> dict[str, Any]:
+        """Rebuild every ``current/`` summary from the journal's latest verified events.
+
+        Replay starts at the last self-consistent checkpoint, verifies each event's
+        ``receipt_sha256`` and rewrites only summaries that are missing, unreadable, or
+        differ from the journal.  The journal itself is never modified.
+        """
+        with self._writer_lock:
+            self._prepare()
+            checkpoint = self._load_checkpoint()
+            checkpoint_payload, latest, divergences, events_replayed = self._replay_journal(
+                checkpoint
+            )
+            rewritten: list[str] = []
+            for receipt_id, position in sorted(latest.items()):
+                try:
+                    event = self._read_event(position["segment"], int(position["offset"]))
+                    if event["receipt_sha256"] != position["receipt_sha256"]:
+                        raise ValueError("journal event moved")
+                except (OSError, ValueError, ReceiptSafetyError):
+                    divergences.append(
+                        {"receipt_id": receipt_id, "reason_code": "journal-event-unreadable"}
+                    )
+                    continue
+                summary = summary_from_event(event)
+                path = self._summary_path(receipt_id)
+                try:
+                    current = json.loads(path.read_text(encoding="utf-8"))
+                    reason_code = None if current == summary else "summary-stale"
+                except FileNotFoundError:
+                    reason_code = "summary-missing"
+                except (OSError, json.JSONDecodeError):
+                    reason_code = "summary-unreadable"
+                if reason_code:
+                    self._write_current(summary)
+                    rewritten.append(receipt_id)
+                    divergences.append({"receipt_id": receipt_id, "reason_code": reason_code})
+            for path in sorted(self.current_dir.glob("*.json")):
+                if path.stem not in latest:
+                    divergences.append(
+                        {"receipt_id": path.stem, "reason_code": "summary-not-in-journal"}
+                    )
+            self._write_checkpoint(checkpoint_payload)
+            return {
+                "checkpoint_used": checkpoint is not None,
+                "events_replayed": events_replayed,
+                "receipt_count": len(latest),
+                "rewritten_receipt_ids": rewritten,
+                "divergences": divergences,
+            }
+
+    def _segment_index(self, segment: Path) -> dict[str, Any]:
+        """Return the segment's time range and identity bloom filter, extending it in place.
+
+        Segments are append-only, so a stored index stays valid for the prefix it covers
+        and only complete lines appended since then are read.
+        """
+        index_path = self.index_dir / f"{segment.stem}.index.json"
+        size = segment.stat().st_size
+        index: dict[str, Any] | None = None
+        try:
+            index = json.loads(index_path.read_text(encoding="utf-8"))
+            if index.get("segment") != segment.name or int(index["offset"]) > size:
+                index = None
+        except (OSError, ValueError, KeyError, TypeError):
+            index = None
+        if index is None:
+            index = {
+                "segment": segment.name,
+                "offset": 0,
+                "record_count": 0,
+                "first_recorded_at": None,
+                "last_recorded_at": None,
+                "bloom": base64.b64encode(bytes(INDEX_BLOOM_BITS // 8)).decode("ascii"),
+            }
+        if int(index["offset"]) == size:
+            return index
+        bloom = bytearray(base64.b64decode(index["bloom"]))
+        offset = int(index["offset"])
+        with segment.open("rb") as journal:
+            journal.seek(offset)
+            for line in journal:
+                if not line.endswith(b"\n"):
+                    # A concurrent append is still in flight; index it on the next query.
+                    break
+                offset += len(line)
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(event, dict):
+                    continue
+                recorded_at = sortable_timestamp(str(event.get("recorded_at", "")))
+                index["record_count"] += 1
+                if index["first_recorded_at"] is None or recorded_at < index["first_recorded_at"]:
+                    index["first_recorded_at"] = recorded_at
+                if index["last_recorded_at"] is None or recorded_at > index["last_recorded_at"]:
+                    index["last_recorded_at"] = recorded_at
+                for term in event_index_terms(event):
+                    bloom_add(bloom, term)
+        index["offset"] = offset
+        index["bloom"] = base64.b64encode(bytes(bloom)).decode("ascii")
+        try:
+            _private_directory(self.index_dir)
+            self._write_derived(index_path, index)
+        except OSError:
+            # The index is an accelerator; an unwritable one is rebuilt on the next query.
+            pass
+        return index
+
+    def query_events(
+        self,
+        *,
+        filters: dict[str, str] | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Return verified journal events matching every identity filter and time bound.
+
+        ``filters`` maps ``receipt_id`` or an identity field to an exact value.  Segments
+        whose time range or bloom filter proves they cannot match are never read.  Every
+        candidate event is verified before this returns, so a tampered segment raises
+        here instead of partway through the caller's response; the returned iterator
+        only re-reads the matching lines.
+        """
+        matches = self._query_matches(filters or {}, since, until)
+        return self._read_matches(matches)
+
+    def _query_matches(
+        self, filters: dict[str, str], since: str | None, until: str | None
+    ) -> list[tuple[Path, list[tuple[int, str]]]]:
+        if not self.journal_dir.exists():
+            return []
+        terms = {
+            f"{field}:{normalized_query_value(field, value)}" for field, value in filters.items()
+        }
+        with self._writer_lock:
+            candidates = []
+            for segment in self._journal_segments():
+                index = self._segment_index(segment)
+                if not index["record_count"]:
+                    continue
+                if since and sortable_timestamp(index["last_recorded_at"]) < since:
+                    continue
+                if until and sortable_timestamp(index["first_recorded_at"]) > until:
+                    continue
+                bloom = base64.b64decode(index["bloom"])
+                if all(bloom_may_contain(bloom, term) for term in terms):
+                    candidates.append((segment, int(index["offset"])))
+        matches = []
+        for segment, indexed_offset in candidates:
+            positions = []
+            with segment.open("rb") as journal:
+                offset = 0
+                for line in journal:
+                    line_offset = offset
+                    offset += len(line)
+                    if offset > indexed_offset:
+                        break
+                    if not line.strip():
+                        continue
+                    try:
+                        event = verified_event(line)
+                    except (ValueError, ReceiptSafetyError) as exc:
+                        raise ReceiptSafetyError(
+                            f"Journal segment {segment.name} failed verification at offset "
+                            f"{line_offset}; run receipt recovery and inspect durable storage."
+                        ) from exc
+                    recorded_at = sortable_timestamp(str(event.get("recorded_at", "")))
+                    if (since and recorded_at < since) or (until and recorded_at > until):
+                        continue
+                    if terms <= event_index_terms(event):
+                        _assert_redacted(event)
+                        positions.append((line_offset, event["receipt_sha256"]))
+            if positions:
+                matches.append((segment, positions))
+        return matches
+
+    @staticmethod
+    def _read_matches(
+        matches: list[tuple[Path, list[tuple[int, str]]]],
+    ) -> Iterator[dict[str, Any]]:
+        for segment, positions in matches:
+            with segment.open("rb") as journal:
+                for offset, expected_sha256 in positions:
+                    journal.seek(offset)
+                    event = json.loads(journal.readline())
+                    # Segments are append-only; a moved event means the file was rewritten.
+                    if event.get("receipt_sha256") != expected_sha256:
+                        raise ReceiptSafetyError(f"Journal segment {segment.name} changed.")
+                    yield event
+
     def get_receipt(self, receipt_id: str) -> dict[str, Any]:
         path = self._summary_path(receipt_id)
         try:
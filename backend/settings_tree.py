@@ -0,0 +1,83 @@
+import hashlib
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from .settings_merge import TARGET_LOCAL_KEYS
+
+
+@dataclass(frozen=True)
+class SettingsTree:
+    """Merkle digest of one settings value and, for containers, each child subtree.
+
+    Equal digests mean equal subtrees, so structural comparison can stop at the
+    first matching node instead of walking every nested field. Digests are
+    domain-separated by container kind so ``{}``/``[]``/scalars never collide.
+    """
+
+    sha256: str
+    kind: str
+    children: Mapping[str, "SettingsTree"] = field(default_factory=dict)
+
+
+def _canonical_json(payload: Any) -> str:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+
+
+def settings_fingerprint(settings: Mapping[str, Any]) -> str:
+    return hashlib.sha256(_canonical_json(settings).encode("utf-8")).hexdigest()
+
+
+def _digest(kind: str, payload: Any) -> str:
+    return hashlib.sha256(f"{kind}:{_canonical_json(payload)}".encode()).hexdigest()
+
+
+def _container_tree(kind: str, children: Mapping[str, SettingsTree]) -> SettingsTree:
+    if kind == "list":
+        payload: Any = [children[str(index)].sha256 for index in range(len(children))]
+    else:
+        payload = {key: child.sha256 for key, child in children.items()}
+    return SettingsTree(sha256=_digest(kind, payload), kind=kind, children=children)
+
+
+def build_settings_tree(value: Any) -> SettingsTree:
+    if isinstance(value, dict):
+        return _container_tree(
+            "dict", {str(key): build_settings_tree(child) for key, child in value.items()}
+        )
+    if isinstance(value, list):
+        return _container_tree(
+            "list", {str(index): build_settings_tree(child) for index, child in enumerate(value)}
+        )
+    # The scalar's Python type is part of the digest: 1, 1.0, and True differ on
+    # the device even though they compare equal in Python.
+    return SettingsTree(sha256=_digest(f"leaf:{type(value).__name__}", value), kind="leaf")
+
+
+def bulk_update_settings_tree(
+    control_tree: SettingsTree, target_tree: SettingsTree
+) -> SettingsTree:
+    """Compose the expected-profile digest from cached subtrees without rehashing them.
+
+    Mirrors ``get_bulk_update_settings``: target-local sections come from the
+    target and every other section comes from the frozen control source.
+    """
+    children = dict(target_tree.children)
+    for key, child in control_tree.children.items():
+        if key not in TARGET_LOCAL_KEYS:
+            children[key] = child
+    return _container_tree("dict", children)
+
+
+def differing_sections(expected: SettingsTree, actual: SettingsTree) -> list[str]:
+    """Return top-level section names that differ, including added or missing sections."""
+    if expected.sha256 == actual.sha256:
+        return []
+    return sorted(
+        key
+        for key in set(expected.children) | set(actual.children)
+        if key not in expected.children
+        or key not in actual.children
+        or expected.children[key].sha256 != actual.children[key].sha256
+    )
@@ -0,0 +1,42 @@
+"""Share one in-flight device read among identical concurrent requests.
+
+A double click or a second browser tab must not double the load on the LAN. Each
+flight group (for example "the inventory scan" or "verification of one IP") runs
+at most one operation at a time; identical callers attach to it, and callers with
+different parameters are rejected instead of racing it for shared state.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlightConflict(RuntimeError):
+    """Raised when a different operation already owns the flight group."""
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, tuple[Hashable, asyncio.Future[Any]]] = {}
+
+    async def run(self, group: Hashable, key: Hashable, operation: Callable[[], Awaitable[T]]) -> T:
+        flight = self._flights.get(group)
+        if flight is not None:
+            running_key, task = flight
+            if running_key != key:
+                raise SingleFlightConflict(group)
+        else:
+            task = asyncio.ensure_future(operation())
+            self._flights[group] = (key, task)
+            task.add_done_callback(lambda done: self._land(group, done))
+        # A caller that disconnects must not cancel the sweep the others are waiting on.
+        return await asyncio.shield(task)
+
+    def _land(self, group: Hashable, task: asyncio.Future[Any]) -> None:
+        if self._flights.get(group, (None, None))[1] is task:
+            del self._flights[group]
+        if not task.cancelled():
+            # Mark the outcome retrieved even when every caller went away.
+            task.exception()
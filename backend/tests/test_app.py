@@ -1,6 +1,12 @@
 import asyncio
 import copy
+import ipaddress
+import json
 import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 import aiohttp
 import pytest
@@ -8,7 +14,7 @@ from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
 from backend import app as app_module
-from backend import run_receipts
+from backend import device_inventory, device_rate_limit, host_health, retry_budget, run_receipts
 from backend.app import (
     OPERATOR_INTENT_VALUE,
     PushUpdateRequest,
@@ -23,9 +29,15 @@ from backend.app import (
     settings_fingerprint,
     validate_scan_network,
 )
+from backend.device_inventory import DeviceRecord
 from backend.fleet_journal import current_name_matches_fleet_id
 from backend.naming import build_rename_settings, validate_new_name
 from backend.settings_merge import get_bulk_update_settings
+from backend.settings_tree import (
+    build_settings_tree,
+    bulk_update_settings_tree,
+    differing_sections,
+)
 
 os.environ.setdefault("ALLOWED_SUBNET", "192.0.2.0/24")
 os.environ.setdefault("ENABLE_DEVICE_WRITES", "false")
@@ -41,6 +53,13 @@ def isolated_profile_run_receipt_root(monkeypatch, tmp_path) -> None:
     monkeypatch.setenv("PROFILE_RUN_RECEIPT_ROOT", str(tmp_path / "profile-run-receipts"))
 
 
+@pytest.fixture(autouse=True)
+def isolated_host_memory(monkeypatch) -> None:
+    """Start every test without dead-host, circuit-breaker, or pacing state from earlier tests."""
+    monkeypatch.setattr(app.state, "host_health", None, raising=False)
+    monkeypatch.setattr(app.state, "device_rate_limiter", None, raising=False)
+
+
 @pytest.mark.parametrize(
     ("name", "fleet_id"),
     [
@@ -214,7 +233,7 @@ def test_known_ip_discovery_rejects_invalid_input_before_network_or_state_change
 ) -> None:
     if max_scan_hosts:
         monkeypatch.setenv("MAX_SCAN_HOSTS", max_scan_hosts)
-    app.state.devices = [{"ip": "192.0.2.99", "name": "PREVIOUS", "settings": {}}]
+    app.state.devices = [DeviceRecord(ip="192.0.2.99", name="PREVIOUS", settings={})]
     app.state.control_settings = {"name": "PREVIOUS"}
     app.state.control_device_ip = "192.0.2.99"
     app.state.control_settings_sha256 = "previous-fingerprint"
@@ -259,7 +278,7 @@ def test_known_ip_discovery_reads_only_supplied_targets_and_replaces_safe_state(
 ) -> None:
     monkeypatch.setenv("MAGEWELL_USERNAME", "Admin")
     monkeypatch.setenv("MAGEWELL_PASSWORD", "password")
-    app.state.devices = [{"ip": "192.0.2.99", "name": "PREVIOUS", "settings": {}}]
+    app.state.devices = [DeviceRecord(ip="192.0.2.99", name="PREVIOUS", settings={})]
     app.state.control_settings = {"name": "PREVIOUS"}
     app.state.control_device_ip = "192.0.2.99"
     app.state.control_settings_sha256 = "previous-fingerprint"
@@ -301,7 +320,11 @@ def test_known_ip_discovery_reads_only_supplied_targets_and_replaces_safe_state(
     assert pinged_ips == ["192.0.2.10", "192.0.2.11"]
     assert report_ips == ["192.0.2.10", "192.0.2.11"]
     assert identity_ips == ["192.0.2.10", "192.0.2.11"]
-    assert response.json() == {
+    body = response.json()
+    scan = body.pop("scan")
+    assert (scan["status"], scan["host_count"], scan["probed_count"]) == ("complete", 2, 2)
+    assert scan["write_eligible"] is True
+    assert body == {
         "cached": False,
         "devices": [
             {
@@ -330,6 +353,90 @@ def test_known_ip_discovery_reads_only_supplied_targets_and_replaces_safe_state(
     assert app.state.devices[0]["settings"]["wifi"][0]["passwd"] == "secret"
 
 
+def test_scan_deadline_keeps_partial_inventory_that_is_not_write_eligible(monkeypatch) -> None:
+    monkeypatch.setenv("MAGEWELL_USERNAME", "Admin")
+    monkeypatch.setenv("MAGEWELL_PASSWORD", "password")
+    monkeypatch.setattr(app.state, "rename_scan_required", False, raising=False)
+    monkeypatch.setattr(app.state, "inventory_scan", None, raising=False)
+
+    async def ping(_session, ip, _timeout):
+        if ip.endswith(".11"):
+            await asyncio.sleep(10)
+        return True
+
+    async def report(_session, ip, *_args, **_kwargs):
+        return {"name": "AIO-01"}
+
+    async def identity(_session, ip, *_args, **_kwargs):
+        return {"serial": "B313230202253", "eth_mac": "d0:c8:57:81:58:86", "fleet_id": "AIO-01"}
+
+    monkeypatch.setattr(app_module, "ping_magewell", ping)
+    monkeypatch.setattr(app_module, "get_device_report_with_login", report)
+    monkeypatch.setattr(app_module, "get_device_identity_with_login", identity)
+
+    response = client.post(
+        "/discover-known-ips?deadline_seconds=0.05",
+        json={"ips": ["192.0.2.10", "192.0.2.11"]},
+        headers=OPERATOR_HEADERS,
+    )
+
+    assert response.status_code == 200
+    assert [device["ip"] for device in response.json()["devices"]] == ["192.0.2.10"]
+    scan = response.json()["scan"]
+    assert scan["status"] == "partial" and scan["partial_reason"] == "deadline"
+    assert (scan["host_count"], scan["probed_count"], scan["write_eligible"]) == (2, 1, False)
+    assert client.get("/discover-status").json() == {"running": None, "latest": scan}
+
+    monkeypatch.setenv("ENABLE_DEVICE_WRITES", "true")
+    rename = client.post(
+        "/rename-plan",
+        json={"mappings": [{"ip": "192.0.2.10", "new_name": "AIO-01-NEW"}]},
+        headers=OPERATOR_HEADERS,
+    )
+    push = client.post(
+        "/push-updates",
+        json={"confirm": True, "devices": [{"ip": "192.0.2.10", "magewell_id": "AIO-01"}]},
+        headers=OPERATOR_HEADERS,
+    )
+    assert rename.status_code == push.status_code == 409
+    assert "partial (deadline)" in push.json()["detail"]
+
+
+def test_cancelled_scan_returns_partial_inventory(monkeypatch) -> None:
+    monkeypatch.setenv("MAGEWELL_USERNAME", "Admin")
+    monkeypatch.setenv("MAGEWELL_PASSWORD", "password")
+    monkeypatch.setattr(app.state, "inventory_scan", None, raising=False)
+    pinged = asyncio.Event()
+
+    async def ping(_session, ip, _timeout):
+        pinged.set()
+        await asyncio.sleep(10)
+        return True
+
+    monkeypatch.setattr(app_module, "ping_magewell", ping)
+
+    async def scan_then_cancel() -> tuple[dict, dict]:
+        scan = asyncio.create_task(
+            app_module.discover_devices_from_ips(["192.0.2.10"], "Admin", "password", 1.0, 5, 1.0)
+        )
+        await pinged.wait()
+        running = (await app_module.discover_status())["running"]
+        cancelled = await app_module.discover_cancel(
+            running["scan_id"], OPERATOR_INTENT_VALUE, None
+        )
+        assert await scan == []
+        return running, cancelled
+
+    running, cancelled = asyncio.run(scan_then_cancel())
+
+    assert running["host_count"] == 1 and "cancel" not in running
+    assert cancelled == {"scan_id": running["scan_id"], "cancel_requested": True}
+    assert app.state.inventory_scan["partial_reason"] == "cancelled"
+    assert app.state.inventory_scan["write_eligible"] is False
+    missing = client.post("/discover-cancel", headers=OPERATOR_HEADERS)
+    assert missing.status_code == 409
+
+
 def test_live_profile_preserves_target_local_settings() -> None:
     source = {
         "name": "CONTROL",
@@ -462,36 +569,36 @@ def test_set_name_call_uses_authenticated_official_endpoint_without_retry() -> N
 
 def test_rename_plan_uses_journal_ids_and_rejects_name_collisions() -> None:
     app.state.devices = [
-        {
-            "ip": "192.0.2.11",
-            "name": "B",
-            "settings": {"name": "B", "rec-channels": []},
-            "identity": {
+        DeviceRecord(
+            ip="192.0.2.11",
+            name="B",
+            settings={"name": "B", "rec-channels": []},
+            identity={
                 "serial": "B313230505229",
                 "eth_mac": "d0:c8:57:81:c8:f5",
                 "fleet_id": "AIO-02",
             },
-        },
-        {
-            "ip": "192.0.2.10",
-            "name": "A",
-            "settings": {"name": "A", "rec-channels": []},
-            "identity": {
+        ),
+        DeviceRecord(
+            ip="192.0.2.10",
+            name="A",
+            settings={"name": "A", "rec-channels": []},
+            identity={
                 "serial": "B313230202253",
                 "eth_mac": "d0:c8:57:81:58:86",
                 "fleet_id": "AIO-01",
             },
-        },
-        {
-            "ip": "192.0.2.12",
-            "name": "KEEP_13",
-            "settings": {"name": "KEEP_13", "rec-channels": []},
-            "identity": {
+        ),
+        DeviceRecord(
+            ip="192.0.2.12",
+            name="KEEP_13",
+            settings={"name": "KEEP_13", "rec-channels": []},
+            identity={
                 "serial": "B313230505230",
                 "eth_mac": "d0:c8:57:81:99:23",
                 "fleet_id": "AIO-13",
             },
-        },
+        ),
     ]
     response = client.post(
         "/rename-plan",
@@ -506,8 +613,12 @@ def test_rename_plan_uses_journal_ids_and_rejects_name_collisions() -> None:
         ("192.0.2.11", "STAGE-02"),
         ("192.0.2.10", "STAGE-01"),
     ]
-    app.state.devices[2]["name"] = "STAGE-01"
-    app.state.devices[2]["settings"]["name"] = "STAGE-01"
+    app.state.devices[2] = DeviceRecord(
+        ip="192.0.2.12",
+        name="STAGE-01",
+        settings={"name": "STAGE-01", "rec-channels": []},
+        identity=app.state.devices[2]["identity"],
+    )
     collision = client.post(
         "/rename-plan",
         json={"mappings": [{"ip": "192.0.2.10", "new_name": "STAGE-01"}]},
@@ -550,16 +661,16 @@ def test_rename_execute_is_sequential_verified_and_not_resubmittable(monkeypatch
         },
     }
     app.state.devices = [
-        {
-            "ip": ip,
-            "name": settings["name"],
-            "settings": settings,
-            "identity": {
+        DeviceRecord(
+            ip=ip,
+            name=settings["name"],
+            settings=settings,
+            identity={
                 "serial": "B313230202253" if ip.endswith("10") else "B313230505229",
                 "eth_mac": "d0:c8:57:81:58:86" if ip.endswith("10") else "d0:c8:57:81:c8:f5",
                 "fleet_id": "AIO-01" if ip.endswith("10") else "AIO-02",
             },
-        }
+        )
         for ip, settings in before.items()
     ]
     plan_response = client.post(
@@ -594,7 +705,8 @@ def test_rename_execute_is_sequential_verified_and_not_resubmittable(monkeypatch
 
     async def report(_session, ip, *_args, **_kwargs):
         report_calls[ip] += 1
-        return [before[ip], after_display_name[ip], after[ip]][report_calls[ip] - 1]
+        # The first read is the concurrent pre-validation sweep.
+        return [before[ip], before[ip], after_display_name[ip], after[ip]][report_calls[ip] - 1]
 
     async def login(*_args, **_kwargs):
         return "session-cookie"
@@ -663,6 +775,217 @@ def test_rename_execute_is_sequential_verified_and_not_resubmittable(monkeypatch
     assert "fresh plan" in retry.json()["detail"]
 
 
+def test_rename_execute_prevalidates_every_target_before_first_mutation(monkeypatch) -> None:
+    before = {
+        "192.0.2.10": {"name": "OLD-A", "rec-channels": []},
+        "192.0.2.11": {"name": "OLD-B", "rec-channels": []},
+    }
+    app.state.devices = [
+        DeviceRecord(
+            ip=ip,
+            name=settings["name"],
+            settings=settings,
+            identity={
+                "serial": "B313230202253" if ip.endswith("10") else "B313230505229",
+                "eth_mac": "d0:c8:57:81:58:86" if ip.endswith("10") else "d0:c8:57:81:c8:f5",
+                "fleet_id": "AIO-01" if ip.endswith("10") else "AIO-02",
+            },
+        )
+        for ip, settings in before.items()
+    ]
+    plan_id = client.post(
+        "/rename-plan",
+        json={"prefix": "STAGE", "device_ips": list(before)},
+        headers=OPERATOR_HEADERS,
+    ).json()["plan_id"]
+    mutations: list[str] = []
+
+    async def report(_session, ip, *_args, **_kwargs):
+        if ip == "192.0.2.11":
+            return {**before[ip], "name": "DRIFTED"}
+        return before[ip]
+
+    async def identity(_session, ip, *_args, **_kwargs):
+        return next(device["identity"] for device in app.state.devices if device["ip"] == ip)
+
+    async def set_name(_session, ip, *_args):
+        mutations.append(f"set-name:{ip}")
+        return {"result": 0}
+
+    monkeypatch.setenv("MAGEWELL_USERNAME", "test-user")
+    monkeypatch.setenv("MAGEWELL_PASSWORD", "test-password")
+    monkeypatch.setattr(app_module, "get_device_report_with_login", report)
+    monkeypatch.setattr(app_module, "get_device_identity_with_login", identity)
+    monkeypatch.setattr(app_module, "set_name_call", set_name)
+    # The stopped batch demands a fresh scan; restore the flag for later tests.
+    monkeypatch.setattr(app.state, "rename_scan_required", False, raising=False)
+
+    response = client.post(
+        "/rename-execute",
+        json={"plan_id": plan_id, "confirm": True},
+        headers=OPERATOR_HEADERS,
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert mutations == []
+    assert body["prevalidation"] == {"checked_count": 2, "failed_count": 1}
+    assert [(result["ip"], result["status"]) for result in body["results"]] == [
+        ("192.0.2.11", "stopped-before-submission"),
+        ("192.0.2.10", "not-submitted"),
+    ]
+    assert body["summary"]["submitted_count"] == 0
+
+
+def test_rename_execute_prepares_next_target_during_settle_window(monkeypatch) -> None:
+    before = {
+        "192.0.2.10": {"name": "OLD-A", "rec-channels": []},
+        "192.0.2.11": {"name": "OLD-B", "rec-channels": []},
+    }
+    renamed = {
+        "192.0.2.10": {"name": "STAGE-01", "rec-channels": []},
+        "192.0.2.11": {"name": "STAGE-02", "rec-channels": []},
+    }
+    app.state.devices = [
+        DeviceRecord(
+            ip=ip,
+            name=settings["name"],
+            settings=settings,
+            identity={
+                "serial": "B313230202253" if ip.endswith("10") else "B313230505229",
+                "eth_mac": "d0:c8:57:81:58:86" if ip.endswith("10") else "d0:c8:57:81:c8:f5",
+                "fleet_id": "AIO-01" if ip.endswith("10") else "AIO-02",
+            },
+        )
+        for ip, settings in before.items()
+    ]
+    plan_id = client.post(
+        "/rename-plan",
+        json={"prefix": "STAGE", "device_ips": list(before)},
+        headers=OPERATOR_HEADERS,
+    ).json()["plan_id"]
+    report_calls: dict[str, int] = {ip: 0 for ip in before}
+    events: list[str] = []
+
+    async def report(_session, ip, *_args, **_kwargs):
+        report_calls[ip] += 1
+        events.append(f"read:{ip}:{report_calls[ip]}")
+        await asyncio.sleep(0)
+        # Sweep and re-check see the old name; the first settle read is still stale.
+        return before[ip] if report_calls[ip] <= 3 else renamed[ip]
+
+    async def identity(_session, ip, *_args, **_kwargs):
+        return next(device["identity"] for device in app.state.devices if device["ip"] == ip)
+
+    async def login(*_args, **_kwargs):
+        return "session-cookie"
+
+    async def set_name(_session, ip, *_args):
+        events.append(f"set-name:{ip}")
+        return {"result": 0}
+
+    monkeypatch.setenv("MAGEWELL_USERNAME", "test-user")
+    monkeypatch.setenv("MAGEWELL_PASSWORD", "test-password")
+    monkeypatch.setattr(app_module, "get_device_report_with_login", report)
+    monkeypatch.setattr(app_module, "get_device_identity_with_login", identity)
+    monkeypatch.setattr(app_module, "login_device", login)
+    monkeypatch.setattr(app_module, "set_name_call", set_name)
+    monkeypatch.setattr(app_module, "settle_poll_delays", lambda: [0.0] * 5)
+
+    response = client.post(
+        "/rename-execute",
+        json={"plan_id": plan_id, "confirm": True},
+        headers=OPERATOR_HEADERS,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["outcome"] == "fully-successful"
+    # Target B's re-check ran inside target A's settle window, but its set-name
+    # followed A's verifying read.
+    assert (
+        events.index("set-name:192.0.2.10")
+        < events.index("read:192.0.2.11:2")
+        < events.index("read:192.0.2.10:4")
+        < events.index("set-name:192.0.2.11")
+    )
+    assert report_calls == {"192.0.2.10": 4, "192.0.2.11": 4}
+
+
+def test_rename_execute_reconfirms_stale_prepared_target_before_set_name(monkeypatch) -> None:
+    before = {
+        "192.0.2.10": {"name": "OLD-A", "rec-channels": []},
+        "192.0.2.11": {"name": "OLD-B", "rec-channels": []},
+    }
+    app.state.devices = [
+        DeviceRecord(
+            ip=ip,
+            name=settings["name"],
+            settings=settings,
+            identity={
+                "serial": "B313230202253" if ip.endswith("10") else "B313230505229",
+                "eth_mac": "d0:c8:57:81:58:86" if ip.endswith("10") else "d0:c8:57:81:c8:f5",
+                "fleet_id": "AIO-01" if ip.endswith("10") else "AIO-02",
+            },
+        )
+        for ip, settings in before.items()
+    ]
+    plan_id = client.post(
+        "/rename-plan",
+        json={"prefix": "STAGE", "device_ips": list(before)},
+        headers=OPERATOR_HEADERS,
+    ).json()["plan_id"]
+    report_calls: dict[str, int] = {ip: 0 for ip in before}
+    set_name_ips: list[str] = []
+    name_reads: list[tuple[str, str]] = []
+
+    async def report(_session, ip, *_args, **_kwargs):
+        report_calls[ip] += 1
+        if report_calls[ip] <= 2:
+            return before[ip]
+        return {"name": "STAGE-01", "rec-channels": []}
+
+    async def identity(_session, ip, *_args, **_kwargs):
+        return next(device["identity"] for device in app.state.devices if device["ip"] == ip)
+
+    async def login(*_args, **_kwargs):
+        return "fresh-cookie"
+
+    async def device_name(_session, ip, cookie_header, _timeout):
+        name_reads.append((ip, cookie_header))
+        if cookie_header != "fresh-cookie":
+            raise RuntimeError("session expired")
+        # Someone renamed target B after its pipelined re-check.
+        return before[ip]["name"] if ip.endswith("10") else "RENAMED-ELSEWHERE"
+
+    async def set_name(_session, ip, *_args):
+        set_name_ips.append(ip)
+        return {"result": 0}
+
+    monkeypatch.setenv("MAGEWELL_USERNAME", "test-user")
+    monkeypatch.setenv("MAGEWELL_PASSWORD", "test-password")
+    monkeypatch.setattr(app_module, "get_device_report_with_login", report)
+    monkeypatch.setattr(app_module, "get_device_identity_with_login", identity)
+    monkeypatch.setattr(app_module, "login_device", login)
+    monkeypatch.setattr(app_module, "get_device_name", device_name)
+    monkeypatch.setattr(app_module, "set_name_call", set_name)
+    monkeypatch.setattr(app_module, "settle_poll_delays", lambda: [0.0] * 5)
+    monkeypatch.setattr(app_module, "RENAME_PREPARED_MAX_AGE_SECONDS", -1.0)
+    monkeypatch.setattr(app.state, "rename_scan_required", False, raising=False)
+
+    response = client.post(
+        "/rename-execute",
+        json={"plan_id": plan_id, "confirm": True},
+        headers=OPERATOR_HEADERS,
+    )
+
+    assert response.status_code == 200
+    results = {result["ip"]: result for result in response.json()["results"]}
+    assert set_name_ips == ["192.0.2.10"]
+    assert results["192.0.2.11"]["status"] == "stopped-before-submission"
+    assert "Live device name changed" in results["192.0.2.11"]["error"]
+    assert ("192.0.2.11", "fresh-cookie") in name_reads
+
+
 def test_rename_execute_allows_read_only_settle_without_resubmitting_mutations(monkeypatch) -> None:
     before = {
         "name": "OLD-A",
@@ -677,23 +1000,23 @@ def test_rename_execute_allows_read_only_settle_without_resubmitting_mutations(m
         "rec-channels": [{"dir-name": "STAGE-01_REC", "prefix-name": "STAGE-01_"}],
     }
     app.state.devices = [
-        {
-            "ip": "192.0.2.10",
-            "name": before["name"],
-            "settings": before,
-            "identity": {
+        DeviceRecord(
+            ip="192.0.2.10",
+            name=before["name"],
+            settings=before,
+            identity={
                 "serial": "B313230202253",
                 "eth_mac": "d0:c8:57:81:58:86",
                 "fleet_id": "AIO-01",
             },
-        }
+        )
     ]
     plan_id = client.post(
         "/rename-plan",
         json={"prefix": "STAGE", "device_ips": ["192.0.2.10"]},
         headers=OPERATOR_HEADERS,
     ).json()["plan_id"]
-    reports = iter([before, before, after_display_name, after_display_name, after])
+    reports = iter([before, before, before, after_display_name, after_display_name, after])
     mutations: list[str] = []
     sleeps: list[int] = []
 
@@ -738,7 +1061,17 @@ def test_rename_execute_allows_read_only_settle_without_resubmitting_mutations(m
     assert result["display_name_readback_attempts"] == 2
     assert result["recording_names_readback_attempts"] == 2
     assert mutations == ["set-name", "import-settings"]
-    assert sleeps == [2, 2]
+    assert sleeps == [0.25, 0.25]
+
+
+def test_settle_poll_backs_off_within_the_ten_second_window() -> None:
+    delays = app_module.settle_poll_delays()
+
+    assert len(delays) == app_module.SETTLE_POLL_ATTEMPTS - 1
+    assert delays[0] == app_module.SETTLE_POLL_FIRST_INTERVAL_SECONDS
+    assert delays == sorted(delays[:-1]) + delays[-1:]
+    assert max(delays) <= app_module.SETTLE_POLL_MAX_INTERVAL_SECONDS
+    assert sum(delays) == pytest.approx(app_module.SETTLE_POLL_WINDOW_SECONDS)
 
 
 def test_rename_execute_stops_after_recording_submission_and_marks_remaining_unsubmitted(
@@ -755,16 +1088,16 @@ def test_rename_execute_stops_after_recording_submission_and_marks_remaining_uns
         },
     }
     app.state.devices = [
-        {
-            "ip": ip,
-            "name": settings["name"],
-            "settings": settings,
-            "identity": {
+        DeviceRecord(
+            ip=ip,
+            name=settings["name"],
+            settings=settings,
+            identity={
                 "serial": "B313230202253" if ip.endswith("10") else "B313230505229",
                 "eth_mac": "d0:c8:57:81:58:86" if ip.endswith("10") else "d0:c8:57:81:c8:f5",
                 "fleet_id": "AIO-01" if ip.endswith("10") else "AIO-02",
             },
-        }
+        )
         for ip, settings in before.items()
     ]
     plan_id = client.post(
@@ -783,7 +1116,7 @@ def test_rename_execute_stops_after_recording_submission_and_marks_remaining_uns
 
     async def report(_session, ip, *_args, **_kwargs):
         report_calls[ip] += 1
-        if ip == "192.0.2.10" and report_calls[ip] == 2:
+        if ip == "192.0.2.10" and report_calls[ip] == 3:
             return display_reads[ip]
         return before[ip]
 
@@ -853,31 +1186,31 @@ def test_live_profile_rejects_schema_or_identity_mismatch() -> None:
 
 def test_control_source_classifies_target_schema_compatibility() -> None:
     app.state.devices = [
-        {
-            "ip": "192.0.2.10",
-            "name": "SOURCE",
-            "settings": {
+        DeviceRecord(
+            ip="192.0.2.10",
+            name="SOURCE",
+            settings={
                 "name": "SOURCE",
                 "profile": "camera",
                 "enable-ndi-bridge": 1,
             },
-        },
-        {
-            "ip": "192.0.2.11",
-            "name": "TARGET-PLUS",
-            "settings": {
+        ),
+        DeviceRecord(
+            ip="192.0.2.11",
+            name="TARGET-PLUS",
+            settings={
                 "name": "TARGET-PLUS",
                 "profile": "old",
                 "enable-ndi-bridge": 0,
                 "enable-zen-master": 1,
                 "zen-master": {"registered": True},
             },
-        },
-        {
-            "ip": "192.0.2.12",
-            "name": "TARGET-MISSING",
-            "settings": {"name": "TARGET-MISSING", "profile": "old"},
-        },
+        ),
+        DeviceRecord(
+            ip="192.0.2.12",
+            name="TARGET-MISSING",
+            settings={"name": "TARGET-MISSING", "profile": "old"},
+        ),
     ]
 
     response = client.post(
@@ -907,26 +1240,26 @@ def test_profile_plan_is_deterministic_redacted_and_uses_cached_state(monkeypatc
         "wifi": [{"passwd": "target-secret"}],
     }
     app.state.devices = [
-        {
-            "ip": "192.0.2.10",
-            "name": "SOURCE-01",
-            "settings": source_settings,
-            "identity": {
+        DeviceRecord(
+            ip="192.0.2.10",
+            name="SOURCE-01",
+            settings=source_settings,
+            identity={
                 "serial": "SOURCE-SERIAL",
                 "eth_mac": "00:11:22:33:44:55",
                 "fleet_id": "AIO-01",
             },
-        },
-        {
-            "ip": "192.0.2.11",
-            "name": "TARGET-01",
-            "settings": target_settings,
-            "identity": {
+        ),
+        DeviceRecord(
+            ip="192.0.2.11",
+            name="TARGET-01",
+            settings=target_settings,
+            identity={
                 "serial": "TARGET-SERIAL",
                 "eth_mac": "00:11:22:33:44:66",
                 "fleet_id": "AIO-02",
             },
-        },
+        ),
     ]
     app.state.control_settings = copy.deepcopy(source_settings)
     app.state.control_device_ip = "192.0.2.10"
@@ -959,18 +1292,23 @@ def test_profile_plan_is_deterministic_redacted_and_uses_cached_state(monkeypatc
     assert app.state.devices == before_devices
     assert app.state.control_settings == before_control
 
-    app.state.devices[1]["settings"]["profile"] = {"mode": "new"}
+    app.state.devices[1] = DeviceRecord(
+        ip="192.0.2.11",
+        name="TARGET-01",
+        settings={**target_settings, "profile": {"mode": "new"}},
+        identity=app.state.devices[1]["identity"],
+    )
     changed_target = client.post("/profile-plan", json=request, headers=OPERATOR_HEADERS)
     assert changed_target.status_code == 200
     assert changed_target.json()["plan_id"] != first.json()["plan_id"]
 
     app.state.devices.append(
-        {
-            "ip": "192.0.2.12",
-            "name": "INVENTORY-ONLY",
-            "settings": {"name": "INVENTORY-ONLY", "profile": {"mode": "old"}},
-            "identity": {"serial": "INVENTORY", "eth_mac": "00:11:22:33:44:77"},
-        }
+        DeviceRecord(
+            ip="192.0.2.12",
+            name="INVENTORY-ONLY",
+            settings={"name": "INVENTORY-ONLY", "profile": {"mode": "old"}},
+            identity={"serial": "INVENTORY", "eth_mac": "00:11:22:33:44:77"},
+        )
     )
     changed_inventory = client.post("/profile-plan", json=request, headers=OPERATOR_HEADERS)
     assert changed_inventory.status_code == 200
@@ -992,18 +1330,18 @@ def test_profile_plan_requires_operator_intent_before_cached_state_access() -> N
 def test_profile_plan_rejects_stale_source_before_network_or_state_mutation(monkeypatch) -> None:
     source_settings = {"name": "SOURCE-01", "profile": {"mode": "camera"}}
     app.state.devices = [
-        {
-            "ip": "192.0.2.10",
-            "name": "SOURCE-01",
-            "settings": {"name": "SOURCE-01", "profile": {"mode": "changed"}},
-            "identity": {"serial": "SOURCE", "eth_mac": "00:11:22:33:44:55"},
-        },
-        {
-            "ip": "192.0.2.11",
-            "name": "TARGET-01",
-            "settings": {"name": "TARGET-01", "profile": {"mode": "old"}},
-            "identity": {"serial": "TARGET", "eth_mac": "00:11:22:33:44:66"},
-        },
+        DeviceRecord(
+            ip="192.0.2.10",
+            name="SOURCE-01",
+            settings={"name": "SOURCE-01", "profile": {"mode": "changed"}},
+            identity={"serial": "SOURCE", "eth_mac": "00:11:22:33:44:55"},
+        ),
+        DeviceRecord(
+            ip="192.0.2.11",
+            name="TARGET-01",
+            settings={"name": "TARGET-01", "profile": {"mode": "old"}},
+            identity={"serial": "TARGET", "eth_mac": "00:11:22:33:44:66"},
+        ),
     ]
     app.state.control_settings = copy.deepcopy(source_settings)
     app.state.control_device_ip = "192.0.2.10"
@@ -1036,18 +1374,18 @@ def test_profile_plan_rejects_stale_source_before_network_or_state_mutation(monk
 def test_profile_plan_reports_cached_incompatibility_without_network_access(monkeypatch) -> None:
     source_settings = {"name": "SOURCE-01", "profile": {"mode": "camera"}, "bridge": True}
     app.state.devices = [
-        {
-            "ip": "192.0.2.10",
-            "name": "SOURCE-01",
-            "settings": source_settings,
-            "identity": {"serial": "SOURCE", "eth_mac": "00:11:22:33:44:55"},
-        },
-        {
-            "ip": "192.0.2.11",
-            "name": "TARGET-01",
-            "settings": {"name": "TARGET-01", "profile": {"mode": "old"}},
-            "identity": {"serial": "TARGET", "eth_mac": "00:11:22:33:44:66"},
-        },
+        DeviceRecord(
+            ip="192.0.2.10",
+            name="SOURCE-01",
+            settings=source_settings,
+            identity={"serial": "SOURCE", "eth_mac": "00:11:22:33:44:55"},
+        ),
+        DeviceRecord(
+            ip="192.0.2.11",
+            name="TARGET-01",
+            settings={"name": "TARGET-01", "profile": {"mode": "old"}},
+            identity={"serial": "TARGET", "eth_mac": "00:11:22:33:44:66"},
+        ),
     ]
     app.state.control_settings = copy.deepcopy(source_settings)
     app.state.control_device_ip = "192.0.2.10"
@@ -1088,18 +1426,18 @@ def test_profile_plan_reports_cached_incompatibility_without_network_access(monk
 def test_profile_plan_rejects_incomplete_cached_identity_before_network_access(monkeypatch) -> None:
     source_settings = {"name": "SOURCE-01", "profile": {"mode": "camera"}}
     app.state.devices = [
-        {
-            "ip": "192.0.2.10",
-            "name": "SOURCE-01",
-            "settings": source_settings,
-            "identity": {"serial": "SOURCE", "eth_mac": "00:11:22:33:44:55"},
-        },
-        {
-            "ip": "192.0.2.11",
-            "name": "TARGET-01",
-            "settings": {"name": "TARGET-01", "profile": {"mode": "old"}},
-            "identity_error": "identity unavailable",
-        },
+        DeviceRecord(
+            ip="192.0.2.10",
+            name="SOURCE-01",
+            settings=source_settings,
+            identity={"serial": "SOURCE", "eth_mac": "00:11:22:33:44:55"},
+        ),
+        DeviceRecord(
+            ip="192.0.2.11",
+            name="TARGET-01",
+            settings={"name": "TARGET-01", "profile": {"mode": "old"}},
+            identity_error="identity unavailable",
+        ),
     ]
     app.state.control_settings = copy.deepcopy(source_settings)
     app.state.control_device_ip = "192.0.2.10"
@@ -1128,11 +1466,11 @@ def test_profile_plan_rejects_incomplete_cached_identity_before_network_access(m
 def test_device_settings_are_not_returned_to_the_browser() -> None:
     assert public_device_list(
         [
-            {
-                "ip": "192.0.2.10",
-                "name": "ENCODER-01",
-                "settings": {"wifi": [{"passwd": "secret"}]},
-            }
+            DeviceRecord(
+                ip="192.0.2.10",
+                name="ENCODER-01",
+                settings={"wifi": [{"passwd": "secret"}]},
+            )
         ]
     ) == [{"ip": "192.0.2.10", "name": "ENCODER-01"}]
 
@@ -1140,17 +1478,17 @@ def test_device_settings_are_not_returned_to_the_browser() -> None:
 def test_unmatched_journal_identity_is_visible_without_settings() -> None:
     assert public_device_list(
         [
-            {
-                "ip": "192.0.2.10",
-                "name": "ENCODER-01",
-                "settings": {"wifi": [{"passwd": "secret"}]},
-                "identity": {
+            DeviceRecord(
+                ip="192.0.2.10",
+                name="ENCODER-01",
+                settings={"wifi": [{"passwd": "secret"}]},
+                identity={
                     "serial": "B313230202253",
                     "eth_mac": "d0:c8:57:81:58:86",
                     "fleet_id": "",
                 },
-                "identity_error": "Device serial/MAC pair is not present in the fleet journal.",
-            }
+                identity_error="Device serial/MAC pair is not present in the fleet journal.",
+            )
         ]
     ) == [
         {
@@ -1164,11 +1502,656 @@ def test_unmatched_journal_identity_is_visible_without_settings() -> None:
     ]
 
 
-def test_loopback_default_is_a_valid_single_host(monkeypatch) -> None:
+def test_inventory_record_precomputes_views_and_freezes_settings() -> None:
+    settings = {"name": "AIO-02-ROOM", "wifi": [{"passwd": "secret"}], "profile": {"a": 1}}
+    record = DeviceRecord(
+        ip="192.0.2.10",
+        name="AIO-02-ROOM",
+        settings=settings,
+        identity={"serial": "SERIAL-02", "eth_mac": "00:11:22:33:44:55", "fleet_id": "AIO-02"},
+    )
+    settings["profile"]["a"] = 2
+
+    assert record.settings["profile"] == {"a": 1}
+    assert record.settings_sha256 == settings_fingerprint({**settings, "profile": {"a": 1}})
+    assert record.identity_key == ("SERIAL-02", "00:11:22:33:44:55", "AIO-02")
+    assert public_device_list([record]) == [
+        {
+            "ip": "192.0.2.10",
+            "name": "AIO-02-ROOM",
+            "serial": "SERIAL-02",
+            "eth_mac": "00:11:22:33:44:55",
+            "fleet_id": "AIO-02",
+            "name_journal_mismatch": False,
+        }
+    ]
+    assert dict(record) == {
+        "ip": "192.0.2.10",
+        "name": "AIO-02-ROOM",
+        "settings": {"name": "AIO-02-ROOM", "wifi": [{"passwd": "secret"}], "profile": {"a": 1}},
+        "identity": {"serial": "SERIAL-02", "eth_mac": "00:11:22:33:44:55", "fleet_id": "AIO-02"},
+    }
+    assert record.get("read_error") is None
+    with pytest.raises(TypeError, match="read-only"):
+        record.settings["profile"]["a"] = 3
+    with pytest.raises(TypeError, match="read-only"):
+        record.settings["wifi"].append({})
+    with pytest.raises(AttributeError):
+        record.name = "RENAMED"
+
+    editable = copy.deepcopy(record.settings)
+    editable["wifi"][0]["passwd"] = "changed"
+    assert type(editable) is dict and type(editable["wifi"]) is list
+    assert record.settings["wifi"][0]["passwd"] == "secret"
+    assert get_bulk_update_settings("AIO-02-ROOM", record.settings, record.settings) == settings | {
+        "profile": {"a": 1}
+    }
+
+
+def test_identical_settings_subtrees_are_shared_across_records() -> None:
+    def scanned(index: int) -> DeviceRecord:
+        return DeviceRecord(
+            ip=f"192.0.2.{index}",
+            name=f"AIO-0{index}",
+            settings={
+                "name": f"AIO-0{index}",
+                "input-source": {"video": {"port": "hdmi"}, "audio": [1, 2]},
+                "stream-server": [{"url": "rtmp://source/live", "enable": True}],
+                "eth": {"ip": f"192.0.2.{index}"},
+            },
+        )
+
+    first, second = scanned(1), scanned(2)
+
+    assert first.settings is not second.settings
+    assert first.settings["input-source"] is second.settings["input-source"]
+    assert first.settings["stream-server"] is second.settings["stream-server"]
+    assert first.settings["eth"] is not second.settings["eth"]
+    assert (
+        first.settings_tree.children["input-source"]
+        is second.settings_tree.children["input-source"]
+    )
+    key = (first.settings_tree.children["stream-server"].sha256, ())
+    assert device_inventory._interned_settings[key] is first.settings["stream-server"]
+
+    del first, second
+    assert key not in device_inventory._interned_settings
+
+
+def test_interned_settings_keep_each_devices_key_order() -> None:
+    first = DeviceRecord(
+        ip="192.0.2.1",
+        settings={"name": "A", "video": {"port": "hdmi", "mode": "auto"}, "rec-channels": []},
+    )
+    second = DeviceRecord(
+        ip="192.0.2.2",
+        settings={"rec-channels": [], "video": {"mode": "auto", "port": "hdmi"}, "name": "A"},
+    )
+    assert first.settings_tree.children["video"] is second.settings_tree.children["video"]
+    assert first.settings["video"] is not second.settings["video"]
+    assert list(second.settings) == ["rec-channels", "video", "name"]
+    assert list(second.settings["video"]) == ["mode", "port"]
+
+    payload, _ = device_inventory.intern_settings(
+        build_rename_settings(second.settings, "A", "B")[0]
+    )
+    assert json.dumps(payload) == json.dumps(
+        {"rec-channels": [], "video": {"mode": "auto", "port": "hdmi"}, "name": "B"}
+    )
+
+
+def test_loopback_default_is_a_valid_single_host(monkeypatch) -> None:
     monkeypatch.setenv("ALLOWED_SUBNET", "127.0.0.1/32")
     assert str(validate_scan_network("127.0.0.1/32")) == "127.0.0.1/32"
 
 
+def test_scan_scope_accepts_several_in_scope_networks(monkeypatch) -> None:
+    monkeypatch.setenv("ALLOWED_SUBNET", "192.0.2.0/24, 198.51.100.0/24")
+
+    networks = app_module.validate_scan_networks("192.0.2.0/30, 198.51.100.8/29")
+
+    assert [str(network) for network in networks] == ["192.0.2.0/30", "198.51.100.8/29"]
+    assert app_module.interleave_site_hosts(networks) == [
+        "192.0.2.1",
+        "198.51.100.9",
+        "192.0.2.2",
+        "198.51.100.10",
+        "198.51.100.11",
+        "198.51.100.12",
+        "198.51.100.13",
+        "198.51.100.14",
+    ]
+    assert app_module.validate_device_ip("198.51.100.20") == "198.51.100.20"
+    assert client.get("/healthz").json()["allowed_subnet"] == "192.0.2.0/24, 198.51.100.0/24"
+    with pytest.raises(HTTPException, match="overlap"):
+        app_module.validate_scan_networks("192.0.2.0/25,192.0.2.64/26")
+    with pytest.raises(HTTPException, match="within ALLOWED_SUBNET"):
+        app_module.validate_scan_networks("192.0.2.0/24,203.0.113.0/24")
+    monkeypatch.setenv("MAX_SCAN_HOSTS", "300")
+    with pytest.raises(HTTPException, match="508 hosts"):
+        app_module.validate_scan_networks("192.0.2.0/24,198.51.100.0/24")
+
+
+def test_multi_site_scan_shares_global_budget_under_per_site_limits(monkeypatch) -> None:
+    monkeypatch.setenv("ALLOWED_SUBNET", "192.0.2.0/24,198.51.100.0/24")
+    monkeypatch.setenv("MAGEWELL_USERNAME", "Admin")
+    monkeypatch.setenv("MAGEWELL_PASSWORD", "password")
+    monkeypatch.setattr(app.state, "inventory_scan", None, raising=False)
+    monkeypatch.setattr(app.state, "fleet_last_seen", {}, raising=False)
+    in_flight: dict[str, int] = {}
+    peaks = {"total": 0, "192.0.2": 0, "198.51.100": 0}
+
+    async def ping(_session, ip, _timeout):
+        site = ip.rsplit(".", 1)[0]
+        in_flight[site] = in_flight.get(site, 0) + 1
+        peaks[site] = max(peaks[site], in_flight[site])
+        peaks["total"] = max(peaks["total"], sum(in_flight.values()))
+        await asyncio.sleep(0.001)
+        in_flight[site] -= 1
+        return False
+
+    monkeypatch.setattr(app_module, "ping_magewell", ping)
+
+    response = client.get(
+        "/discover-magewell",
+        params={
+            "subnet": "192.0.2.0/27,198.51.100.0/28",
+            "rescan": "true",
+            "max_concurrent": 5,
+            "per_site_concurrent": 3,
+        },
+        headers=OPERATOR_HEADERS,
+    )
+
+    assert response.status_code == 200
+    scan = response.json()["scan"]
+    assert (scan["host_count"], scan["site_count"], scan["probed_count"]) == (44, 2, 44)
+    assert peaks == {"total": 5, "192.0.2": 3, "198.51.100": 3}
+
+
+def test_scan_limits_cover_report_and_identity_reads(monkeypatch) -> None:
+    monkeypatch.setenv("ALLOWED_SUBNET", "192.0.2.0/24,198.51.100.0/24")
+    monkeypatch.setenv("MAGEWELL_USERNAME", "Admin")
+    monkeypatch.setenv("MAGEWELL_PASSWORD", "password")
+    monkeypatch.setattr(app.state, "inventory_scan", None, raising=False)
+    monkeypatch.setattr(app.state, "fleet_last_seen", {}, raising=False)
+    in_flight: dict[str, int] = {}
+    peaks = {"total": 0, "192.0.2": 0, "198.51.100": 0}
+
+    async def tracked(ip: str, result):
+        site = ip.rsplit(".", 1)[0]
+        in_flight[site] = in_flight.get(site, 0) + 1
+        peaks[site] = max(peaks[site], in_flight[site])
+        peaks["total"] = max(peaks["total"], sum(in_flight.values()))
+        await asyncio.sleep(0.001)
+        in_flight[site] -= 1
+        return result
+
+    async def ping(_session, ip, _timeout):
+        return True
+
+    async def report(_session, ip, *_args):
+        return await tracked(ip, {"name": f"AIO-{ip}"})
+
+    async def identity(_session, ip, *_args):
+        return await tracked(ip, {"serial": ip, "eth_mac": ip, "fleet_id": ""})
+
+    monkeypatch.setattr(app_module, "ping_magewell", ping)
+    monkeypatch.setattr(app_module, "get_device_report_with_login", report)
+    monkeypatch.setattr(app_module, "get_device_identity_with_login", identity)
+
+    response = client.get(
+        "/discover-magewell",
+        params={
+            "subnet": "192.0.2.0/28,198.51.100.0/28",
+            "rescan": "true",
+            "max_concurrent": 5,
+            "per_site_concurrent": 3,
+        },
+        headers=OPERATOR_HEADERS,
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()["devices"]) == 28
+    assert peaks == {"total": 5, "192.0.2": 3, "198.51.100": 3}
+
+
+def test_journaled_last_seen_addresses_are_probed_first(monkeypatch) -> None:
+    monkeypatch.setenv("MAGEWELL_USERNAME", "Admin")
+    monkeypatch.setenv("MAGEWELL_PASSWORD", "password")
+    monkeypatch.setattr(app.state, "inventory_scan", None, raising=False)
+    monkeypatch.setattr(
+        app.state,
+        "fleet_last_seen",
+        {"AIO-01": "192.0.2.40", "AIO-02": "192.0.2.30", "AIO-03": "198.51.100.9"},
+        raising=False,
+    )
+    monkeypatch.setattr(
+        app_module,
+        "load_fleet_journal",
+        lambda: {("SERIAL-01", "mac-01"): "AIO-01", ("SERIAL-02", "mac-02"): "AIO-02"},
+    )
+    pinged = []
+    accounted_during_sweep = []
+
+    async def ping(_session, ip, _timeout):
+        pinged.append(ip)
+        if ip in {"192.0.2.30", "192.0.2.40"}:
+            return True
+        await asyncio.sleep(0.002)
+        accounted_during_sweep.append(
+            app.state.scan_job["journal_accounted_after_seconds"] is not None
+        )
+        return False
+
+    async def report(_session, ip, *_args, **_kwargs):
+        return {"name": f"DEVICE-{ip[-2:]}"}
+
+    async def identity(_session, ip, *_args, **_kwargs):
+        fleet_id = "AIO-01" if ip.endswith(".40") else "AIO-02"
+        return {"serial": f"SERIAL-{fleet_id[-2:]}", "eth_mac": "mac", "fleet_id": fleet_id}
+
+    monkeypatch.setattr(app_module, "ping_magewell", ping)
+    monkeypatch.setattr(app_module, "get_device_report_with_login", report)
+    monkeypatch.setattr(app_module, "get_device_identity_with_login", identity)
+
+    devices = asyncio.run(
+        app_module.discover_devices_from_ips(
+            [f"192.0.2.{index}" for index in range(1, 51)], "Admin", "password", 1.0, 4, 1.0
+        )
+    )
+
+    assert pinged[:2] == ["192.0.2.30", "192.0.2.40"]
+    assert [device.ip for device in devices] == ["192.0.2.30", "192.0.2.40"]
+    # Both units are reported found while the remaining sweep is still running.
+    assert accounted_during_sweep.count(False) <= 4 and accounted_during_sweep[-1] is True
+    scan = app.state.inventory_scan
+    assert (scan["priority_host_count"], scan["journaled_count"]) == (2, 2)
+    assert scan["journaled_found_count"] == 2
+    assert scan["journal_accounted_after_seconds"] is not None
+    assert app.state.fleet_last_seen["AIO-03"] == "198.51.100.9"
+
+
+def test_journaled_priority_probes_stay_within_global_and_site_limits(monkeypatch) -> None:
+    monkeypatch.setattr(app.state, "inventory_scan", None, raising=False)
+    ips = [f"192.0.2.{index}" for index in range(1, 17)]
+    monkeypatch.setattr(
+        app.state,
+        "fleet_last_seen",
+        {f"AIO-{index:02d}": ip for index, ip in enumerate(ips[:12], start=1)},
+        raising=False,
+    )
+    pinged = []
+    in_flight = peak = 0
+
+    async def ping(_session, ip, _timeout):
+        nonlocal in_flight, peak
+        pinged.append(ip)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.002)
+        in_flight -= 1
+        return False
+
+    monkeypatch.setattr(app_module, "ping_magewell", ping)
+
+    asyncio.run(
+        app_module.discover_devices_from_ips(
+            ips,
+            "Admin",
+            "password",
+            1.0,
+            4,
+            1.0,
+            sites=[ipaddress.IPv4Network("192.0.2.0/24")],
+            per_site_concurrent=3,
+        )
+    )
+
+    assert peak == 3
+    assert set(pinged[:12]) == set(ips[:12])
+
+
+def test_rescans_skip_dead_hosts_and_pause_failing_reads_until_full_sweep(monkeypatch) -> None:
+    monkeypatch.setenv("MAGEWELL_USERNAME", "Admin")
+    monkeypatch.setenv("MAGEWELL_PASSWORD", "password")
+    monkeypatch.setattr(app.state, "inventory_scan", None, raising=False)
+    monkeypatch.setattr(app.state, "fleet_last_seen", {}, raising=False)
+    pinged = []
+    report_reads = []
+
+    async def ping(_session, ip, _timeout):
+        pinged.append(ip)
+        return ip != "192.0.2.12"
+
+    async def failing_report(_session, ip, *_args, **_kwargs):
+        report_reads.append(ip)
+        raise aiohttp.ClientError("login refused")
+
+    monkeypatch.setattr(app_module, "ping_magewell", ping)
+    monkeypatch.setattr(app_module, "get_device_report_with_login", failing_report)
+
+    def scan(full_sweep: bool = False) -> dict:
+        response = client.post(
+            "/discover-known-ips",
+            params={"full_sweep": str(full_sweep).lower()},
+            json={"ips": ["192.0.2.11", "192.0.2.12"]},
+            headers=OPERATOR_HEADERS,
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    for _ in range(3):
+        scan()
+    assert pinged == ["192.0.2.11", "192.0.2.12", "192.0.2.11", "192.0.2.11"]
+    assert report_reads == ["192.0.2.11"] * 3
+
+    paused = scan()
+    assert paused["scan"]["skipped_count"] == paused["scan"]["circuit_open_count"] == 1
+    assert "Reads are paused" in paused["devices"][0]["read_error"]
+    assert (len(pinged), len(report_reads)) == (4, 3)
+
+    forced = scan(full_sweep=True)
+    assert forced["scan"]["skipped_count"] == forced["scan"]["circuit_open_count"] == 0
+    assert pinged[4:] == ["192.0.2.11", "192.0.2.12"]
+    assert report_reads == ["192.0.2.11"] * 4
+
+
+def test_host_health_entries_decay_and_stay_bounded(monkeypatch) -> None:
+    now = [0.0]
+    health = host_health.HostHealth(clock=lambda: now[0])
+    health.record_miss("192.0.2.10")
+    now[0] = host_health.NEGATIVE_CACHE_BASE_TTL_SECONDS + 1
+    assert not health.is_known_dead("192.0.2.10")
+    health.record_miss("192.0.2.10")
+    now[0] += host_health.NEGATIVE_CACHE_BASE_TTL_SECONDS + 1
+    assert health.is_known_dead("192.0.2.10")
+    health.record_responder("192.0.2.10")
+    assert not health.is_known_dead("192.0.2.10")
+
+    for _ in range(host_health.CIRCUIT_FAILURE_THRESHOLD):
+        health.record_read_failure("192.0.2.11")
+    assert health.circuit_open("192.0.2.11")
+    now[0] += host_health.CIRCUIT_OPEN_SECONDS + 1
+    assert not health.circuit_open("192.0.2.11")
+    health.record_read_failure("192.0.2.11")
+    assert health.circuit_open("192.0.2.11")
+
+    monkeypatch.setattr(host_health, "NEGATIVE_CACHE_MAX_ENTRIES", 2)
+    for index in range(3):
+        health.record_miss(f"198.51.100.{index}")
+    assert not health.is_known_dead("198.51.100.0")
+    assert health.is_known_dead("198.51.100.2")
+
+
+def test_login_retries_only_transient_failures_with_jittered_backoff(monkeypatch) -> None:
+    backoff_delay = retry_budget.backoff_delay
+    monkeypatch.setattr(retry_budget, "backoff_delay", lambda _attempt: 0)
+    failures: list[Exception] = []
+    attempts = []
+
+    class FakeSession:
+        def get(self, url: str):
+            attempts.append(url)
+            raise failures.pop(0)
+
+    def login() -> None:
+        asyncio.run(app_module.login_device(FakeSession(), "192.0.2.10", "Admin", "hash", "AIO-01"))
+
+    failures[:] = [aiohttp.ConnectionTimeoutError(), *[aiohttp.ServerDisconnectedError()] * 3]
+    with pytest.raises(aiohttp.ServerDisconnectedError):
+        login()
+    assert len(attempts) == retry_budget.RETRY_ATTEMPTS
+
+    for refused in (
+        aiohttp.ClientResponseError(None, (), status=401),
+        aiohttp.SocketTimeoutError(),
+    ):
+        attempts.clear()
+        failures[:] = [refused]
+        with pytest.raises(type(refused)):
+            login()
+        assert len(attempts) == 1
+
+    delays = [backoff_delay(n, lambda: 1.0) for n in range(6)]
+    assert delays == [0.25, 0.5, 1.0, 2.0, 2.0, 2.0]
+    assert backoff_delay(1, lambda: 0.5) == 0.25
+
+
+def test_scan_retries_draw_on_one_shared_budget(monkeypatch) -> None:
+    monkeypatch.setenv("MAGEWELL_USERNAME", "Admin")
+    monkeypatch.setenv("MAGEWELL_PASSWORD", "password")
+    monkeypatch.setattr(app.state, "inventory_scan", None, raising=False)
+    monkeypatch.setattr(app.state, "fleet_last_seen", {}, raising=False)
+    monkeypatch.setattr(retry_budget, "backoff_delay", lambda _attempt: 0)
+    report_reads = []
+
+    async def ping(*_args):
+        return True
+
+    @retry_budget.retry_read
+    async def flaky_report(_session, ip, *_args):
+        report_reads.append(ip)
+        raise aiohttp.ServerDisconnectedError()
+
+    monkeypatch.setattr(app_module, "ping_magewell", ping)
+    monkeypatch.setattr(app_module, "get_device_report_with_login", flaky_report)
+    ips = [f"192.0.2.{host}" for host in range(10, 30)]
+
+    response = client.post("/discover-known-ips", json={"ips": ips}, headers=OPERATOR_HEADERS)
+
+    assert response.status_code == 200
+    scan = response.json()["scan"]
+    assert scan["retry_budget"] == scan["retries_used"] == retry_budget.SCAN_RETRY_BUDGET_MIN
+    assert len(report_reads) == len(ips) + retry_budget.SCAN_RETRY_BUDGET_MIN
+
+
+def test_device_rate_limiter_paces_each_device_and_call_class(monkeypatch) -> None:
+    monkeypatch.setattr(device_rate_limit, "DEVICE_LIMIT", (4.0, 3))
+    monkeypatch.setattr(
+        device_rate_limit, "CALL_CLASS_LIMITS", {"read": (1.0, 2), "probe": (10.0, 10)}
+    )
+    now = [0.0]
+    slept = []
+
+    async def sleep(delay: float) -> None:
+        slept.append(delay)
+
+    limiter = device_rate_limit.DeviceRateLimiter(clock=lambda: now[0], sleep=sleep)
+
+    async def burst() -> list[float]:
+        return [
+            await limiter.acquire("192.0.2.10", "read"),
+            await limiter.acquire("192.0.2.10", "read"),
+            # The read class is empty; queued callers wait one refill interval each.
+            await limiter.acquire("192.0.2.10", "read"),
+            await limiter.acquire("192.0.2.10", "read"),
+            # Probes have their own class budget but share the device budget.
+            await limiter.acquire("192.0.2.10", "probe"),
+            await limiter.acquire("192.0.2.10", "probe"),
+            # Another encoder is never held back by this one.
+            await limiter.acquire("192.0.2.11", "read"),
+        ]
+
+    assert asyncio.run(burst()) == [0.0, 0.0, 1.0, 2.0, 0.5, 0.75, 0.0]
+    assert slept == [1.0, 2.0, 0.5, 0.75]
+    metrics = limiter.snapshot()
+    assert metrics["tracked_devices"] == 2
+    assert metrics["classes"]["read"] == {
+        "requests": 5,
+        "delayed": 2,
+        "waiting": 0,
+        "max_waiting": 1,
+        "total_wait_seconds": 3.0,
+        "max_wait_seconds": 2.0,
+    }
+    now[0] = 10.0
+    assert asyncio.run(limiter.acquire("192.0.2.10", "read")) == 0.0
+
+
+def test_device_rate_limiter_refunds_tokens_of_cancelled_waiter(monkeypatch) -> None:
+    monkeypatch.setattr(device_rate_limit, "DEVICE_LIMIT", (1.0, 1))
+    monkeypatch.setattr(device_rate_limit, "CALL_CLASS_LIMITS", {"read": (1.0, 1)})
+    now = [0.0]
+    slept = []
+
+    async def sleep(delay: float) -> None:
+        slept.append(delay)
+        if len(slept) == 1:
+            await asyncio.Event().wait()
+
+    limiter = device_rate_limit.DeviceRateLimiter(clock=lambda: now[0], sleep=sleep)
+
+    async def cancel_queued_read() -> None:
+        assert await limiter.acquire("192.0.2.10", "read") == 0.0
+        waiter = asyncio.create_task(limiter.acquire("192.0.2.10", "read"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(cancel_queued_read())
+    assert limiter.snapshot()["classes"]["read"]["waiting"] == 0
+    # Once the first token refills, the next read is not charged for the cancelled one.
+    now[0] = 1.0
+    assert asyncio.run(limiter.acquire("192.0.2.10", "read")) == 0.0
+    assert slept == [1.0]
+
+
+def test_device_calls_from_every_path_share_one_rate_limiter() -> None:
+    class FakeResponse:
+        status = 200
+
+        def raise_for_status(self) -> None:
+            return None
+
+        async def json(self) -> dict[str, object]:
+            return {"result": 0, "users": []}
+
+    class FakeRequest:
+        async def __aenter__(self) -> FakeResponse:
+            return FakeResponse()
+
+        async def __aexit__(self, *_args: object) -> None:
+            return None
+
+    class FakeSession:
+        def get(self, *_args, **_kwargs) -> FakeRequest:
+            return FakeRequest()
+
+    async def calls() -> None:
+        session = FakeSession()
+        await app_module.set_name_call(session, "192.0.2.10", "STAGE-01", "cookie", "OLD")
+        await app_module.get_users_call(session, "192.0.2.10", "cookie")
+        await app_module.ping_magewell(session, "192.0.2.10")
+
+    asyncio.run(calls())
+
+    metrics = client.get("/device-rate-limits").json()
+    assert metrics["tracked_devices"] == 1
+    assert [metrics["classes"][name]["requests"] for name in ("mutation", "read", "probe")] == [
+        1,
+        1,
+        1,
+    ]
+
+
+REPORT_PAGE = (
+    b'<div class="report-content"><div class="content-level1"><h2>Settings</h2>'
+    b'<pre class="json">{"name": "ENCODER-01", "audio": {"gain": 3}}</pre></div></div>'
+)
+
+
+class ReportPageResponse:
+    def raise_for_status(self) -> None:
+        return None
+
+    async def read(self) -> bytes:
+        return REPORT_PAGE
+
+    def get_encoding(self) -> str:
+        return "utf-8"
+
+
+class ReportPageRequest:
+    async def __aenter__(self) -> ReportPageResponse:
+        return ReportPageResponse()
+
+    async def __aexit__(self, *_args: object) -> None:
+        return None
+
+
+class ReportPageSession:
+    def get(self, *_args, **_kwargs) -> ReportPageRequest:
+        return ReportPageRequest()
+
+
+@pytest.mark.parametrize("workers", ["0", "2"])
+def test_report_parsing_runs_inline_or_in_worker_pool_with_one_fingerprint(
+    monkeypatch, workers
+) -> None:
+    monkeypatch.setenv("REPORT_PARSE_WORKERS", workers)
+    monkeypatch.setattr(app.state, "report_parser_pool", None, raising=False)
+
+    try:
+        report = asyncio.run(
+            app_module.get_device_report(ReportPageSession(), "192.0.2.10", "cookie")
+        )
+        assert (app.state.report_parser_pool is None) == (workers == "0")
+    finally:
+        if app.state.report_parser_pool is not None:
+            app.state.report_parser_pool.shutdown()
+
+    settings = {"name": "ENCODER-01", "audio": {"gain": 3}}
+    assert report == settings
+    assert device_inventory.report_fingerprint(report) == settings_fingerprint(settings)
+    assert report.settings_tree == build_settings_tree(settings)
+
+    def no_rehash(_value):
+        raise AssertionError("a parsed report was hashed again")
+
+    monkeypatch.setattr(device_inventory, "build_settings_tree", no_rehash)
+    monkeypatch.setattr(device_inventory, "settings_fingerprint", no_rehash)
+    record = DeviceRecord(ip="192.0.2.10", settings=report)
+    assert record.settings_sha256 == settings_fingerprint(settings)
+    assert record.settings_tree == report.settings_tree
+    with pytest.raises(TypeError, match="read-only"):
+        report["audio"]["gain"] = 4
+    assert type(copy.deepcopy(report)) is dict
+
+
+def test_broken_report_parser_pool_is_replaced_and_report_parsed_inline(monkeypatch) -> None:
+    monkeypatch.setenv("REPORT_PARSE_WORKERS", "1")
+    broken = ProcessPoolExecutor(max_workers=1)
+    # A worker that dies abruptly breaks the pool for every later submission.
+    with pytest.raises(BrokenProcessPool):
+        broken.submit(os._exit, 1).result()
+    monkeypatch.setattr(app.state, "report_parser_pool", broken, raising=False)
+
+    try:
+        report = asyncio.run(
+            app_module.get_device_report(ReportPageSession(), "192.0.2.10", "cookie")
+        )
+        assert app.state.report_parser_pool is None
+        replacement = app_module.get_report_parser_pool()
+        assert replacement is not None and replacement is not broken
+    finally:
+        if app.state.report_parser_pool is not None:
+            app.state.report_parser_pool.shutdown()
+            app.state.report_parser_pool = None
+
+    assert report == {"name": "ENCODER-01", "audio": {"gain": 3}}
+
+
+def test_report_parse_worker_count_is_validated(monkeypatch) -> None:
+    monkeypatch.setenv("REPORT_PARSE_WORKERS", "33")
+    with pytest.raises(RuntimeError, match="between 0 and 32"):
+        app_module.get_report_parse_workers()
+    monkeypatch.setenv("REPORT_PARSE_WORKERS", "many")
+    with pytest.raises(RuntimeError, match="integer"):
+        app_module.get_report_parse_workers()
+
+
 def test_cross_origin_baseline_request_is_rejected_before_route_logic(monkeypatch) -> None:
     monkeypatch.setenv("ENABLE_DEVICE_WRITES", "true")
     response = client.post(
@@ -1282,6 +2265,58 @@ def test_credential_rotation_is_single_device_and_verified(monkeypatch) -> None:
     assert app.state.rotation_devices[0]["credential_state"] == "new"
 
 
+def test_rotation_inventory_probes_last_known_credential_first(monkeypatch) -> None:
+    probes: list[tuple[str, str]] = []
+    passwords = {"192.0.2.10": "old-password", "192.0.2.11": "new-password"}
+
+    async def probe(_session, ip, _username, password, _timeout):
+        probes.append((ip, password))
+        return "session-cookie" if passwords[ip] == password else None
+
+    async def name(_session, ip, cookie_header, _timeout):
+        assert cookie_header == "session-cookie"
+        return "AIO-01" if ip.endswith("10") else "AIO-02"
+
+    monkeypatch.setattr(app_module, "probe_login", probe)
+    monkeypatch.setattr(app_module, "get_device_name", name)
+
+    async def classify() -> list[dict[str, str]]:
+        return [
+            await app_module.identify_rotation_device(
+                None, ip, "admin", "old-password", "new-password", 2.0, last_state
+            )
+            for ip, last_state in (("192.0.2.10", "old"), ("192.0.2.11", None))
+        ]
+
+    devices = asyncio.run(classify())
+
+    assert [device["credential_state"] for device in devices] == ["old", "new"]
+    assert probes == [("192.0.2.10", "old-password"), ("192.0.2.11", "new-password")]
+
+
+def test_rotation_name_read_prefers_get_info_over_report(monkeypatch) -> None:
+    report_reads: list[str] = []
+
+    async def info(_session, ip, *_args):
+        return {"result": 0, "name": "AIO-01"} if ip.endswith("10") else {"result": 0}
+
+    async def report(_session, ip, *_args):
+        report_reads.append(ip)
+        return {"name": "AIO-02"}
+
+    monkeypatch.setattr(app_module, "get_info_call", info)
+    monkeypatch.setattr(app_module, "get_device_report", report)
+
+    async def names() -> list[str]:
+        return [
+            await app_module.get_device_name(None, ip, "session-cookie", 2.0)
+            for ip in ("192.0.2.10", "192.0.2.11")
+        ]
+
+    assert asyncio.run(names()) == ["AIO-01", "AIO-02"]
+    assert report_reads == ["192.0.2.11"]
+
+
 def test_ambiguous_credential_rotation_requires_fresh_inventory(monkeypatch) -> None:
     mutation_calls = 0
 
@@ -1379,11 +2414,9 @@ def test_concurrent_write_batch_is_rejected_before_second_mutation(monkeypatch)
     monkeypatch.setenv("MAGEWELL_PASSWORD", "test-password")
     monkeypatch.setattr(app_module, "push_update_for_device", slow_update)
     app.state.devices = [
-        {
-            "ip": "192.0.2.10",
-            "name": "ENCODER-01",
-            "settings": {"name": "ENCODER-01", "profile": "old"},
-        }
+        DeviceRecord(
+            ip="192.0.2.10", name="ENCODER-01", settings={"name": "ENCODER-01", "profile": "old"}
+        )
     ]
     app.state.control_settings = {"name": "SOURCE-01", "profile": "camera"}
     app.state.control_device_ip = "192.0.2.20"
@@ -1415,7 +2448,7 @@ def test_control_source_cannot_be_a_write_target(monkeypatch) -> None:
     monkeypatch.setenv("MAGEWELL_USERNAME", "test-user")
     monkeypatch.setenv("MAGEWELL_PASSWORD", "test-password")
     app.state.devices = [
-        {"ip": "192.0.2.10", "name": "SOURCE-01", "settings": {"profile": "camera"}}
+        DeviceRecord(ip="192.0.2.10", name="SOURCE-01", settings={"profile": "camera"})
     ]
     app.state.control_settings = {"profile": "camera"}
     app.state.control_device_ip = "192.0.2.10"
@@ -1447,26 +2480,26 @@ def _configure_profile_write_receipt_state(monkeypatch) -> None:
         "wifi": [{"passwd": "target-secret"}],
     }
     app.state.devices = [
-        {
-            "ip": "192.0.2.10",
-            "name": "SOURCE-01",
-            "settings": source,
-            "identity": {
+        DeviceRecord(
+            ip="192.0.2.10",
+            name="SOURCE-01",
+            settings=source,
+            identity={
                 "serial": "SOURCE-SERIAL",
                 "eth_mac": "00:11:22:33:44:55",
                 "fleet_id": "AIO-01",
             },
-        },
-        {
-            "ip": "192.0.2.11",
-            "name": "TARGET-01",
-            "settings": target,
-            "identity": {
+        ),
+        DeviceRecord(
+            ip="192.0.2.11",
+            name="TARGET-01",
+            settings=target,
+            identity={
                 "serial": "TARGET-SERIAL",
                 "eth_mac": "00:11:22:33:44:66",
                 "fleet_id": "AIO-02",
             },
-        },
+        ),
     ]
     app.state.control_settings = copy.deepcopy(source)
     app.state.control_device_ip = "192.0.2.10"
@@ -1543,6 +2576,262 @@ def test_equivalent_profile_writes_keep_distinct_durable_receipts(monkeypatch) -
     assert client.get("/profile-run-receipts/export-manifest").json()["receipt_record_count"] == 4
 
 
+def test_streamed_push_bounds_concurrency_and_finalizes_the_receipt(monkeypatch) -> None:
+    monkeypatch.setenv("ENABLE_DEVICE_WRITES", "true")
+    monkeypatch.setenv("MAGEWELL_USERNAME", "test-user")
+    monkeypatch.setenv("MAGEWELL_PASSWORD", "test-password")
+    monkeypatch.setenv("PUSH_CONCURRENCY", "2")
+    targets = [(f"192.0.2.{host}", f"TARGET-{host}") for host in range(11, 16)]
+    app.state.devices = [
+        DeviceRecord(ip=ip, name=name, settings={"name": name, "profile": "old"})
+        for ip, name in targets
+    ]
+    app.state.control_settings = {"name": "SOURCE-01", "profile": "camera"}
+    app.state.control_device_ip = "192.0.2.20"
+    app.state.control_settings_sha256 = settings_fingerprint(app.state.control_settings)
+    pushed = []
+    in_flight = peak = 0
+
+    async def update(_session, ip, magewell_id, *_args):
+        nonlocal in_flight, peak
+        pushed.append(ip)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later targets finish first, so streamed order differs from target order.
+        await asyncio.sleep(0.02 * (20 - int(ip.rsplit(".", 1)[1])))
+        in_flight -= 1
+        if ip == "192.0.2.13":
+            return {"ip": ip, "magewell_id": magewell_id, "status": "failed", "error": "x"}
+        return {"ip": ip, "magewell_id": magewell_id, "status": "updated"}
+
+    monkeypatch.setattr(app_module, "push_update_for_device", update)
+    response = client.post(
+        "/push-updates",
+        params={"stream": "true"},
+        json={"confirm": True, "devices": [{"ip": ip, "magewell_id": n} for ip, n in targets]},
+        headers=OPERATOR_HEADERS,
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["event"] for event in events] == ["started", *["result"] * 5, "finished"]
+    assert events[0]["target_count"] == 5 and events[0]["concurrency"] == 2
+    assert sorted(pushed) == [ip for ip, _ in targets]
+    assert peak == 2
+    streamed = [event["index"] for event in events[1:-1]]
+    assert sorted(streamed) == list(range(5)) and streamed != list(range(5))
+    finished = events[-1]
+    assert finished["receipt_id"] == events[0]["receipt_id"]
+    assert [result["ip"] for result in finished["results"]] == [ip for ip, _ in targets]
+    assert not app_module.get_mutation_lock().locked()
+    receipt = client.get(f"/profile-run-receipts/{finished['receipt_id']}").json()
+    assert [target["mutation"]["status"] for target in receipt["targets"]] == [
+        "updated",
+        "updated",
+        "failed",
+        "updated",
+        "updated",
+    ]
+
+
+def test_streamed_push_reports_unexpected_errors_and_still_finalizes_the_receipt(
+    monkeypatch,
+) -> None:
+    monkeypatch.setenv("ENABLE_DEVICE_WRITES", "true")
+    monkeypatch.setenv("MAGEWELL_USERNAME", "test-user")
+    monkeypatch.setenv("MAGEWELL_PASSWORD", "test-password")
+    monkeypatch.setenv("PUSH_CONCURRENCY", "2")
+    targets = [(f"192.0.2.{host}", f"TARGET-{host}") for host in range(11, 16)]
+    app.state.devices = [
+        DeviceRecord(ip=ip, name=name, settings={"name": name, "profile": "old"})
+        for ip, name in targets
+    ]
+    app.state.control_settings = {"name": "SOURCE-01", "profile": "camera"}
+    app.state.control_device_ip = "192.0.2.20"
+    app.state.control_settings_sha256 = settings_fingerprint(app.state.control_settings)
+    abandoned = []
+
+    async def update(_session, ip, magewell_id, *_args):
+        if ip == "192.0.2.12":
+            await asyncio.sleep(0.01)
+            raise RuntimeError("payload encoder crashed")
+        if ip != "192.0.2.11":
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                abandoned.append(ip)
+                raise
+        return {"ip": ip, "magewell_id": magewell_id, "status": "updated"}
+
+    monkeypatch.setattr(app_module, "push_update_for_device", update)
+    response = client.post(
+        "/push-updates",
+        params={"stream": "true"},
+        json={"confirm": True, "devices": [{"ip": ip, "magewell_id": n} for ip, n in targets]},
+        headers=OPERATOR_HEADERS,
+    )
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["event"] for event in events] == ["started", "result", "failed"]
+    assert events[-1]["detail"] == "payload encoder crashed"
+    # 192.0.2.14 took the slot the crash freed; 192.0.2.15 was still queued.
+    assert abandoned == ["192.0.2.13", "192.0.2.14"]
+    assert not app_module.get_mutation_lock().locked()
+    receipt = client.get(f"/profile-run-receipts/{events[0]['receipt_id']}").json()
+    assert receipt["run_state"] == "mutation-finished"
+    assert [target["mutation"]["reason_code"] for target in receipt["targets"]] == [
+        "import-accepted",
+        "mutation-response-unknown",
+        "mutation-response-unknown",
+        "mutation-response-unknown",
+        "device-request-failed",
+    ]
+    assert [target["risk_state"] for target in receipt["targets"]] == [
+        "verification-pending",
+        "uncertain-high-risk",
+        "uncertain-high-risk",
+        "uncertain-high-risk",
+        "no-device-effect-confirmed",
+    ]
+
+
+def test_push_verify_job_verifies_each_target_as_soon_as_its_import_lands(monkeypatch) -> None:
+    monkeypatch.setenv("ENABLE_DEVICE_WRITES", "true")
+    monkeypatch.setenv("MAGEWELL_USERNAME", "test-user")
+    monkeypatch.setenv("MAGEWELL_PASSWORD", "test-password")
+    targets = [(f"192.0.2.{host}", f"TARGET-{host}") for host in (11, 12, 13)]
+    source = {"name": "SOURCE-01", "profile": "camera"}
+    before = {ip: {"name": name, "profile": "old"} for ip, name in targets}
+    app.state.devices = [
+        DeviceRecord(ip=ip, name=name, settings=before[ip]) for ip, name in targets
+    ]
+    app.state.control_settings = source
+    app.state.control_device_ip = "192.0.2.20"
+    app.state.control_settings_sha256 = settings_fingerprint(source)
+    timeline = []
+
+    async def update(_session, ip, magewell_id, *_args):
+        await asyncio.sleep({"192.0.2.11": 0.01, "192.0.2.12": 0.3}.get(ip, 0))
+        timeline.append(f"pushed {ip}")
+        status = "failed" if ip == "192.0.2.13" else "updated"
+        return {"ip": ip, "magewell_id": magewell_id, "status": status}
+
+    async def report(_session, ip, *_args, **_kwargs):
+        timeline.append(f"read {ip}")
+        return get_bulk_update_settings(before[ip]["name"], source, before[ip])
+
+    monkeypatch.setattr(app_module, "push_update_for_device", update)
+    monkeypatch.setattr(app_module, "get_device_report_with_login", report)
+
+    with TestClient(app) as jobs_client:
+        started = jobs_client.post(
+            "/push-verify-jobs",
+            json={"confirm": True, "devices": [{"ip": ip, "magewell_id": n} for ip, n in targets]},
+            headers=OPERATOR_HEADERS,
+        )
+        assert started.status_code == 200
+        job_id = started.json()["job_id"]
+        for _ in range(200):
+            job = jobs_client.get(f"/push-verify-jobs/{job_id}").json()
+            if job["status"] != "running":
+                break
+            time.sleep(0.01)
+        receipt = jobs_client.get(f"/profile-run-receipts/{job['receipt_id']}").json()
+
+    assert job["status"] == "finished"
+    assert timeline.index("read 192.0.2.11") < timeline.index("pushed 192.0.2.12")
+    assert "read 192.0.2.13" not in timeline
+    assert [event["event"] for event in job["events"]].count("verified") == 2
+    assert job["events"][-1] == {"event": "finished"}
+    results = job["summary"]["results"]
+    assert [result["status"] for result in results] == ["updated", "updated", "failed"]
+    assert results[0]["verification"]["matches_expected_profile"] is True
+    assert "verification" not in results[2]
+    assert [target["verification"]["status"] for target in receipt["targets"]] == [
+        "verified",
+        "verified",
+        "not-requested",
+    ]
+    assert not app_module.get_mutation_lock().locked()
+    assert client.get("/push-verify-jobs/" + "0" * 32).status_code == 404
+
+
+def test_push_verify_job_bounds_imports_and_settle_reads_together_and_records_on_arrival(
+    monkeypatch,
+) -> None:
+    monkeypatch.setenv("ENABLE_DEVICE_WRITES", "true")
+    monkeypatch.setenv("MAGEWELL_USERNAME", "test-user")
+    monkeypatch.setenv("MAGEWELL_PASSWORD", "test-password")
+    monkeypatch.setenv("PUSH_CONCURRENCY", "2")
+    targets = [(f"192.0.2.{host}", f"TARGET-{host}") for host in range(11, 16)]
+    source = {"name": "SOURCE-01", "profile": "camera"}
+    before = {ip: {"name": name, "profile": "old"} for ip, name in targets}
+    app.state.devices = [
+        DeviceRecord(ip=ip, name=name, settings=before[ip]) for ip, name in targets
+    ]
+    app.state.control_settings = source
+    app.state.control_device_ip = "192.0.2.20"
+    app.state.control_settings_sha256 = settings_fingerprint(source)
+    sessions = set()
+    in_flight = peak = 0
+    recorded_before_last_read = []
+
+    async def update(_session, ip, magewell_id, *_args):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"ip": ip, "magewell_id": magewell_id, "status": "updated"}
+
+    async def report(session, ip, *_args, **_kwargs):
+        nonlocal in_flight, peak
+        sessions.add(id(session))
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        if ip == "192.0.2.15":
+            receipt_id = list(app_module.get_push_verify_jobs().values())[-1]["receipt_id"]
+            for _ in range(100):
+                receipt = app_module.get_profile_run_receipt_store().get_receipt(receipt_id)
+                recorded = [
+                    target["ip"]
+                    for target in receipt["targets"]
+                    if target["verification"]["status"] == "verified"
+                ]
+                if len(recorded) == 4:
+                    break
+                await asyncio.sleep(0.01)
+            recorded_before_last_read.extend(recorded)
+        in_flight -= 1
+        return get_bulk_update_settings(before[ip]["name"], source, before[ip])
+
+    monkeypatch.setattr(app_module, "push_update_for_device", update)
+    monkeypatch.setattr(app_module, "get_device_report_with_login", report)
+
+    with TestClient(app) as jobs_client:
+        started = jobs_client.post(
+            "/push-verify-jobs",
+            json={"confirm": True, "devices": [{"ip": ip, "magewell_id": n} for ip, n in targets]},
+            headers=OPERATOR_HEADERS,
+        )
+        job_id = started.json()["job_id"]
+        for _ in range(300):
+            job = jobs_client.get(f"/push-verify-jobs/{job_id}").json()
+            if job["status"] != "running":
+                break
+            time.sleep(0.01)
+
+    assert job["status"] == "finished"
+    assert peak == 2
+    assert len(sessions) == 1
+    assert sorted(recorded_before_last_read) == [ip for ip, _ in targets[:4]]
+    assert all(
+        result["verification"]["matches_expected_profile"] for result in job["summary"]["results"]
+    )
+
+
 def test_receipt_reservation_failure_blocks_every_device_mutation(monkeypatch) -> None:
     _configure_profile_write_receipt_state(monkeypatch)
     mutation_calls = 0
@@ -1619,6 +2908,202 @@ def test_receipt_terminal_capacity_is_persisted_before_any_device_effect(
     assert not store._reservation_path(receipt_id).exists()
 
 
+def test_receipt_rebuild_repairs_current_summaries_from_verified_journal(tmp_path) -> None:
+    store = run_receipts.ProfileRunReceiptStore(tmp_path / "receipt-store")
+    first = {"receipt_id": "a" * 32, "source": {"settings_sha256": "b" * 64}, "targets": []}
+    second = {**first, "receipt_id": "c" * 32}
+    store.reserve_and_record_intent(first)
+    store.record_mutation_outcomes(first, [])
+    store.reserve_and_record_intent(second)
+    expected_first = store.get_receipt(first["receipt_id"])
+    store._summary_path(first["receipt_id"]).write_text("{not json", encoding="utf-8")
+    store._summary_path(second["receipt_id"]).unlink()
+
+    report = store.rebuild_current()
+
+    assert report["checkpoint_used"] is False
+    assert report["events_replayed"] == 3
+    assert report["receipt_count"] == 2
+    assert sorted(report["divergences"], key=lambda item: item["receipt_id"]) == [
+        {"receipt_id": "a" * 32, "reason_code": "summary-unreadable"},
+        {"receipt_id": "c" * 32, "reason_code": "summary-missing"},
+    ]
+    assert store.get_receipt(first["receipt_id"]) == expected_first
+    assert store.get_receipt(second["receipt_id"])["run_state"] == "intent-recorded"
+    assert len(store.list_receipts()) == 2
+
+    repeated = store.rebuild_current()
+    assert repeated["checkpoint_used"] is True
+    assert repeated["events_replayed"] == 0
+    assert repeated["divergences"] == []
+
+
+def test_receipt_rebuild_reports_tampered_events_and_discards_stale_checkpoint(
+    tmp_path,
+) -> None:
+    store = run_receipts.ProfileRunReceiptStore(tmp_path / "receipt-store")
+    receipt = {"receipt_id": "a" * 32, "source": {"settings_sha256": "b" * 64}, "targets": []}
+    store.reserve_and_record_intent(receipt)
+    store.record_mutation_outcomes(receipt, [])
+    store.rebuild_current()
+    segment = next(store.journal_dir.glob("receipts-*.jsonl"))
+    lines = segment.read_bytes().splitlines(keepends=True)
+    segment.write_bytes(lines[0] + lines[1].replace(b"mutation-finished", b"mutation-tampered"))
+
+    report = store.rebuild_current()
+
+    assert report["checkpoint_used"] is False
+    assert report["events_replayed"] == 2
+    assert {
+        "segment": segment.name,
+        "offset": len(lines[0]),
+        "reason_code": "journal-event-digest-mismatch",
+    } in report["divergences"]
+    assert {"receipt_id": "a" * 32, "reason_code": "summary-stale"} in report["divergences"]
+    # Only the last event that still proves its digest is trusted as current state.
+    assert store.get_receipt(receipt["receipt_id"])["run_state"] == "intent-recorded"
+
+
+def test_receipt_journal_checkpoints_periodically(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(run_receipts, "CHECKPOINT_INTERVAL_BYTES", 1)
+    store = run_receipts.ProfileRunReceiptStore(tmp_path / "receipt-store")
+    receipt = {"receipt_id": "a" * 32, "source": {"settings_sha256": "b" * 64}, "targets": []}
+    store.reserve_and_record_intent(receipt)
+    assert store.checkpoint_path.exists()
+    store.record_mutation_outcomes(receipt, [])
+
+    report = store.rebuild_current()
+
+    assert report["checkpoint_used"] is True
+    assert report["events_replayed"] == 0
+    assert report["divergences"] == []
+
+
+def test_receipt_checkpoint_survives_a_journal_tail_with_only_divergent_events(
+    tmp_path,
+) -> None:
+    store = run_receipts.ProfileRunReceiptStore(tmp_path / "receipt-store")
+    receipt = {"receipt_id": "a" * 32, "source": {"settings_sha256": "b" * 64}, "targets": []}
+    store.reserve_and_record_intent(receipt)
+    store.record_mutation_outcomes(receipt, [])
+    segment = next(store.journal_dir.glob("receipts-*.jsonl"))
+    tail = store.journal_dir / "receipts-2999-12.jsonl"
+    tail.write_bytes(
+        segment.read_bytes().splitlines(keepends=True)[-1].replace(b"mutation", b"tampered")
+    )
+
+    first = store.rebuild_current()
+    assert {
+        "segment": tail.name,
+        "offset": 0,
+        "reason_code": "journal-event-digest-mismatch",
+    } in first["divergences"]
+    assert tail.name not in json.loads(store.checkpoint_path.read_text())["segments"]
+
+    repeated = store.rebuild_current()
+    assert repeated["checkpoint_used"] is True
+    assert repeated["events_replayed"] == 1
+    assert store.get_receipt(receipt["receipt_id"])["run_state"] == "mutation-finished"
+
+
+def test_receipt_query_streams_ndjson_and_skips_segments_that_cannot_match(monkeypatch) -> None:
+    store = app_module.get_profile_run_receipt_store()
+
+    def receipt(receipt_id: str, serial: str) -> dict:
+        return {
+            "receipt_id": receipt_id,
+            "source": {"serial": "SOURCE-SERIAL", "settings_sha256": "b" * 64},
+            "targets": [{"ip": "192.0.2.11", "serial": serial, "eth_mac": "00:11:22:33:44:66"}],
+        }
+
+    monkeypatch.setattr(run_receipts, "_utc_month", lambda: "2026-01")
+    store.reserve_and_record_intent(receipt("a" * 32, "TARGET-JANUARY"))
+    monkeypatch.setattr(run_receipts, "_utc_month", lambda: "2026-04")
+    store.reserve_and_record_intent(receipt("c" * 32, "TARGET-APRIL"))
+    april = receipt("c" * 32, "TARGET-APRIL")
+    store.record_mutation_outcomes(april, april["targets"])
+    verified_lines = 0
+    original_verified_event = run_receipts.verified_event
+
+    def counting_verified_event(line):
+        nonlocal verified_lines
+        verified_lines += 1
+        return original_verified_event(line)
+
+    monkeypatch.setattr(run_receipts, "verified_event", counting_verified_event)
+    response = client.get("/profile-run-receipts/query", params={"serial": "TARGET-APRIL"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["event"] for event in events] == ["pre-effect-intent", "mutation-outcomes"]
+    assert {event["receipt_id"] for event in events} == {"c" * 32}
+    assert verified_lines == 2
+
+    by_mac = client.get(
+        "/profile-run-receipts/query",
+        params={"eth_mac": "00:11:22:33:44:66", "until": "2000-01-01T00:00:00Z"},
+    )
+    assert by_mac.status_code == 200
+    assert by_mac.text == ""
+    assert (
+        len(
+            client.get(
+                "/profile-run-receipts/query", params={"serial": "SOURCE-SERIAL"}
+            ).text.splitlines()
+        )
+        == 3
+    )
+    assert sorted(path.name for path in store.index_dir.glob("*.json")) == [
+        "receipts-2026-01.index.json",
+        "receipts-2026-04.index.json",
+    ]
+
+
+def test_receipt_query_orders_whole_second_timestamps_correctly(monkeypatch) -> None:
+    assert re.fullmatch(
+        r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z", run_receipts._utc_timestamp()
+    )
+    store = app_module.get_profile_run_receipt_store()
+    receipt = {"receipt_id": "a" * 32, "source": {"serial": "SOURCE-SERIAL"}, "targets": []}
+    # Journals written before fixed precision hold whole-second events as "...SSZ".
+    monkeypatch.setattr(run_receipts, "_utc_timestamp", lambda: "2026-04-01T12:00:00Z")
+    store.reserve_and_record_intent(receipt)
+
+    def query(**bounds: str) -> int:
+        response = client.get(
+            "/profile-run-receipts/query", params={"serial": "SOURCE-SERIAL", **bounds}
+        )
+        assert response.status_code == 200
+        return len(response.text.splitlines())
+
+    assert query(since="2026-04-01T12:00:00Z", until="2026-04-01T12:00:00.5Z") == 1
+    assert query(since="2026-04-01T12:00:00.000001Z") == 0
+    assert query(until="2026-04-01T11:59:59.999999Z") == 0
+
+
+def test_receipt_query_rejects_a_tampered_segment_before_streaming(monkeypatch) -> None:
+    store = app_module.get_profile_run_receipt_store()
+    receipt = {
+        "receipt_id": "a" * 32,
+        "source": {"serial": "SOURCE-SERIAL", "settings_sha256": "b" * 64},
+        "targets": [{"ip": "192.0.2.11", "serial": "TARGET-01", "eth_mac": "00:11:22:33:44:66"}],
+    }
+    store.reserve_and_record_intent(receipt)
+    store.record_mutation_outcomes(receipt, receipt["targets"])
+    segment = next(store.journal_dir.glob("receipts-*.jsonl"))
+    lines = segment.read_bytes().splitlines(keepends=True)
+    segment.write_bytes(lines[0] + lines[1].replace(b"mutation-outcomes", b"mutation-tampered"))
+
+    response = client.get("/profile-run-receipts/query", params={"serial": "TARGET-01"})
+
+    assert response.status_code == 503
+    assert (
+        f"{segment.name} failed verification at offset {len(lines[0])}"
+        in (response.json()["detail"])
+    )
+
+
 def test_profile_receipt_records_readback_without_exposing_settings(monkeypatch) -> None:
     _configure_profile_write_receipt_state(monkeypatch)
 
@@ -1712,7 +3197,7 @@ def test_verify_target_returns_only_fingerprints(monkeypatch) -> None:
     monkeypatch.setenv("MAGEWELL_USERNAME", "test-user")
     monkeypatch.setenv("MAGEWELL_PASSWORD", "test-password")
     monkeypatch.setattr(app_module, "get_device_report_with_login", matching_report)
-    app.state.devices = [{"ip": "192.0.2.10", "name": "TARGET-01", "settings": target_before}]
+    app.state.devices = [DeviceRecord(ip="192.0.2.10", name="TARGET-01", settings=target_before)]
     app.state.control_device_ip = "192.0.2.20"
     app.state.control_settings = source
     app.state.control_settings_sha256 = settings_fingerprint(source)
@@ -1732,6 +3217,177 @@ def test_verify_target_returns_only_fingerprints(monkeypatch) -> None:
     }
 
 
+def test_identical_concurrent_scans_share_one_sweep(monkeypatch) -> None:
+    monkeypatch.setenv("MAGEWELL_USERNAME", "test-user")
+    monkeypatch.setenv("MAGEWELL_PASSWORD", "test-password")
+    sweeps = []
+
+    async def slow_sweep(ips, *args, **kwargs):
+        sweeps.append(ips)
+        await asyncio.sleep(0.01)
+        return [DeviceRecord(ip=ip, name=f"AIO-{ip[-2:]}") for ip in ips]
+
+    monkeypatch.setattr(app_module, "discover_devices_from_ips", slow_sweep)
+
+    def scan(ips: list[str], settings_timeout: float = 2.0):
+        return app_module.discover_known_ips(
+            app_module.KnownIpDiscoveryRequest(ips=ips),
+            full_sweep=False,
+            per_ip_timeout=1.0,
+            max_concurrent=50,
+            settings_timeout=settings_timeout,
+            deadline_seconds=None,
+            x_magewell_operator_intent=OPERATOR_INTENT_VALUE,
+            origin=None,
+        )
+
+    async def run_scans() -> list:
+        return await asyncio.gather(
+            scan(["192.0.2.10", "192.0.2.11"]),
+            scan(["192.0.2.11", "192.0.2.10"]),
+            scan(["192.0.2.10", "192.0.2.11"], settings_timeout=5.0),
+            return_exceptions=True,
+        )
+
+    first, attached, different = asyncio.run(run_scans())
+
+    assert sweeps == [["192.0.2.10", "192.0.2.11"]]
+    assert attached == first
+    assert isinstance(different, HTTPException) and different.status_code == 409
+    # Once the sweep lands, a different scan may run.
+    assert asyncio.run(scan(["192.0.2.12"]))["devices"] == [{"ip": "192.0.2.12", "name": "AIO-12"}]
+
+
+def test_concurrent_verification_reads_of_one_target_are_shared(monkeypatch) -> None:
+    source = {"name": "SOURCE-01", "profile": {"mode": "camera"}}
+    target_before = {"name": "TARGET-01", "profile": {"mode": "old"}}
+    expected = {"name": "TARGET-01", "profile": {"mode": "camera"}}
+    report_calls = []
+
+    async def matching_report(*args, **kwargs):
+        report_calls.append(args[1])
+        await asyncio.sleep(0.01)
+        return expected
+
+    monkeypatch.setenv("MAGEWELL_USERNAME", "test-user")
+    monkeypatch.setenv("MAGEWELL_PASSWORD", "test-password")
+    monkeypatch.setattr(app_module, "get_device_report_with_login", matching_report)
+    app.state.devices = [DeviceRecord(ip="192.0.2.10", name="TARGET-01", settings=target_before)]
+    app.state.control_device_ip = "192.0.2.20"
+    app.state.control_settings = source
+    app.state.control_settings_sha256 = settings_fingerprint(source)
+
+    def verify(receipt_id: str | None = None):
+        return app_module.verify_target(
+            app_module.VerifyTargetRequest(
+                device={"ip": "192.0.2.10", "magewell_id": "TARGET-01"},
+                receipt_id=receipt_id,
+            ),
+            OPERATOR_INTENT_VALUE,
+            None,
+        )
+
+    async def run_reads() -> list:
+        return await asyncio.gather(verify(), verify(), verify("0" * 32), return_exceptions=True)
+
+    first, attached, different = asyncio.run(run_reads())
+
+    assert report_calls == ["192.0.2.10"]
+    assert attached is first and first["matches_expected_profile"] is True
+    assert isinstance(different, HTTPException) and different.status_code == 409
+
+
+def test_verify_target_reports_differing_sections_on_mismatch(monkeypatch) -> None:
+    source = {"name": "SOURCE-01", "profile": {"mode": "camera"}, "audio": {"gain": 3}}
+    target_before = {"name": "TARGET-01", "profile": {"mode": "old"}, "audio": {"gain": 1}}
+    drifted = {"name": "TARGET-01", "profile": {"mode": "camera"}, "audio": {"gain": 1}}
+
+    async def drifted_report(*args, **kwargs):
+        return drifted
+
+    async def no_wait(*args, **kwargs):
+        return None
+
+    monkeypatch.setenv("MAGEWELL_USERNAME", "test-user")
+    monkeypatch.setenv("MAGEWELL_PASSWORD", "test-password")
+    monkeypatch.setattr(app_module, "get_device_report_with_login", drifted_report)
+    monkeypatch.setattr(app_module.asyncio, "sleep", no_wait)
+    app.state.devices = [DeviceRecord(ip="192.0.2.10", name="TARGET-01", settings=target_before)]
+    app.state.control_device_ip = "192.0.2.20"
+    app.state.control_settings = source
+    app.state.control_settings_sha256 = settings_fingerprint(source)
+    response = client.post(
+        "/verify-target",
+        json={"device": {"ip": "192.0.2.10", "magewell_id": "TARGET-01"}},
+        headers=OPERATOR_HEADERS,
+    )
+    assert response.status_code == 200
+    assert response.json()["matches_expected_profile"] is False
+    assert response.json()["differing_sections"] == ["audio"]
+    assert "gain" not in response.text
+
+
+def test_profile_drift_matrix_uses_cached_inventory_only(monkeypatch) -> None:
+    source = {"name": "SOURCE-01", "eth": {"ip": "a"}, "audio": {"gain": 3}, "video": [1]}
+
+    async def unexpected_read(*args, **kwargs):
+        raise AssertionError("drift matrix must not read devices")
+
+    monkeypatch.setattr(app_module, "get_device_report_with_login", unexpected_read)
+    app.state.devices = [
+        DeviceRecord(ip="192.0.2.20", name="SOURCE-01", settings=source),
+        DeviceRecord(
+            ip="192.0.2.10",
+            name="TARGET-01",
+            settings={"name": "TARGET-01", "eth": {"ip": "b"}, "audio": {"gain": 3}},
+            identity={"serial": "S1", "eth_mac": "M1", "fleet_id": "ENC-01"},
+        ),
+        DeviceRecord(
+            ip="192.0.2.11",
+            name="TARGET-02",
+            settings={"name": "TARGET-02", "audio": {"gain": 1}, "video": [1]},
+        ),
+        DeviceRecord(ip="192.0.2.12", name="", settings={}, read_error="timeout"),
+    ]
+    app.state.control_device_ip = "192.0.2.20"
+    app.state.control_settings = source
+    app.state.control_settings_sha256 = settings_fingerprint(source)
+
+    response = client.get("/profile-drift")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["sections"] == ["audio", "video"]
+    assert [(row["ip"], row["cells"]) for row in body["devices"]] == [
+        ("192.0.2.10", "=-"),
+        ("192.0.2.11", "~="),
+        ("192.0.2.12", "??"),
+    ]
+    assert body["devices"][0]["fleet_id"] == "ENC-01"
+    assert body["section_drift_counts"] == [1, 1]
+    assert body["drifted_device_count"] == 3
+    assert "gain" not in response.text
+
+
+def test_profile_drift_requires_frozen_source() -> None:
+    app.state.control_settings = None
+    app.state.control_device_ip = None
+
+    assert client.get("/profile-drift").status_code == 400
+
+
+def test_composed_settings_tree_matches_merged_profile_digest() -> None:
+    source = {"name": "SOURCE-01", "eth": {"ip": "a"}, "profile": {"mode": "camera"}}
+    target = {"name": "TARGET-01", "eth": {"ip": "b"}, "profile": {"mode": "old"}, "extra": [1]}
+    merged = get_bulk_update_settings("TARGET-01", source, target)
+
+    composed = bulk_update_settings_tree(build_settings_tree(source), build_settings_tree(target))
+
+    assert composed == build_settings_tree(merged)
+    assert build_settings_tree({"value": 1}) != build_settings_tree({"value": True})
+    assert differing_sections(composed, build_settings_tree(target)) == ["profile"]
+
+
 def test_verify_target_allows_bounded_read_only_settle(monkeypatch) -> None:
     source = {"name": "SOURCE-01", "profile": {"mode": "camera"}}
     target_before = {"name": "TARGET-01", "profile": {"mode": "old"}}
@@ -1748,7 +3404,7 @@ def test_verify_target_allows_bounded_read_only_settle(monkeypatch) -> None:
     monkeypatch.setenv("MAGEWELL_PASSWORD", "test-password")
     monkeypatch.setattr(app_module, "get_device_report_with_login", settling_report)
     monkeypatch.setattr(app_module.asyncio, "sleep", no_wait)
-    app.state.devices = [{"ip": "192.0.2.10", "name": "TARGET-01", "settings": target_before}]
+    app.state.devices = [DeviceRecord(ip="192.0.2.10", name="TARGET-01", settings=target_before)]
     app.state.control_device_ip = "192.0.2.20"
     app.state.control_settings = source
     app.state.control_settings_sha256 = settings_fingerprint(source)
@@ -13,16 +13,19 @@ from backend.firmware import (
     EXPECTED_HARDWARE,
     EXPECTED_MODULE,
     EXPECTED_PRODUCT_ID,
+    CampaignTarget,
     FirmwareInstallResponseUnknown,
     FirmwareManifestEntry,
     FirmwareSafetyError,
     FirmwareUploadResponseUnknown,
     acquire_effect_state,
     assert_idle_status,
+    load_campaign_targets,
     open_validated_artifact,
     require_firmware_effects,
     restore_recording_channel_one,
     settings_preservation_report,
+    update_campaign,
     update_one,
     validate_artifact,
     validate_device_info,
@@ -161,6 +164,101 @@ def test_upload_uses_the_same_descriptor_that_was_hashed(monkeypatch, tmp_path)
         assert artifact.file.read() == original
 
 
+def test_validated_digest_is_reused_until_the_file_identity_changes(monkeypatch, tmp_path) -> None:
+    artifact_path = tmp_path / ARTIFACT_FILENAME
+    install_test_manifest(monkeypatch, artifact_path, b"validated-bytes")
+    monkeypatch.setattr(firmware, "_verified_artifact_digests", {})
+    cache_dir = tmp_path / "recovery" / "artifact-digests"
+    cache_dir.parent.mkdir()
+    hashes = 0
+    original_hash = firmware._hash_artifact
+
+    def counting_hash(firmware_file):
+        nonlocal hashes
+        hashes += 1
+        return original_hash(firmware_file)
+
+    monkeypatch.setattr(firmware, "_hash_artifact", counting_hash)
+    for _ in range(3):
+        with open_validated_artifact(
+            artifact_path, TARGET_VERSION, digest_cache_dir=cache_dir
+        ) as artifact:
+            assert artifact.file.read() == b"validated-bytes"
+    assert hashes == 1
+    assert (
+        stat.S_IMODE(
+            (cache_dir / f"{firmware.approved_manifest(TARGET_VERSION).sha256}.json").stat().st_mode
+        )
+        == 0o600
+    )
+
+    monkeypatch.setattr(firmware, "_verified_artifact_digests", {})
+    validate_artifact(artifact_path, TARGET_VERSION)
+    assert hashes == 2
+    monkeypatch.setattr(firmware, "_verified_artifact_digests", {})
+    with open_validated_artifact(artifact_path, TARGET_VERSION, digest_cache_dir=cache_dir):
+        pass
+    assert hashes == 2
+
+    artifact_path.write_bytes(b"tampered-bytes!")
+    with pytest.raises(FirmwareSafetyError, match="SHA-256 mismatch"):
+        validate_artifact(artifact_path, TARGET_VERSION)
+    assert hashes == 3
+
+
+def test_upload_streams_the_validated_descriptor_with_exact_length_and_progress(
+    monkeypatch, tmp_path
+) -> None:
+    artifact_path = tmp_path / ARTIFACT_FILENAME
+    payload = bytes(range(256)) * 9
+    install_test_manifest(monkeypatch, artifact_path, payload)
+    monkeypatch.setattr(firmware, "UPLOAD_CHUNK_BYTES", 1000)
+    progress: list[tuple[int, int]] = []
+    sent = bytearray()
+
+    class CollectingWriter:
+        async def write(self, chunk):
+            sent.extend(chunk)
+
+    class FakeResponse:
+        def raise_for_status(self):
+            return None
+
+        async def json(self):
+            return {"status": 0, "version": TARGET_VERSION, "size": len(payload)}
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *args):
+            return False
+
+    class UploadSession:
+        def post(self, url, *, data, **kwargs):
+            async def serialize():
+                await data.write(CollectingWriter())
+
+            self.serialize = serialize
+            self.size = data.size
+            return FakeResponse()
+
+    session = UploadSession()
+
+    async def upload():
+        with open_validated_artifact(artifact_path, TARGET_VERSION) as artifact:
+            artifact.file.seek(5)
+            result = await firmware.upload_firmware_once(
+                session, "192.0.2.10", "sid=test", artifact, lambda *item: progress.append(item)
+            )
+            await session.serialize()
+            return result
+
+    assert asyncio.run(upload())["size"] == len(payload)
+    assert payload in bytes(sent)
+    assert session.size == len(sent)
+    assert progress == [(1000, 2304), (2000, 2304), (2304, 2304)]
+
+
 @pytest.mark.parametrize(
     "bad_status",
     [
@@ -434,14 +532,14 @@ def test_settings_preservation_accepts_only_observed_firmware_defaults_and_trans
             "video-pid": 0,
         }
     )
-    report = settings_preservation_report(before, after)
+    report = settings_preservation_report(before, after, TARGET_VERSION)
     assert report["preserved"] is True
     assert report["unexpected_change_paths"] == []
     assert "enable-zen-master" in report["accepted_firmware_additions"]
     assert report["ignored_transient_paths"] == ["after.wifi.0.level", "before.wifi.0.level"]
 
     after["profile"] = "unexpected-change"
-    changed = settings_preservation_report(before, after)
+    changed = settings_preservation_report(before, after, TARGET_VERSION)
     assert changed["preserved"] is False
     assert changed["unexpected_change_paths"] == ["profile"]
 
@@ -463,13 +561,65 @@ def test_settings_preservation_accepts_observed_scheduler_defaults() -> None:
             "utc-time-end": 0,
         }
     )
-    report = settings_preservation_report(before, after)
+    report = settings_preservation_report(before, after, TARGET_VERSION)
     assert report["preserved"] is True
     assert report["unexpected_change_paths"] == []
     assert "schedulers.0.import-type" in report["accepted_firmware_additions"]
     assert "schedulers.0.channels.0.source" in report["accepted_firmware_additions"]
 
 
+def test_settings_preservation_reports_nested_paths_and_type_changes() -> None:
+    before = {
+        "name": "ENCODER-01",
+        "stream-server": [{"port": 1935, "enabled": 1}, {"port": 554}],
+        "video": {"bitrate": 4000},
+    }
+    after = copy.deepcopy(before)
+    after["stream-server"][0]["enabled"] = True
+    after["stream-server"].append({"port": 8000})
+    after["video"]["codec"] = "h264"
+
+    report = settings_preservation_report(before, after, TARGET_VERSION)
+
+    assert report["unexpected_change_paths"] == [
+        "stream-server.length",
+        "stream-server.0.enabled",
+        "video.codec",
+    ]
+
+
+def test_settings_preservation_rules_are_versioned_data(monkeypatch) -> None:
+    monkeypatch.setitem(
+        firmware.SETTINGS_PRESERVATION_RULES,
+        "9.9.1",
+        {
+            "transient_paths": ("*.uptime",),
+            "expected_additions": {"outputs.*.mode": "auto"},
+        },
+    )
+    monkeypatch.setattr(firmware, "_compiled_preservation_rules", {})
+    before = {"audio": {"uptime": 1}, "outputs": [{"id": 1}, {"id": 2}]}
+    after = {"audio": {"uptime": 9}, "outputs": [{"id": 1, "mode": "auto"}, {"id": 2}]}
+
+    report = settings_preservation_report(before, after, "9.9.1")
+
+    assert report["preserved"] is True
+    assert report["accepted_firmware_additions"] == ["outputs.0.mode"]
+    assert report["ignored_transient_paths"] == ["after.audio.uptime", "before.audio.uptime"]
+    assert firmware.preservation_rules("9.9.1") is firmware.preservation_rules("9.9.1")
+
+    after["outputs"][1]["mode"] = "manual"
+    assert settings_preservation_report(before, after, "9.9.1")["unexpected_change_paths"] == [
+        "outputs.1.mode"
+    ]
+    # The 2.4.288 additions are not implicitly accepted for another version.
+    assert settings_preservation_report({}, {"enable-zen-master": 0}, "9.9.1")[
+        "unexpected_change_paths"
+    ] == ["enable-zen-master"]
+    with pytest.raises(FirmwareSafetyError, match="No settings-preservation rules"):
+        settings_preservation_report(before, after, "1.0.0")
+
+
 def test_recovery_backup_is_private_durable_and_never_overwritten(tmp_path) -> None:
     run_dir = tmp_path / "recovery" / "serial" / "hash"
     backup = write_recovery_backup(
@@ -597,6 +747,32 @@ def test_update_revalidates_identity_and_idle_then_submits_exactly_once(
     assert '"state":"install-accepted"' in events
 
 
+def test_update_without_preservation_rules_is_refused_before_any_device_call(
+    monkeypatch, tmp_path
+) -> None:
+    arm_only_firmware(monkeypatch)
+    artifact_path = tmp_path / ARTIFACT_FILENAME
+    install_test_manifest(monkeypatch, artifact_path, b"artifact")
+    calls = install_orchestration_fakes(monkeypatch)
+    monkeypatch.delitem(firmware.SETTINGS_PRESERVATION_RULES, TARGET_VERSION)
+    monkeypatch.setattr(firmware, "_compiled_preservation_rules", {})
+
+    with pytest.raises(FirmwareSafetyError, match="No settings-preservation rules"):
+        asyncio.run(
+            update_one(
+                "192.0.2.10",
+                "ENCODER-01",
+                "A305200908002",
+                "d0:c8:57:80:3a:70",
+                TARGET_VERSION,
+                artifact_path,
+                confirm=True,
+                recovery_root=tmp_path / "recovery",
+            )
+        )
+    assert calls == {"report": 0, "info": 0, "status": 0, "upload": 0, "install": 0, "verify": 0}
+
+
 def test_unknown_upload_is_durable_and_never_starts_install(monkeypatch, tmp_path) -> None:
     arm_only_firmware(monkeypatch)
     artifact_path = tmp_path / ARTIFACT_FILENAME
@@ -911,3 +1087,157 @@ def test_recording_recovery_restores_only_receipt_bound_enable_flag(monkeypatch,
     assert json.loads((run_dir / "firmware-state.json").read_text())["state"] == (
         "recording-recovery-verified"
     )
+
+
+def campaign_targets() -> list[CampaignTarget]:
+    return [
+        CampaignTarget(
+            ip=f"192.0.2.{10 + index}",
+            expected_name=f"ENCODER-0{index + 1}",
+            expected_serial=f"SERIAL-{index}",
+            expected_eth_mac=f"d0:c8:57:80:3a:7{index}",
+        )
+        for index in range(3)
+    ]
+
+
+def install_campaign_fakes(monkeypatch, failing_preflight_ip: str | None = None) -> list[str]:
+    events: list[str] = []
+
+    async def fake_preflight(ip, expected_name, target_version):
+        events.append(f"preflight:{ip}")
+        await asyncio.sleep(0)
+        if ip == failing_preflight_ip:
+            raise FirmwareSafetyError("Device has blocked running-status bits set: 0x8.")
+        return {**valid_preflight(), "ip": ip, "name": expected_name}
+
+    async def fake_update(ip, *args, preflight, reboot_started, **kwargs):
+        assert preflight["ip"] == ip
+        events.append(f"install:{ip}")
+        reboot_started.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        events.append(f"verified:{ip}")
+        return {"status": "updated-and-verified"}
+
+    monkeypatch.setenv("ALLOWED_SUBNET", "192.0.2.0/24")
+    monkeypatch.setattr(firmware, "preflight_one", fake_preflight)
+    monkeypatch.setattr(firmware, "update_one", fake_update)
+    return events
+
+
+def test_campaign_installs_one_at_a_time_and_preflights_during_reboot(
+    monkeypatch, tmp_path
+) -> None:
+    arm_only_firmware(monkeypatch)
+    events = install_campaign_fakes(monkeypatch)
+
+    result = asyncio.run(
+        update_campaign(
+            campaign_targets(),
+            TARGET_VERSION,
+            tmp_path / ARTIFACT_FILENAME,
+            confirm=True,
+            lookahead=1,
+        )
+    )
+
+    assert result["status"] == "completed"
+    assert result["not_started"] == []
+    assert events == [
+        "preflight:192.0.2.10",
+        "install:192.0.2.10",
+        "preflight:192.0.2.11",
+        "verified:192.0.2.10",
+        "install:192.0.2.11",
+        "preflight:192.0.2.12",
+        "verified:192.0.2.11",
+        "install:192.0.2.12",
+        "verified:192.0.2.12",
+    ]
+
+
+def test_campaign_stops_before_next_install_when_a_queued_preflight_fails(
+    monkeypatch, tmp_path
+) -> None:
+    arm_only_firmware(monkeypatch)
+    events = install_campaign_fakes(monkeypatch, failing_preflight_ip="192.0.2.12")
+
+    result = asyncio.run(
+        update_campaign(
+            campaign_targets(), TARGET_VERSION, tmp_path / ARTIFACT_FILENAME, confirm=True
+        )
+    )
+
+    assert result["status"] == "stopped"
+    assert "192.0.2.12" in result["stop_reason"]
+    assert [item["ip"] for item in result["results"]] == ["192.0.2.10"]
+    assert result["not_started"] == ["192.0.2.11", "192.0.2.12"]
+    assert [event for event in events if event.startswith("install:")] == ["install:192.0.2.10"]
+
+
+def test_campaign_targets_require_exact_unique_reviewed_identities(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("ALLOWED_SUBNET", "192.0.2.0/24")
+    path = tmp_path / "campaign.csv"
+    path.write_text(
+        "ip,expected_name,expected_serial,expected_eth_mac\n"
+        "192.0.2.10,ENCODER-01,SERIAL-1,d0:c8:57:80:3a:70\n"
+        "192.0.2.11,ENCODER-02,SERIAL-1,d0:c8:57:80:3a:71\n",
+        encoding="utf-8",
+    )
+    with pytest.raises(FirmwareSafetyError, match="repeats a device"):
+        load_campaign_targets(path)
+    path.write_text("ip,expected_name\n192.0.2.10,ENCODER-01\n", encoding="utf-8")
+    with pytest.raises(FirmwareSafetyError, match="exactly the headers"):
+        load_campaign_targets(path)
+
+
+def test_post_update_wait_probes_cheaply_before_authenticated_verification(monkeypatch) -> None:
+    stages = iter(["offline", "offline", "port-open", "ready", "ready"])
+    delays: list[float] = []
+    authenticated: list[str] = []
+    infos = iter([valid_info(), valid_info(TARGET_VERSION)])
+
+    async def fake_stage(_session, _ip):
+        return next(stages)
+
+    async def record_sleep(delay):
+        delays.append(delay)
+
+    async def fake_login(*args, **kwargs):
+        authenticated.append("login")
+        return "sid=test"
+
+    async def fake_info(*args, **kwargs):
+        return next(infos)
+
+    async def fake_report(*args, **kwargs):
+        return {"name": "ENCODER-01"}
+
+    async def fake_status(*args, **kwargs):
+        return valid_status()
+
+    monkeypatch.setattr(firmware.aiohttp, "ClientSession", FakeClientSession)
+    monkeypatch.setattr(firmware, "readiness_stage", fake_stage)
+    monkeypatch.setattr(firmware.asyncio, "sleep", record_sleep)
+    monkeypatch.setattr(firmware, "login_device", fake_login)
+    monkeypatch.setattr(firmware, "get_device_info", fake_info)
+    monkeypatch.setattr(firmware, "get_device_report_with_login", fake_report)
+    monkeypatch.setattr(firmware, "get_device_status", fake_status)
+
+    verified, report = asyncio.run(
+        firmware.wait_for_verified_firmware(
+            "192.0.2.10",
+            "ENCODER-01",
+            "Admin",
+            "password",
+            TARGET_VERSION,
+            "A305200908002",
+            "d0:c8:57:80:3a:70",
+        )
+    )
+
+    assert verified["firmware"] == TARGET_VERSION
+    assert report == {"name": "ENCODER-01"}
+    assert delays == [5.0, 2.0, 2.0, 1.0, 5.0]
+    assert authenticated == ["login", "login"]
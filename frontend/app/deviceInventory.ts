@@ -0,0 +1,144 @@
+export interface InventoryDevice {
+  ip: string;
+  name: string;
+  fleet_id?: string;
+  read_error?: string;
+  identity_error?: string;
+}
+
+export interface ScanSummary {
+  scan_id: string;
+  status: "complete" | "partial";
+  partial_reason: "deadline" | "cancelled" | null;
+  host_count: number;
+  probed_count: number;
+  write_eligible: boolean;
+  journaled_count?: number;
+  journaled_found_count?: number;
+  journal_accounted_after_seconds?: number | null;
+  skipped_count?: number;
+  circuit_open_count?: number;
+  full_sweep?: boolean;
+  retry_budget?: number;
+  retries_used?: number;
+}
+
+export function journalCoverage(scan?: ScanSummary | null): string {
+  if (!scan?.journaled_count) return "";
+  if (scan.journal_accounted_after_seconds != null)
+    return `All ${scan.journaled_count} journaled devices accounted for after ${scan.journal_accounted_after_seconds.toFixed(1)} s.`;
+  return `${scan.journaled_found_count ?? 0} of ${scan.journaled_count} journaled devices found.`;
+}
+
+export function partialScanNotice(scan?: ScanSummary | null): string {
+  if (!scan || scan.write_eligible) return "";
+  const reason =
+    scan.partial_reason === "cancelled"
+      ? "The scan was cancelled"
+      : "The scan deadline expired";
+  return `${reason} after ${scan.probed_count} of ${scan.host_count} addresses. This partial inventory is read only; run a complete scan before any write.`;
+}
+
+export type InventoryFilter = "all" | "compatible" | "blocked" | "errors";
+export type InventorySort = "fleet_id" | "name" | "ip" | "error" | "compatibility";
+
+export interface InventoryView {
+  query: string;
+  filter: InventoryFilter;
+  sort: InventorySort;
+}
+
+export const defaultInventoryView: InventoryView = {
+  query: "",
+  filter: "all",
+  sort: "fleet_id",
+};
+
+export function deviceHasError(device: InventoryDevice): boolean {
+  return Boolean(device.read_error || device.identity_error);
+}
+
+function ipSortKey(ip: string): number {
+  return ip
+    .split(".")
+    .reduce((value, octet) => value * 256 + (Number(octet) || 0), 0);
+}
+
+const collator = new Intl.Collator(undefined, {
+  numeric: true,
+  sensitivity: "base",
+});
+
+export function filterAndSortDevices<T extends InventoryDevice>(
+  devices: readonly T[],
+  view: InventoryView,
+  blockedReasons: ReadonlyMap<string, string>,
+  controlSourceIp?: string,
+): T[] {
+  const query = view.query.trim().toLowerCase();
+  const isBlocked = (device: T) =>
+    device.ip === controlSourceIp || blockedReasons.has(device.ip);
+  const visible = devices.filter((device) => {
+    if (
+      query &&
+      !device.name.toLowerCase().includes(query) &&
+      !(device.fleet_id || "").toLowerCase().includes(query) &&
+      !device.ip.includes(query)
+    ) {
+      return false;
+    }
+    if (view.filter === "errors") return deviceHasError(device);
+    if (view.filter === "blocked") return isBlocked(device);
+    if (view.filter === "compatible")
+      return !isBlocked(device) && !deviceHasError(device);
+    return true;
+  });
+  const byIp = (left: T, right: T) => ipSortKey(left.ip) - ipSortKey(right.ip);
+  const compare: Record<InventorySort, (left: T, right: T) => number> = {
+    // Devices without a journal entry sort after every fleet ID.
+    fleet_id: (left, right) =>
+      Number(!left.fleet_id) - Number(!right.fleet_id) ||
+      collator.compare(left.fleet_id || "", right.fleet_id || "") ||
+      byIp(left, right),
+    name: (left, right) =>
+      collator.compare(left.name, right.name) || byIp(left, right),
+    ip: byIp,
+    error: (left, right) =>
+      Number(deviceHasError(right)) - Number(deviceHasError(left)) ||
+      byIp(left, right),
+    compatibility: (left, right) =>
+      Number(isBlocked(left)) - Number(isBlocked(right)) || byIp(left, right),
+  };
+  return visible.sort(compare[view.sort]);
+}
+
+export function toggleSelection(
+  selected: ReadonlySet<string>,
+  ip: string,
+): Set<string> {
+  const next = new Set(selected);
+  if (!next.delete(ip)) next.add(ip);
+  return next;
+}
+
+export interface RowWindow {
+  startRow: number;
+  endRow: number;
+}
+
+// Rows rendered beyond the viewport on each side, so fast scrolling stays filled.
+const OVERSCAN_ROWS = 2;
+
+export function visibleRowWindow(
+  scrollTop: number,
+  viewportHeight: number,
+  rowHeight: number,
+  rowCount: number,
+): RowWindow {
+  const startRow = Math.max(0, Math.floor(scrollTop / rowHeight) - OVERSCAN_ROWS);
+  const endRow = Math.min(
+    rowCount,
+    Math.ceil((scrollTop + viewportHeight) / rowHeight) + OVERSCAN_ROWS,
+  );
+  return { startRow, endRow: Math.max(startRow, endRow) };
+}
@@ -1,7 +1,15 @@
 "use client";
 
-import { ChangeEvent, FormEvent, useEffect, useRef, useState } from "react";
+import {
+  ChangeEvent,
+  FormEvent,
+  useEffect,
+  useMemo,
+  useRef,
+  useState,
+} from "react";
 import DeviceGrid from "@/components/DeviceGrid";
+import DriftHeatmap from "@/components/DriftHeatmap";
 import { Device } from "@/components/DeviceCard";
 import {
   isReceiptDisplaySafe,
@@ -9,6 +17,19 @@ import {
   receiptTargetSummary,
   type ProfileRunReceipt,
 } from "./profileRunReceipts";
+import { driftSummary, type ProfileDriftMatrix } from "./profileDrift";
+import {
+  journalCoverage,
+  partialScanNotice,
+  toggleSelection,
+  type ScanSummary,
+} from "./deviceInventory";
+import {
+  jobProgress,
+  readPushStream,
+  type PushVerifyJob,
+  type PushVerifyJobEvent,
+} from "./pushStream";
 import styles from "./page.module.css";
 
 const backendBaseUrl = (
@@ -86,12 +107,16 @@ export default function HomePage() {
   const [loading, setLoading] = useState(false);
   const [devices, setDevices] = useState<Device[]>([]);
   const [error, setError] = useState("");
+  const [scanNotice, setScanNotice] = useState("");
+  const [scanCoverage, setScanCoverage] = useState("");
   const [subnet, setSubnet] = useState("");
   const [scanMode, setScanMode] = useState<"subnet" | "known-ips">("subnet");
   const [knownIps, setKnownIps] = useState("");
   const [selectedControlDevice, setSelectedControlDevice] =
     useState<Device | null>(null);
-  const [selectedPushIps, setSelectedPushIps] = useState<string[]>([]);
+  const [selectedPushIps, setSelectedPushIps] = useState<ReadonlySet<string>>(
+    () => new Set(),
+  );
   const [controlMessage, setControlMessage] = useState("");
   const [controlSource, setControlSource] = useState<ControlSource | null>(
     null,
@@ -114,21 +139,29 @@ export default function HomePage() {
     ProfileRunReceipt[]
   >([]);
   const [receiptMessage, setReceiptMessage] = useState("");
+  const [driftMatrix, setDriftMatrix] = useState<ProfileDriftMatrix | null>(
+    null,
+  );
+  const [driftMessage, setDriftMessage] = useState("");
   const [writesEnabled, setWritesEnabled] = useState(false);
-  const incompatibleTargetReasons = new Map(
-    controlSource?.incompatible_targets.map((target) => [
-      target.ip,
-      target.reason,
-    ]) || [],
+  const incompatibleTargetReasons = useMemo(
+    () =>
+      new Map(
+        controlSource?.incompatible_targets.map((target) => [
+          target.ip,
+          target.reason,
+        ]) || [],
+      ),
+    [controlSource],
   );
   const eligibleTargetIps = controlSource
     ? controlSource.compatible_target_ips
     : devices.map((device) => device.ip);
   const allTargetsSelected =
     eligibleTargetIps.length > 0 &&
-    eligibleTargetIps.every((ip) => selectedPushIps.includes(ip));
+    eligibleTargetIps.every((ip) => selectedPushIps.has(ip));
   const selectedDevices = devices.filter((device) =>
-    selectedPushIps.includes(device.ip),
+    selectedPushIps.has(device.ip),
   );
 
   const invalidateProfilePlan = (message = "") => {
@@ -136,6 +169,9 @@ export default function HomePage() {
     setProfilePlan(null);
     setProfilePlanInProgress(false);
     setProfilePlanMessage(message);
+    // The drift matrix is derived from the same cached inventory and source.
+    setDriftMatrix(null);
+    setDriftMessage("");
   };
 
   const loadProfileRunReceipts = async () => {
@@ -160,6 +196,22 @@ export default function HomePage() {
     }
   };
 
+  const loadProfileDrift = async () => {
+    setDriftMessage("Comparing cached inventory with the frozen source...");
+    try {
+      const response = await fetch(`${backendBaseUrl}/profile-drift`);
+      if (!response.ok) throw new Error(await apiError(response));
+      const matrix: ProfileDriftMatrix = await response.json();
+      setDriftMatrix(matrix);
+      setDriftMessage(driftSummary(matrix));
+    } catch (driftError) {
+      setDriftMatrix(null);
+      setDriftMessage(
+        `Drift comparison unavailable: ${driftError instanceof Error ? driftError.message : "unknown error"}`,
+      );
+    }
+  };
+
   useEffect(() => {
     const loadSafeStatus = async () => {
       try {
@@ -187,8 +239,10 @@ export default function HomePage() {
     setActiveReceiptId(null);
     setLoading(true);
     setError("");
+    setScanNotice("");
+    setScanCoverage("");
     setDevices([]);
-    setSelectedPushIps([]);
+    setSelectedPushIps(new Set());
     setPushResults([]);
     invalidateProfilePlan();
     setVerificationMessage("");
@@ -204,6 +258,8 @@ export default function HomePage() {
       if (!response.ok) throw new Error(await apiError(response));
       const data = await response.json();
       setDevices(data.devices || []);
+      setScanNotice(partialScanNotice(data.scan as ScanSummary | null));
+      setScanCoverage(journalCoverage(data.scan as ScanSummary | null));
     } catch (scanError) {
       setError(
         scanError instanceof Error ? scanError.message : "Network scan failed.",
@@ -231,6 +287,8 @@ export default function HomePage() {
     setActiveReceiptId(null);
     setLoading(true);
     setError("");
+    setScanNotice("");
+    setScanCoverage("");
     invalidateProfilePlan("Profile plan invalidated: discovery was requested.");
     try {
       const response = await fetch(`${backendBaseUrl}/discover-known-ips`, {
@@ -244,7 +302,9 @@ export default function HomePage() {
       if (!response.ok) throw new Error(await apiError(response));
       const data = await response.json();
       setDevices(data.devices || []);
-      setSelectedPushIps([]);
+      setScanNotice(partialScanNotice(data.scan as ScanSummary | null));
+      setScanCoverage(journalCoverage(data.scan as ScanSummary | null));
+      setSelectedPushIps(new Set());
       setPushResults([]);
       setVerificationMessage("");
       setVerificationResults([]);
@@ -265,6 +325,22 @@ export default function HomePage() {
     }
   };
 
+  const cancelScan = async () => {
+    try {
+      const response = await fetch(`${backendBaseUrl}/discover-cancel`, {
+        method: "POST",
+        headers: { "X-Magewell-Operator-Intent": "confirmed" },
+      });
+      if (!response.ok) throw new Error(await apiError(response));
+    } catch (cancelError) {
+      setError(
+        cancelError instanceof Error
+          ? cancelError.message
+          : "The scan could not be cancelled.",
+      );
+    }
+  };
+
   const handleSelectToggle = (device: Device) => {
     if (verificationRequired) {
       setPushMessage(
@@ -283,11 +359,7 @@ export default function HomePage() {
       setPushMessage(`Target ${device.ip} is blocked: ${blockedReason}`);
       return;
     }
-    setSelectedPushIps((previous) =>
-      previous.includes(device.ip)
-        ? previous.filter((ip) => ip !== device.ip)
-        : [...previous, device.ip],
-    );
+    setSelectedPushIps((previous) => toggleSelection(previous, device.ip));
     invalidateProfilePlan(
       "Profile plan invalidated: target selection changed.",
     );
@@ -300,7 +372,7 @@ export default function HomePage() {
       );
       return;
     }
-    setSelectedPushIps(eligibleTargetIps);
+    setSelectedPushIps(new Set(eligibleTargetIps));
     setPushMessage("");
     invalidateProfilePlan(
       "Profile plan invalidated: target selection changed.",
@@ -314,7 +386,7 @@ export default function HomePage() {
       );
       return;
     }
-    setSelectedPushIps([]);
+    setSelectedPushIps(new Set());
     setPushMessage("");
     invalidateProfilePlan(
       "Profile plan invalidated: target selection changed.",
@@ -342,7 +414,7 @@ export default function HomePage() {
       invalidateProfilePlan("Profile plan invalidated: source changed.");
       setSelectedPushIps((previous) => {
         const compatibleIps = new Set(data.compatible_target_ips);
-        return previous.filter((ip) => compatibleIps.has(ip));
+        return new Set([...previous].filter((ip) => compatibleIps.has(ip)));
       });
       setControlMessage(
         `Source frozen: ${data.magewell_id} (${data.ip}) · Profile ${shortHash(data.settings_sha256)}`,
@@ -364,7 +436,7 @@ export default function HomePage() {
       return;
     }
     const devicesToPlan = devices
-      .filter((device) => selectedPushIps.includes(device.ip))
+      .filter((device) => selectedPushIps.has(device.ip))
       .map((device) => ({ ip: device.ip, magewell_id: device.name }));
     if (devicesToPlan.length === 0) {
       setProfilePlanMessage(
@@ -412,52 +484,80 @@ export default function HomePage() {
     }
   };
 
-  const pushUpdates = async () => {
+  const confirmWriteTargets = () => {
     if (!writesEnabled) {
       setPushMessage("Device writes are locked by the backend configuration.");
-      return;
+      return null;
     }
-    if (selectedPushIps.length === 0) {
+    if (selectedPushIps.size === 0) {
       setPushMessage("Select at least one device.");
-      return;
+      return null;
     }
     if (!controlSource) {
       setPushMessage("Select and freeze the live control source first.");
-      return;
+      return null;
     }
     const confirmed = window.confirm(
-      `Write profile ${shortHash(controlSource.settings_sha256)} from ${controlSource.magewell_id} (${controlSource.ip}) to exactly ${selectedPushIps.length} selected non-source device(s)? This changes device configuration.`,
+      `Write profile ${shortHash(controlSource.settings_sha256)} from ${controlSource.magewell_id} (${controlSource.ip}) to exactly ${selectedPushIps.size} selected non-source device(s)? This changes device configuration.`,
     );
     if (!confirmed) {
       setPushMessage("Update cancelled; no write request was sent.");
-      return;
+      return null;
     }
 
     invalidateProfilePlan(
       "Profile plan invalidated: a device write was requested; generate a fresh plan after verification.",
     );
 
-    const devicesToUpdate = devices
-      .filter((device) => selectedPushIps.includes(device.ip))
+    return devices
+      .filter((device) => selectedPushIps.has(device.ip))
       .map((device) => ({ ip: device.ip, magewell_id: device.name }));
+  };
+
+  const pushUpdates = async () => {
+    const devicesToUpdate = confirmWriteTargets();
+    if (!devicesToUpdate) return;
     setPushInProgress(true);
     setPushMessage("Updating selected devices...");
     setPushResults([]);
     try {
-      const response = await fetch(`${backendBaseUrl}/push-updates`, {
-        method: "POST",
-        headers: {
-          "Content-Type": "application/json",
-          "X-Magewell-Operator-Intent": "confirmed",
+      const response = await fetch(
+        `${backendBaseUrl}/push-updates?stream=true`,
+        {
+          method: "POST",
+          headers: {
+            "Content-Type": "application/json",
+            "X-Magewell-Operator-Intent": "confirmed",
+          },
+          body: JSON.stringify({ devices: devicesToUpdate, confirm: true }),
         },
-        body: JSON.stringify({ devices: devicesToUpdate, confirm: true }),
-      });
+      );
       if (!response.ok) throw new Error(await apiError(response));
-      const data = await response.json();
-      setPushResults(data.results || []);
-      setActiveReceiptId(data.receipt_id || null);
+      if (!response.body) throw new Error("The update response had no body.");
+      const streamed: UpdateResult[] = [];
+      let data: { receipt_id?: string; results?: UpdateResult[] } = {};
+      let failure = "";
+      await readPushStream(response.body, (event) => {
+        if (event.event === "started") {
+          setActiveReceiptId(event.receipt_id);
+          setPushMessage(
+            `Updating ${event.target_count} device(s), ${event.concurrency} at a time...`,
+          );
+        } else if (event.event === "result") {
+          streamed.push(event);
+          setPushResults([...streamed]);
+        } else if (event.event === "finished") {
+          data = event;
+        } else {
+          failure = event.detail;
+        }
+      });
       void loadProfileRunReceipts();
-      const requiresReadBack = (data.results || []).some(
+      if (failure) throw new Error(failure);
+      if (!data.results)
+        throw new Error("The update stream ended before the batch finished.");
+      setPushResults(data.results);
+      const requiresReadBack = data.results.some(
         (result: UpdateResult) => result.status === "updated",
       );
       setVerificationRequired(requiresReadBack);
@@ -475,6 +575,72 @@ export default function HomePage() {
     }
   };
 
+  const pushAndVerify = async () => {
+    const devicesToUpdate = confirmWriteTargets();
+    if (!devicesToUpdate) return;
+    setPushInProgress(true);
+    setVerificationInProgress(true);
+    setPushMessage("Starting write-and-verify job...");
+    setPushResults([]);
+    setVerificationResults([]);
+    try {
+      const response = await fetch(`${backendBaseUrl}/push-verify-jobs`, {
+        method: "POST",
+        headers: {
+          "Content-Type": "application/json",
+          "X-Magewell-Operator-Intent": "confirmed",
+        },
+        body: JSON.stringify({ devices: devicesToUpdate, confirm: true }),
+      });
+      if (!response.ok) throw new Error(await apiError(response));
+      let job: PushVerifyJob = await response.json();
+      setActiveReceiptId(job.receipt_id);
+      const events: PushVerifyJobEvent[] = [...job.events];
+      // The job runs server-side; polling only reports progress and may be resumed.
+      while (job.status === "running") {
+        await new Promise((resolve) => setTimeout(resolve, 500));
+        const poll = await fetch(
+          `${backendBaseUrl}/push-verify-jobs/${job.job_id}?after=${events.length}`,
+        );
+        if (!poll.ok) throw new Error(await apiError(poll));
+        job = await poll.json();
+        events.push(...job.events);
+        setPushResults(
+          events.flatMap((event) => (event.event === "pushed" ? [event] : [])),
+        );
+        setVerificationResults(
+          events.flatMap((event) =>
+            event.event === "verified" ? [event] : [],
+          ),
+        );
+        const progress = jobProgress(events);
+        setPushMessage(
+          `Wrote ${progress.pushed} of ${job.target_count}; verified ${progress.verified}, mismatched ${progress.mismatched}.`,
+        );
+      }
+      void loadProfileRunReceipts();
+      if (job.status === "failed")
+        throw new Error(job.error || "the job stopped");
+      const progress = jobProgress(events);
+      const allVerified = progress.verified === job.target_count;
+      setVerificationRequired(!allVerified);
+      if (allVerified) setSelectedPushIps(new Set());
+      setVerificationMessage(
+        allVerified
+          ? `Read-back verified ${progress.verified} target${progress.verified === 1 ? "" : "s"}; the next target selection is unlocked.`
+          : "Some targets were not written or did not verify. Keep writes stopped and investigate before retrying.",
+      );
+    } catch (jobError) {
+      setVerificationRequired(true);
+      setPushMessage(
+        `Write-and-verify job failed: ${jobError instanceof Error ? jobError.message : "unknown error"}`,
+      );
+    } finally {
+      setPushInProgress(false);
+      setVerificationInProgress(false);
+    }
+  };
+
   const verifySelectedTargets = async () => {
     if (!controlSource) {
       setVerificationMessage(
@@ -483,7 +649,7 @@ export default function HomePage() {
       return;
     }
     const selectedDevices = devices.filter((device) =>
-      selectedPushIps.includes(device.ip),
+      selectedPushIps.has(device.ip),
     );
     if (selectedDevices.length === 0) {
       setVerificationMessage(
@@ -534,7 +700,7 @@ export default function HomePage() {
       results.every((result) => result.matches_expected_profile);
     if (allVerified) {
       setVerificationRequired(false);
-      setSelectedPushIps([]);
+      setSelectedPushIps(new Set());
       setVerificationMessage(
         `Read-back verified ${results.length} target${results.length === 1 ? "" : "s"}; the next target selection is unlocked.`,
       );
@@ -585,7 +751,7 @@ export default function HomePage() {
               className={styles.label}
             >
               {scanMode === "subnet"
-                ? "Discovery subnet"
+                ? "Discovery subnets"
                 : "Known IPv4 addresses"}
             </label>
             {scanMode === "subnet" ? (
@@ -597,7 +763,7 @@ export default function HomePage() {
                   setSubnet(event.target.value)
                 }
                 className={styles.input}
-                placeholder="Enter an allowed CIDR"
+                placeholder="Allowed CIDRs, comma-separated"
               />
             ) : (
               <textarea
@@ -622,6 +788,15 @@ export default function HomePage() {
                 ? "Scan network"
                 : "Read known IPs"}
           </button>
+          {loading && (
+            <button
+              type="button"
+              className={styles.secondaryButton}
+              onClick={() => void cancelScan()}
+            >
+              Stop scan
+            </button>
+          )}
         </form>
         <span className={styles.inventoryCount}>
           {loading
@@ -629,6 +804,8 @@ export default function HomePage() {
             : `${devices.length} encoder${devices.length === 1 ? "" : "s"}`}
         </span>
         {controlMessage && <p className={styles.notice}>{controlMessage}</p>}
+        {scanCoverage && <p className={styles.notice}>{scanCoverage}</p>}
+        {scanNotice && <p className={styles.errorNotice}>{scanNotice}</p>}
         {error && <p className={styles.errorNotice}>{error}</p>}
       </section>
 
@@ -667,13 +844,13 @@ export default function HomePage() {
               <div className={styles.summaryCard}>
                 <span className={styles.summaryLabel}>Targets</span>
                 <strong>
-                  {selectedPushIps.length} selected
+                  {selectedPushIps.size} selected
                   {eligibleTargetIps.length > 0
                     ? ` of ${eligibleTargetIps.length}`
                     : ""}
                 </strong>
                 <span className={styles.summaryMeta}>
-                  {selectedPushIps.length > 0
+                  {selectedPushIps.size > 0
                     ? `${selectedDevices.length} encoder${selectedDevices.length === 1 ? "" : "s"} queued`
                     : "No targets selected"}
                 </span>
@@ -687,7 +864,7 @@ export default function HomePage() {
                 disabled={
                   profilePlanInProgress ||
                   !controlSource ||
-                  selectedPushIps.length === 0
+                  selectedPushIps.size === 0
                 }
               >
                 {profilePlanInProgress
@@ -703,13 +880,13 @@ export default function HomePage() {
                   verificationRequired ||
                   !writesEnabled ||
                   !controlSource ||
-                  selectedPushIps.length === 0
+                  selectedPushIps.size === 0
                 }
               >
                 {pushInProgress
                   ? "Writing…"
-                  : `Write to ${selectedPushIps.length || 0} target${
-                      selectedPushIps.length === 1 ? "" : "s"
+                  : `Write to ${selectedPushIps.size || 0} target${
+                      selectedPushIps.size === 1 ? "" : "s"
                     }`}
               </button>
               <button
@@ -719,11 +896,25 @@ export default function HomePage() {
                   pushInProgress ||
                   verificationInProgress ||
                   !controlSource ||
-                  selectedPushIps.length === 0
+                  selectedPushIps.size === 0
                 }
               >
                 {verificationInProgress ? "Verifying…" : "Verify read-back"}
               </button>
+              <button
+                onClick={pushAndVerify}
+                className={styles.secondaryButton}
+                disabled={
+                  pushInProgress ||
+                  verificationInProgress ||
+                  verificationRequired ||
+                  !writesEnabled ||
+                  !controlSource ||
+                  selectedPushIps.size === 0
+                }
+              >
+                Write and verify each target
+              </button>
               <button
                 onClick={() => void loadProfileRunReceipts()}
                 className={styles.secondaryButton}
@@ -731,19 +922,29 @@ export default function HomePage() {
               >
                 Inspect local run receipts
               </button>
+              <button
+                onClick={() => void loadProfileDrift()}
+                className={styles.secondaryButton}
+                disabled={!controlSource}
+              >
+                Compare drift (cached, read only)
+              </button>
             </div>
 
             {(profilePlanMessage ||
               pushMessage ||
               verificationMessage ||
-              receiptMessage) && (
+              receiptMessage ||
+              driftMessage) && (
               <div className={styles.resultMessages}>
                 {profilePlanMessage && <p>{profilePlanMessage}</p>}
                 {pushMessage && <p>{pushMessage}</p>}
                 {verificationMessage && <p>{verificationMessage}</p>}
                 {receiptMessage && <p>{receiptMessage}</p>}
+                {driftMessage && <p>{driftMessage}</p>}
               </div>
             )}
+            {driftMatrix && <DriftHeatmap matrix={driftMatrix} />}
             {profilePlan && (
               <div className={styles.resultsList}>
                 <div className={styles.resultRow}>
@@ -891,7 +1092,7 @@ export default function HomePage() {
                   className={styles.textButton}
                   onClick={handleClearAll}
                   disabled={
-                    verificationRequired || selectedPushIps.length === 0
+                    verificationRequired || selectedPushIps.size === 0
                   }
                 >
                   Clear all
@@ -0,0 +1,43 @@
+export type DriftCellState = "match" | "drift" | "missing" | "unreadable";
+
+export interface ProfileDriftDevice {
+  ip: string;
+  name: string;
+  fleet_id: string;
+  cells: string;
+}
+
+export interface ProfileDriftMatrix {
+  source: { ip: string; settings_sha256: string | null };
+  sections: string[];
+  legend: Record<string, DriftCellState>;
+  devices: ProfileDriftDevice[];
+  section_drift_counts: number[];
+  drifted_device_count: number;
+}
+
+export function driftCellStates(
+  matrix: ProfileDriftMatrix,
+  device: ProfileDriftDevice,
+): DriftCellState[] {
+  return Array.from(
+    device.cells,
+    (cell) => matrix.legend[cell] || "unreadable",
+  );
+}
+
+export function driftedSections(
+  matrix: ProfileDriftMatrix,
+  device: ProfileDriftDevice,
+): string[] {
+  return driftCellStates(matrix, device).flatMap((state, index) =>
+    state === "match" ? [] : [matrix.sections[index]],
+  );
+}
+
+export function driftSummary(matrix: ProfileDriftMatrix): string {
+  if (matrix.devices.length === 0) return "No targets in the cached inventory.";
+  if (matrix.drifted_device_count === 0)
+    return `All ${matrix.devices.length} cached target${matrix.devices.length === 1 ? "" : "s"} match the frozen source.`;
+  return `${matrix.drifted_device_count} of ${matrix.devices.length} cached target${matrix.devices.length === 1 ? "" : "s"} deviate from the frozen source.`;
+}
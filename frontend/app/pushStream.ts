@@ -0,0 +1,100 @@
+export interface PushResultEvent {
+  event: "result";
+  index: number;
+  ip: string;
+  magewell_id: string;
+  status: string;
+  reason_code?: string;
+  error?: string;
+  expected_settings_sha256: string;
+}
+
+export type PushStreamEvent =
+  | {
+      event: "started";
+      receipt_id: string;
+      target_count: number;
+      concurrency: number;
+    }
+  | PushResultEvent
+  | {
+      event: "finished";
+      receipt_id: string;
+      results: Omit<PushResultEvent, "event" | "index">[];
+    }
+  | { event: "failed"; detail: string };
+
+// Splits complete NDJSON lines off a buffer; the unterminated tail waits for more bytes.
+export function takeNdjsonLines(buffer: string): {
+  events: PushStreamEvent[];
+  rest: string;
+} {
+  const lines = buffer.split("\n");
+  const rest = lines.pop() ?? "";
+  return {
+    events: lines
+      .filter((line) => line.trim())
+      .map((line) => JSON.parse(line) as PushStreamEvent),
+    rest,
+  };
+}
+
+export async function readPushStream(
+  body: ReadableStream<Uint8Array>,
+  onEvent: (event: PushStreamEvent) => void,
+): Promise<void> {
+  const reader = body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  for (;;) {
+    const { done, value } = await reader.read();
+    buffer += decoder.decode(value, { stream: !done });
+    const { events, rest } = takeNdjsonLines(done ? `${buffer}\n` : buffer);
+    events.forEach(onEvent);
+    buffer = rest;
+    if (done) return;
+  }
+}
+
+export type PushVerifyJobEvent =
+  | (Omit<PushResultEvent, "event"> & { event: "pushed" })
+  | {
+      event: "verified";
+      index: number;
+      ip: string;
+      magewell_id: string;
+      matches_expected_profile: boolean;
+      expected_settings_sha256?: string;
+      actual_settings_sha256?: string;
+      verification_attempts?: number;
+      error?: string;
+    }
+  | { event: "finished" | "failed" };
+
+export interface PushVerifyJob {
+  job_id: string;
+  receipt_id: string;
+  status: "running" | "finished" | "failed";
+  target_count: number;
+  error: string | null;
+  events: PushVerifyJobEvent[];
+  next_event: number;
+}
+
+export function jobProgress(events: readonly PushVerifyJobEvent[]): {
+  pushed: number;
+  verified: number;
+  mismatched: number;
+} {
+  let pushed = 0;
+  let verified = 0;
+  let mismatched = 0;
+  for (const event of events) {
+    if (event.event === "pushed") pushed += 1;
+    if (event.event === "verified") {
+      if (event.matches_expected_profile) verified += 1;
+      else mismatched += 1;
+    }
+  }
+  return { pushed, verified, mismatched };
+}
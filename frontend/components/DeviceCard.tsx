@@ -6,6 +6,12 @@ import styles from "@/styles/DeviceCard.module.css";
 export interface Device {
   ip: string;
   name: string;
+  fleet_id?: string;
+  serial?: string;
+  eth_mac?: string;
+  read_error?: string;
+  identity_error?: string;
+  name_journal_mismatch?: boolean;
 }
 
 interface DeviceCardProps {
@@ -43,7 +49,10 @@ const DeviceCard: React.FC<DeviceCardProps> = ({
             </span>
           )}
         </div>
-        <p className={styles.cardIp}>{device.ip}</p>
+        <p className={styles.cardIp}>
+          {device.ip}
+          {device.fleet_id ? ` · ${device.fleet_id}` : ""}
+        </p>
       </div>
       <div className={styles.cardFooter}>
         <label className={styles.checkboxContainer}>
@@ -74,4 +83,5 @@ const DeviceCard: React.FC<DeviceCardProps> = ({
   );
 };
 
-export default DeviceCard;
+// Cards re-render only when their own props change; the grid keeps callbacks stable.
+export default React.memo(DeviceCard);
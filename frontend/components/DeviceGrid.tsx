@@ -1,15 +1,37 @@
 "use client";
 
-import React from "react";
+import React, {
+  useCallback,
+  useEffect,
+  useLayoutEffect,
+  useMemo,
+  useRef,
+  useState,
+} from "react";
 import { Device } from "./DeviceCard";
 import DeviceCard from "./DeviceCard";
+import {
+  defaultInventoryView,
+  filterAndSortDevices,
+  visibleRowWindow,
+  type InventoryFilter,
+  type InventorySort,
+  type InventoryView,
+} from "@/app/deviceInventory";
 import styles from "@/styles/DeviceGrid.module.css";
 
+// Cards have a fixed height so rows can be positioned without measuring them.
+const CARD_HEIGHT = 118;
+const GRID_GAP = 8;
+const ROW_HEIGHT = CARD_HEIGHT + GRID_GAP;
+const MIN_CARD_WIDTH = 230;
+const MAX_COLUMNS = 5;
+
 interface DeviceGridProps {
   devices: Device[];
-  selectedDeviceIps: string[];
+  selectedDeviceIps: ReadonlySet<string>;
   controlSourceIp?: string;
-  incompatibleTargetReasons: Map<string, string>;
+  incompatibleTargetReasons: ReadonlyMap<string, string>;
   onSelectToggle: (device: Device) => void;
   onSetControl: (device: Device) => void;
 }
@@ -22,19 +44,140 @@ const DeviceGrid: React.FC<DeviceGridProps> = ({
   onSelectToggle,
   onSetControl,
 }) => {
+  const [view, setView] = useState<InventoryView>(defaultInventoryView);
+  const [viewport, setViewport] = useState({ width: 0, height: 0 });
+  const [scrollTop, setScrollTop] = useState(0);
+  const scrollerRef = useRef<HTMLDivElement>(null);
+
+  // Memoized cards need stable callbacks; the latest handlers are read at call time.
+  const handlers = useRef({ onSelectToggle, onSetControl });
+  useLayoutEffect(() => {
+    handlers.current = { onSelectToggle, onSetControl };
+  });
+  const handleSelectToggle = useCallback(
+    (device: Device) => handlers.current.onSelectToggle(device),
+    [],
+  );
+  const handleSetControl = useCallback(
+    (device: Device) => handlers.current.onSetControl(device),
+    [],
+  );
+
+  useEffect(() => {
+    const scroller = scrollerRef.current;
+    if (!scroller) return;
+    const observer = new ResizeObserver(([entry]) =>
+      setViewport({
+        width: entry.contentRect.width,
+        height: entry.contentRect.height,
+      }),
+    );
+    observer.observe(scroller);
+    return () => observer.disconnect();
+  }, []);
+
+  const visibleDevices = useMemo(
+    () =>
+      filterAndSortDevices(
+        devices,
+        view,
+        incompatibleTargetReasons,
+        controlSourceIp,
+      ),
+    [devices, view, incompatibleTargetReasons, controlSourceIp],
+  );
+  const columns = Math.min(
+    MAX_COLUMNS,
+    Math.max(
+      1,
+      Math.floor((viewport.width + GRID_GAP) / (MIN_CARD_WIDTH + GRID_GAP)),
+    ),
+  );
+  const rowCount = Math.ceil(visibleDevices.length / columns);
+  const { startRow, endRow } = visibleRowWindow(
+    scrollTop,
+    viewport.height || ROW_HEIGHT * 6,
+    ROW_HEIGHT,
+    rowCount,
+  );
+  const windowDevices = visibleDevices.slice(
+    startRow * columns,
+    endRow * columns,
+  );
+
   return (
-    <div className={styles.grid}>
-      {devices.map((device) => (
-        <DeviceCard
-          key={device.ip}
-          device={device}
-          isSelected={selectedDeviceIps.includes(device.ip)}
-          isControlSource={device.ip === controlSourceIp}
-          targetBlockedReason={incompatibleTargetReasons.get(device.ip)}
-          onSelectToggle={onSelectToggle}
-          onSetControl={onSetControl}
+    <div className={styles.container}>
+      <div className={styles.toolbar}>
+        <input
+          type="search"
+          value={view.query}
+          onChange={(event) => setView({ ...view, query: event.target.value })}
+          className={styles.search}
+          placeholder="Filter by name, fleet ID, or IP"
+          aria-label="Filter encoders"
         />
-      ))}
+        <select
+          value={view.filter}
+          onChange={(event) =>
+            setView({ ...view, filter: event.target.value as InventoryFilter })
+          }
+          className={styles.select}
+          aria-label="Show encoders"
+        >
+          <option value="all">All</option>
+          <option value="compatible">Compatible targets</option>
+          <option value="blocked">Blocked or source</option>
+          <option value="errors">Read or identity errors</option>
+        </select>
+        <select
+          value={view.sort}
+          onChange={(event) =>
+            setView({ ...view, sort: event.target.value as InventorySort })
+          }
+          className={styles.select}
+          aria-label="Sort encoders"
+        >
+          <option value="fleet_id">Fleet ID</option>
+          <option value="name">Name</option>
+          <option value="ip">IP address</option>
+          <option value="error">Errors first</option>
+          <option value="compatibility">Compatible first</option>
+        </select>
+        <span className={styles.count}>
+          {visibleDevices.length} of {devices.length}
+        </span>
+      </div>
+      <div
+        ref={scrollerRef}
+        className={styles.scroller}
+        onScroll={(event) => setScrollTop(event.currentTarget.scrollTop)}
+      >
+        <div
+          className={styles.spacer}
+          style={{ height: Math.max(0, rowCount * ROW_HEIGHT - GRID_GAP) }}
+        >
+          <div
+            className={styles.grid}
+            style={{
+              gridTemplateColumns: `repeat(${columns}, minmax(0, 1fr))`,
+              gridAutoRows: CARD_HEIGHT,
+              transform: `translateY(${startRow * ROW_HEIGHT}px)`,
+            }}
+          >
+            {windowDevices.map((device) => (
+              <DeviceCard
+                key={device.ip}
+                device={device}
+                isSelected={selectedDeviceIps.has(device.ip)}
+                isControlSource={device.ip === controlSourceIp}
+                targetBlockedReason={incompatibleTargetReasons.get(device.ip)}
+                onSelectToggle={handleSelectToggle}
+                onSetControl={handleSetControl}
+              />
+            ))}
+          </div>
+        </div>
+      </div>
     </div>
   );
 };
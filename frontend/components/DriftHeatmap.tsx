@@ -0,0 +1,60 @@
+"use client";
+
+import React from "react";
+import { driftCellStates, type ProfileDriftMatrix } from "@/app/profileDrift";
+import styles from "@/styles/DriftHeatmap.module.css";
+
+interface DriftHeatmapProps {
+  matrix: ProfileDriftMatrix;
+}
+
+const DriftHeatmap: React.FC<DriftHeatmapProps> = ({ matrix }) => {
+  return (
+    <div className={styles.scroller}>
+      <table className={styles.heatmap}>
+        <thead>
+          <tr>
+            <th className={styles.deviceHeader}>Target</th>
+            {matrix.sections.map((section, index) => (
+              <th
+                key={section}
+                className={styles.sectionHeader}
+                title={`${section}: ${matrix.section_drift_counts[index]} drifted`}
+              >
+                <span>{section}</span>
+              </th>
+            ))}
+          </tr>
+        </thead>
+        <tbody>
+          {matrix.devices.map((device) => (
+            <tr key={device.ip}>
+              <th className={styles.deviceCell} scope="row">
+                <strong>{device.name || "Unnamed Device"}</strong>
+                <small>{device.fleet_id || device.ip}</small>
+              </th>
+              {driftCellStates(matrix, device).map((state, index) => (
+                <td
+                  key={matrix.sections[index]}
+                  className={`${styles.cell} ${styles[state]}`}
+                  title={`${device.name || device.ip} · ${matrix.sections[index]}: ${state}`}
+                />
+              ))}
+            </tr>
+          ))}
+        </tbody>
+      </table>
+      {matrix.devices.length > 0 && (
+        <p className={styles.legend}>
+          <span className={`${styles.swatch} ${styles.match}`} /> match
+          <span className={`${styles.swatch} ${styles.drift}`} /> drift
+          <span className={`${styles.swatch} ${styles.missing}`} /> missing
+          <span className={`${styles.swatch} ${styles.unreadable}`} />{" "}
+          unreadable
+        </p>
+      )}
+    </div>
+  );
+};
+
+export default DriftHeatmap;
@@ -0,0 +1,136 @@
+import assert from "node:assert/strict";
+import test from "node:test";
+
+import {
+  defaultInventoryView,
+  filterAndSortDevices,
+  journalCoverage,
+  partialScanNotice,
+  toggleSelection,
+  visibleRowWindow,
+} from "../app/deviceInventory.ts";
+
+const devices = [
+  { ip: "192.0.2.20", name: "Lobby", fleet_id: "AIO-10" },
+  { ip: "192.0.2.3", name: "Studio", fleet_id: "AIO-2" },
+  { ip: "192.0.2.100", name: "Spare", read_error: "Device request failed" },
+  { ip: "192.0.2.4", name: "Chapel", fleet_id: "AIO-3" },
+];
+const blocked = new Map([["192.0.2.4", "schema mismatch"]]);
+
+test("inventory sorts fleet IDs numerically and leaves unjournaled devices last", () => {
+  assert.deepEqual(
+    filterAndSortDevices(devices, defaultInventoryView, blocked).map(
+      (device) => device.ip,
+    ),
+    ["192.0.2.3", "192.0.2.4", "192.0.2.20", "192.0.2.100"],
+  );
+  assert.deepEqual(
+    filterAndSortDevices(
+      devices,
+      { ...defaultInventoryView, sort: "ip" },
+      blocked,
+    ).map((device) => device.ip),
+    ["192.0.2.3", "192.0.2.4", "192.0.2.20", "192.0.2.100"],
+  );
+});
+
+test("inventory filters by text, errors, and compatibility", () => {
+  const view = (overrides: object) => ({
+    ...defaultInventoryView,
+    ...overrides,
+  });
+  assert.deepEqual(
+    filterAndSortDevices(devices, view({ query: "aio-1" }), blocked).map(
+      (device) => device.name,
+    ),
+    ["Lobby"],
+  );
+  assert.deepEqual(
+    filterAndSortDevices(devices, view({ filter: "errors" }), blocked).map(
+      (device) => device.name,
+    ),
+    ["Spare"],
+  );
+  assert.deepEqual(
+    filterAndSortDevices(
+      devices,
+      view({ filter: "compatible" }),
+      blocked,
+      "192.0.2.20",
+    ).map((device) => device.name),
+    ["Studio"],
+  );
+});
+
+test("selection toggles without mutating the previous set", () => {
+  const selected = new Set(["192.0.2.3"]);
+  assert.deepEqual([...toggleSelection(selected, "192.0.2.4")], [
+    "192.0.2.3",
+    "192.0.2.4",
+  ]);
+  assert.deepEqual([...toggleSelection(selected, "192.0.2.3")], []);
+  assert.deepEqual([...selected], ["192.0.2.3"]);
+});
+
+test("row window covers the viewport plus overscan and clamps to the grid", () => {
+  assert.deepEqual(visibleRowWindow(0, 500, 126, 200), {
+    startRow: 0,
+    endRow: 6,
+  });
+  assert.deepEqual(visibleRowWindow(126 * 100, 500, 126, 200), {
+    startRow: 98,
+    endRow: 106,
+  });
+  assert.deepEqual(visibleRowWindow(126 * 199, 500, 126, 200), {
+    startRow: 197,
+    endRow: 200,
+  });
+});
+
+test("only a partial scan produces a write-blocking notice", () => {
+  const complete = {
+    scan_id: "a".repeat(32),
+    status: "complete" as const,
+    partial_reason: null,
+    host_count: 254,
+    probed_count: 254,
+    write_eligible: true,
+  };
+  assert.equal(partialScanNotice(complete), "");
+  assert.equal(partialScanNotice(null), "");
+  assert.match(
+    partialScanNotice({
+      ...complete,
+      status: "partial",
+      partial_reason: "deadline",
+      probed_count: 120,
+      write_eligible: false,
+    }),
+    /deadline expired after 120 of 254 addresses.*read only/,
+  );
+});
+
+test("journal coverage reports when every journaled unit was found", () => {
+  const scan = {
+    scan_id: "b".repeat(32),
+    status: "complete" as const,
+    partial_reason: null,
+    host_count: 254,
+    probed_count: 254,
+    write_eligible: true,
+    journaled_count: 31,
+    journaled_found_count: 29,
+    journal_accounted_after_seconds: null,
+  };
+  assert.equal(journalCoverage(scan), "29 of 31 journaled devices found.");
+  assert.equal(
+    journalCoverage({
+      ...scan,
+      journaled_found_count: 31,
+      journal_accounted_after_seconds: 0.42,
+    }),
+    "All 31 journaled devices accounted for after 0.4 s.",
+  );
+  assert.equal(journalCoverage(null), "");
+});
@@ -0,0 +1,45 @@
+import assert from "node:assert/strict";
+import test from "node:test";
+
+import {
+  driftCellStates,
+  driftSummary,
+  driftedSections,
+  type ProfileDriftMatrix,
+} from "../app/profileDrift.ts";
+
+const matrix: ProfileDriftMatrix = {
+  source: { ip: "192.0.2.20", settings_sha256: "a".repeat(64) },
+  sections: ["audio", "living", "video"],
+  legend: { "=": "match", "~": "drift", "-": "missing", "?": "unreadable" },
+  devices: [
+    { ip: "192.0.2.10", name: "TARGET-01", fleet_id: "ENC-01", cells: "===" },
+    { ip: "192.0.2.11", name: "TARGET-02", fleet_id: "", cells: "~=-" },
+  ],
+  section_drift_counts: [1, 0, 1],
+  drifted_device_count: 1,
+};
+
+test("drift matrix cells decode to per-section states in section order", () => {
+  assert.deepEqual(driftCellStates(matrix, matrix.devices[1]), [
+    "drift",
+    "match",
+    "missing",
+  ]);
+  assert.deepEqual(driftedSections(matrix, matrix.devices[0]), []);
+  assert.deepEqual(driftedSections(matrix, matrix.devices[1]), [
+    "audio",
+    "video",
+  ]);
+});
+
+test("drift summary counts deviating cached targets", () => {
+  assert.equal(
+    driftSummary(matrix),
+    "1 of 2 cached targets deviate from the frozen source.",
+  );
+  assert.equal(
+    driftSummary({ ...matrix, drifted_device_count: 0 }),
+    "All 2 cached targets match the frozen source.",
+  );
+});
@@ -0,0 +1,66 @@
+import assert from "node:assert/strict";
+import test from "node:test";
+
+import {
+  jobProgress,
+  readPushStream,
+  takeNdjsonLines,
+  type PushStreamEvent,
+} from "../app/pushStream.ts";
+
+test("takeNdjsonLines keeps a partial trailing line for the next chunk", () => {
+  const { events, rest } = takeNdjsonLines(
+    '{"event":"started","receipt_id":"r","target_count":2,"concurrency":1}\n{"event":"res',
+  );
+  assert.deepEqual(
+    events.map((event) => event.event),
+    ["started"],
+  );
+  assert.equal(rest, '{"event":"res');
+});
+
+test("readPushStream reassembles events split across chunks", async () => {
+  const encoder = new TextEncoder();
+  const chunks = [
+    '{"event":"started","receipt_id":"r","target_count":1,"concurrency":1}\n{"event":"result",',
+    '"index":0,"ip":"192.0.2.11","magewell_id":"A","status":"updated","expected_settings_sha256":"x"}\n',
+    '{"event":"finished","receipt_id":"r","results":[]}',
+  ];
+  const body = new ReadableStream<Uint8Array>({
+    start(controller) {
+      chunks.forEach((chunk) => controller.enqueue(encoder.encode(chunk)));
+      controller.close();
+    },
+  });
+  const seen: PushStreamEvent[] = [];
+  await readPushStream(body, (event) => seen.push(event));
+  assert.deepEqual(
+    seen.map((event) => event.event),
+    ["started", "result", "finished"],
+  );
+});
+
+test("jobProgress counts pushes, verified targets, and mismatches", () => {
+  const target = { ip: "192.0.2.11", magewell_id: "A" };
+  assert.deepEqual(
+    jobProgress([
+      {
+        event: "pushed",
+        index: 0,
+        ...target,
+        status: "updated",
+        expected_settings_sha256: "x",
+      },
+      {
+        event: "pushed",
+        index: 1,
+        ...target,
+        status: "failed",
+        expected_settings_sha256: "y",
+      },
+      { event: "verified", index: 0, ...target, matches_expected_profile: false },
+      { event: "finished" },
+    ]),
+    { pushed: 2, verified: 0, mismatched: 1 },
+  );
+});